@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for jira_dashboard.py.
+
+Usage:
+    python3 bench_jira_dashboard.py
+"""
+
+import csv
+import dataclasses
+import os
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from unittest import mock
+
+# Ensure the module is importable
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from jira_dashboard import (
+    _DATE_FORMATS,
+    DashboardData,
+    IngestSession,
+    JiraTicket,
+    MetricsAccumulator,
+    SourceConfig,
+    TicketFrame,
+    _Dictionary,
+    _MappedRawFields,
+    _MetricsState,
+    _cluster_descriptions,
+    _comment_preview,
+    _is_blocked,
+    _is_open,
+    _jira_config,
+    _numpy_update,
+    _parse_csv,
+    _split_csv_parts,
+    _ticket_table,
+    compute_dashboard_data,
+    parse_date,
+)
+
+_HERE = Path(__file__).resolve().parent
+JIRA_CSV = _HERE / "Jira.csv"
+
+
+def _jira_date_values() -> List[str]:
+    """Return every non-empty Created/Updated/Resolved value in Jira.csv."""
+    with JIRA_CSV.open(newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        headers = next(reader)
+        cols = [headers.index(h) for h in ("Created", "Updated", "Resolved")]
+        return [row[i] for row in reader for i in cols if i < len(row) and row[i]]
+
+
+def _parse_date_strptime(value: str) -> Optional[datetime]:
+    """The format-list-only parser ``parse_date`` used before the fast paths."""
+    value = value.strip()
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).replace(tzinfo=None)
+        except ValueError:
+            continue
+    return None
+
+
+def bench_date_parsing(number: int = 20) -> None:
+    values = _jira_date_values()
+    iso = [datetime(2024, 1, 1 + i % 28, i % 24, i % 60, i % 60).isoformat() for i in range(len(values))]
+    for label, sample in (("Jira.csv dates", values), ("ISO timestamps", iso)):
+        slow = timeit.timeit(lambda: [_parse_date_strptime(v) for v in sample], number=number)
+        fast = timeit.timeit(lambda: [parse_date(v) for v in sample], number=number)
+        per = 1e6 / (len(sample) * number)
+        print(f"{label:<16} ({len(sample)} values): strptime {slow * per:6.2f} us/value, "
+              f"parse_date {fast * per:6.2f} us/value, speedup x{slow / fast:.1f}")
+
+
+def _allocated_per_item(build, n: int) -> float:
+    """Bytes allocated per item by ``build(i)``, kept alive until measured."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [build(i) for i in range(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / n
+
+
+def bench_ticket_memory(n: int = 20000) -> None:
+    tickets = _parse_csv(str(JIRA_CSV), _jira_config())
+    names = [f.name for f in dataclasses.fields(JiraTicket) if f.name != "raw_fields"]
+    # Same fields as JiraTicket, but with a per-instance __dict__
+    plain_cls = dataclasses.make_dataclass(
+        "PlainTicket", [(f.name, f.type, dataclasses.field(default=None)) for f in dataclasses.fields(JiraTicket)])
+
+    def shell(cls):
+        # Field values are shared with the parsed tickets, so only the
+        # object itself is measured.
+        def build(i: int):
+            t = tickets[i % len(tickets)]
+            return cls(**{name: getattr(t, name) for name in names}, raw_fields=t.raw_fields)
+        return build
+
+    slotted = _allocated_per_item(shell(JiraTicket), n)
+    plain = _allocated_per_item(shell(plain_cls), n)
+    print(f"Ticket object ({len(names) + 1} fields): slotted {slotted:,.0f} B/ticket, "
+          f"with __dict__ {plain:,.0f} B/ticket")
+
+    # Measured object by object: going through the mapping API would
+    # decode the large cells and measure a materialised row instead.
+    def view_size(raw) -> int:
+        size = sys.getsizeof(raw) + sys.getsizeof(raw._row) + sum(map(sys.getsizeof, filter(None, raw._row)))
+        if isinstance(raw, _MappedRawFields):
+            size += sys.getsizeof(raw._start) + sys.getsizeof(raw._end)
+        return size
+
+    def baseline_size(raw) -> int:
+        # The baseline parser kept a {header: cell} dict of every cell
+        row = dict(zip(raw._index.headers, raw.cells()))
+        return sys.getsizeof(row) + sum(map(sys.getsizeof, filter(None, row.values())))
+
+    raws = [t.raw_fields for t in tickets]
+    left = sum(cell is None for raw in raws for cell in raw._row)
+    view = sum(map(view_size, raws)) / len(raws)
+    baseline = sum(map(baseline_size, raws)) / len(raws)
+    print(f"raw_fields (Jira.csv, {len(raws[0])} columns, {left / len(raws):.1f} large cells/ticket left in "
+          f"the file): view {view:,.0f} B/ticket, baseline dict {baseline:,.0f} B/ticket")
+
+
+def _replicated_csv(copies: int) -> str:
+    """Write Jira.csv's rows *copies* times to a temporary file."""
+    with JIRA_CSV.open(newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.reader(f))
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(rows[0])
+        for _ in range(copies):
+            writer.writerows(rows[1:])
+    return path
+
+
+def _retained(build) -> float:
+    """Bytes still allocated by ``build()`` while its result is alive."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def bench_frame_metrics(copies: int = 50, number: int = 5) -> None:
+    config = _jira_config()
+    path = _replicated_csv(copies)
+    try:
+        def as_list(raw_rows: bool = True):
+            with IngestSession(path, config) as session:
+                tickets = list(session.tickets())
+            if not raw_rows:
+                for t in tickets:
+                    t.raw_fields = {}
+            return tickets
+
+        def as_frame(raw_rows: bool = True):
+            with IngestSession(path, config) as session:
+                frame = session.frame()
+            if not raw_rows:
+                frame.raw_fields = []
+            return frame
+
+        tickets, frame = as_list(), as_frame()
+        n = len(tickets)
+        # The raw rows dominate both, and are the same rows either way
+        print(f"Parsed storage ({n} tickets, raw rows included): ticket list "
+              f"{_retained(as_list) / n:,.0f} B/ticket, TicketFrame {_retained(as_frame) / n:,.0f} B/ticket")
+        print(f"  without raw rows: ticket list {_retained(lambda: as_list(False)) / n:,.0f} B/ticket, "
+              f"TicketFrame {_retained(lambda: as_frame(False)) / n:,.0f} B/ticket")
+
+        # The full table reads large cells back from the export
+        now = datetime(2026, 1, 1)
+        objects = timeit.timeit(lambda: compute_dashboard_data(tickets, now=now, config=config), number=number)
+        columns = timeit.timeit(lambda: compute_dashboard_data(frame, now=now), number=number)
+        print(f"compute_dashboard_data ({n} tickets): ticket list {objects / number * 1e3:6.1f} ms, "
+              f"TicketFrame {columns / number * 1e3:6.1f} ms")
+    finally:
+        os.unlink(path)
+    # The same without the embedded full-table JSON and the summary
+    # clustering, which both engines share
+    for t in tickets:
+        t.raw_fields = {}
+    frame.raw_fields = [{}] * n
+    with mock.patch("jira_dashboard._cluster_summaries", return_value=[]):
+        objects = min(timeit.repeat(lambda: compute_dashboard_data(tickets, now=now, config=config),
+                                    number=number, repeat=5))
+        columns = min(timeit.repeat(lambda: compute_dashboard_data(frame, now=now), number=number, repeat=5))
+    print(f"  metrics only: ticket list {objects / number * 1e3:6.1f} ms, "
+          f"TicketFrame {columns / number * 1e3:6.1f} ms")
+
+
+def _three_walk_metrics(tickets: List[JiraTicket], stale_days: int, now: datetime,
+                        config: SourceConfig) -> DashboardData:
+    """``compute_dashboard_data`` as it was before the single pass.
+
+    The tickets are walked three times (main loop, top 10 oldest open,
+    assignee/reporter breakdown), each walk classifying the status and
+    working out the age again.
+    """
+    m = _MetricsState()
+    d = m.d
+    d.source_type = config.name
+    d.total_tickets = len(tickets)
+
+    for t in tickets:
+        is_open = _is_open(t.status, config)
+        if is_open:
+            d.open_tickets += 1
+        else:
+            d.closed_tickets += 1
+        if is_open and _is_blocked(t.status, config):
+            d.blocked_tickets += 1
+        if is_open and t.assignee in (config.default_unassigned, ""):
+            d.unassigned_tickets += 1
+        if t.story_points is not None:
+            d.total_story_points += t.story_points
+            if is_open:
+                d.open_story_points += t.story_points
+        status_display = t.status or "Unknown"
+        d.status_counts[status_display] = d.status_counts.get(status_display, 0) + 1
+        if is_open:
+            d.assignee_counts[t.assignee] = d.assignee_counts.get(t.assignee, 0) + 1
+        if t.priority:
+            d.priority_counts[t.priority] = d.priority_counts.get(t.priority, 0) + 1
+        if t.issue_type:
+            d.type_counts[t.issue_type] = d.type_counts.get(t.issue_type, 0) + 1
+        for comp in _split_csv_parts(t.components):
+            m.component_counter[comp] += 1
+        for lbl in _split_csv_parts(t.labels):
+            m.label_counter[lbl] += 1
+        if t.created:
+            month_key = t.created.strftime("%Y-%m")
+            d.created_by_month[month_key] = d.created_by_month.get(month_key, 0) + 1
+        if t.resolved:
+            month_key = t.resolved.strftime("%Y-%m")
+            d.resolved_by_month[month_key] = d.resolved_by_month.get(month_key, 0) + 1
+        if is_open and t.created:
+            m.add_age((now - t.created).total_seconds() / 86400)
+        if is_open and t.due_date and t.due_date < now:
+            d.overdue_tickets += 1
+        last_activity = t.last_comment_date or t.updated
+        days_since = None
+        if last_activity:
+            days_since = (now - last_activity).total_seconds() / 86400
+        if is_open:
+            if days_since is not None and days_since > stale_days:
+                d.stale_tickets += 1
+            elif days_since is None and t.created:
+                created_days = (now - t.created).total_seconds() / 86400
+                if created_days > stale_days:
+                    d.stale_tickets += 1
+        if is_open:
+            d.staleness_rows.append({
+                "key": t.key,
+                "summary": t.summary[:80],
+                "reporter": t.reporter or "Unknown",
+                "assignee": t.assignee,
+                "status": t.status,
+                "last_comment_date": last_activity.strftime("%Y-%m-%d") if last_activity else "—",
+                "days_since": round(days_since, 1) if days_since is not None else 999,
+                "comment_preview": _comment_preview(t.last_comment_text),
+            })
+        if not is_open and t.created and t.resolved:
+            m.add_resolution(t.issue_type, t.priority, (t.resolved - t.created).total_seconds() / 86400)
+        for name, stats in ((t.epic_link, m.epic_stats), (t.sprint, m.sprint_stats)):
+            if name:
+                s = stats[name]
+                s["total"] += 1
+                s["open" if is_open else "closed"] += 1
+                if t.story_points:
+                    s["story_points"] += t.story_points
+        if t.original_estimate_secs is not None and t.time_spent_secs is not None:
+            est = m.estimate_by_type[t.issue_type or "Unknown"]
+            est["estimated"] += t.original_estimate_secs
+            est["actual"] += t.time_spent_secs
+            est["count"] += 1
+        m.ra_flow[(t.reporter or "Unknown", t.assignee)] += 1
+        # ServiceNow-only figures are left out: the benchmark export is Jira's
+
+    # Top 10 oldest open
+    for t in tickets:
+        if _is_open(t.status, config) and t.created:
+            age = (now - t.created).total_seconds() / 86400
+            m.open_with_age.append({
+                "key": t.key,
+                "summary": t.summary[:60],
+                "assignee": t.assignee,
+                "status": t.status,
+                "age_days": round(age, 1),
+                "created": t.created.strftime("%Y-%m-%d"),
+            })
+
+    # Assignee / reporter breakdown
+    for t in tickets:
+        is_open_t = _is_open(t.status, config)
+        a = m.assignee_stats[t.assignee]
+        a["total"] += 1
+        if t.story_points:
+            a["story_points"] += t.story_points
+        if is_open_t:
+            a["open"] += 1
+            if t.created:
+                age = (now - t.created).total_seconds() / 86400
+                a["open_age_sum"] += age
+                a["open_count_for_age"] += 1
+            if t.due_date and t.due_date < now:
+                a["overdue"] += 1
+            last_act = t.last_comment_date or t.updated
+            if last_act:
+                if (now - last_act).total_seconds() / 86400 > stale_days:
+                    a["stale"] += 1
+            elif t.created:
+                if (now - t.created).total_seconds() / 86400 > stale_days:
+                    a["stale"] += 1
+        else:
+            a["closed"] += 1
+        r = m.reporter_stats[t.reporter or "Unknown"]
+        r["total"] += 1
+        if is_open_t:
+            r["open"] += 1
+            if t.due_date and t.due_date < now:
+                r["overdue"] += 1
+        else:
+            r["closed"] += 1
+
+    m.finish(config)
+    d.issue_themes = _cluster_descriptions(tickets)
+    d.all_headers, d.all_tickets_json = _ticket_table(t.raw_fields for t in tickets)
+    return d
+
+
+def bench_metrics_pass(copies: int = 50, number: int = 5) -> None:
+    """Per-ticket cost of the ticket-list metrics pass: three walks vs one.
+
+    The full-table JSON and the summary clustering are left out: neither
+    depends on how the tickets are walked.
+    """
+    config = _jira_config()
+    path = _replicated_csv(copies)
+    try:
+        with IngestSession(path, config) as session:
+            tickets = list(session.tickets())
+    finally:
+        os.unlink(path)
+    for t in tickets:
+        t.raw_fields = {}
+    now = datetime(2026, 1, 1)
+    with mock.patch("jira_dashboard._cluster_summaries", return_value=[]):
+        before = _three_walk_metrics(tickets, 14, now, config)
+        after = compute_dashboard_data(tickets, now=now, config=config)
+        # Like for like: both fill every figure the same way
+        assert dataclasses.asdict(before) == dataclasses.asdict(after)
+        times = [min(timeit.repeat(run, number=number, repeat=5)) / number / len(tickets) * 1e6
+                 for run in (lambda: _three_walk_metrics(tickets, 14, now, config),
+                             lambda: compute_dashboard_data(tickets, now=now, config=config))]
+    print(f"metrics pass ({len(tickets)} tickets, metrics only): three walks {times[0]:5.2f} us/ticket, "
+          f"single pass {times[1]:5.2f} us/ticket, speedup x{times[0] / times[1]:.1f}")
+
+
+def bench_numpy_engine(size: int = 1_000_000, number: int = 3) -> None:
+    """Stdlib frame engine vs ``engine="numpy"`` on a frame of *size* tickets."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("numpy engine: skipped (NumPy is not installed)")
+        return
+    with IngestSession(JIRA_CSV, _jira_config()) as session:
+        base = session.frame()
+    frame = TicketFrame(base.config, {name: _Dictionary(cat.values) for name, cat in base.categories.items()})
+    while len(frame) < size:
+        count = min(len(base), size - len(frame))
+        frame.append_range(base, 0, count, [{}] * count)
+    now = datetime(2026, 1, 1)
+    timings = {}
+    # Summary clustering is shared by both engines and left out
+    with mock.patch("jira_dashboard._cluster_summaries", return_value=[]):
+        for engine in ("python", "numpy"):
+            timings[engine] = min(timeit.repeat(lambda: compute_dashboard_data(frame, now=now, engine=engine),
+                                                number=1, repeat=number))
+    print(f"compute_dashboard_data ({size:,} tickets, TicketFrame): python {timings['python']:.2f} s, "
+          f"numpy {timings['numpy']:.2f} s, speedup x{timings['python'] / timings['numpy']:.1f}")
+
+    # Both stages still build one staleness row per open ticket
+    def fold(engine: str) -> MetricsAccumulator:
+        metrics = MetricsAccumulator(frame.config)
+        if engine == "numpy":
+            _numpy_update(metrics, frame)
+        else:
+            metrics.update_frame(frame)
+        return metrics
+
+    stages = {}
+    for engine in ("python", "numpy"):
+        metrics = fold(engine)
+        stages[engine] = (min(timeit.repeat(lambda: fold(engine), number=1, repeat=number)),
+                          min(timeit.repeat(lambda: metrics.finalize(now), number=1, repeat=number)))
+    print("  fold / finalize: " + ", ".join(f"{engine} {fold_s:.2f} s / {finalize_s:.2f} s"
+                                            for engine, (fold_s, finalize_s) in stages.items()))
+
+
+if __name__ == "__main__":
+    bench_date_parsing()
+    bench_ticket_memory()
+    bench_frame_metrics()
+    bench_metrics_pass()
+    bench_numpy_engine()
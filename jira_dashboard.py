@@ -14,17 +14,39 @@ Usage:
 """
 
 import argparse
+import bz2
+import codecs
+import concurrent.futures
 import csv
+import functools
+import glob
+import gzip
+import hashlib
+import heapq
 import html
 import io
+import itertools
 import json
+import lzma
+import mmap
+import operator
+import os
 import re
+import struct
 import sys
-from collections import Counter, defaultdict
-from dataclasses import dataclass, field
+import zipfile
+from array import array
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import asdict, dataclass, field
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # optional: only needed for engine="numpy"
+    np = None
 
 
 # ---------------------------------------------------------------------------
@@ -247,30 +269,41 @@ def _servicenow_config() -> SourceConfig:
 # Auto-detection
 # ---------------------------------------------------------------------------
 
+_JIRA_INDICATORS = frozenset({
+    "issue key", "issue_key", "sprint", "epic link", "epic_link",
+    "story points", "story_points", "issue type", "issuetype",
+    "fix version/s",
+})
+_SN_INDICATORS = frozenset({
+    "number", "opened at", "opened_at", "assignment group",
+    "assignment_group", "made sla", "made_sla", "short description",
+    "short_description", "configuration item", "configuration_item",
+    "cmdb_ci", "contact type", "contact_type", "opened by",
+    "opened_by", "caller_id", "resolved at", "resolved_at",
+    "reassignment count", "reassignment_count", "incident_state",
+    "sys_class_name", "sys_created_on", "sys_updated_on",
+    "service_offering", "business_service",
+})
+
+
+def _detection_hits(headers: List[str]) -> Tuple[List[str], int, List[str]]:
+    """Return ``(jira_hits, custom_field_count, servicenow_hits)`` for *headers*."""
+    lower = {h.strip().lower() for h in headers}
+    jira_hits = sorted(ind for ind in _JIRA_INDICATORS if ind in lower)
+    # Also check for Custom field(...) wrapper — very Jira-specific
+    custom_fields = sum(1 for h in lower if h.startswith("custom field"))
+    sn_hits = sorted(ind for ind in _SN_INDICATORS if ind in lower)
+    return jira_hits, custom_fields, sn_hits
+
+
 def _detect_source(headers: List[str]) -> str:
     """Score headers to determine whether CSV is Jira or ServiceNow.
 
     Returns ``"jira"`` or ``"servicenow"``.
     """
-    lower = {h.strip().lower() for h in headers}
-
-    jira_indicators = {"issue key", "issue_key", "sprint", "epic link", "epic_link",
-                       "story points", "story_points", "issue type", "issuetype",
-                       "fix version/s"}
-    sn_indicators = {"number", "opened at", "opened_at", "assignment group",
-                     "assignment_group", "made sla", "made_sla", "short description",
-                     "short_description", "configuration item", "configuration_item",
-                     "cmdb_ci", "contact type", "contact_type", "opened by",
-                     "opened_by", "caller_id", "resolved at", "resolved_at",
-                     "reassignment count", "reassignment_count", "incident_state",
-                     "sys_class_name", "sys_created_on", "sys_updated_on",
-                     "service_offering", "business_service"}
-
-    # Also check for Custom field(...) wrapper — very Jira-specific
-    jira_score = sum(1 for ind in jira_indicators if ind in lower)
-    jira_score += sum(1 for h in lower if h.startswith("custom field"))
-    sn_score = sum(1 for ind in sn_indicators if ind in lower)
-
+    jira_hits, custom_fields, sn_hits = _detection_hits(headers)
+    jira_score = len(jira_hits) + custom_fields
+    sn_score = len(sn_hits)
     return "servicenow" if sn_score > jira_score else "jira"
 
 
@@ -288,26 +321,40 @@ def _build_alias_lookup(headers: List[str], aliases: Optional[Dict[str, List[str
     """
     if aliases is None:
         aliases = COLUMN_ALIASES
-    lower_headers = [h.strip().lower() for h in headers]
-    # Also build a version that strips the "custom field (...)" wrapper
-    _cf_re = re.compile(r"^custom\s+field\s*\((.+)\)$")
-    unwrapped = []
-    for h in lower_headers:
-        m = _cf_re.match(h)
-        unwrapped.append(m.group(1).strip() if m else h)
-
-    lookup: Dict[str, List[int]] = {}
+    lower = [h.strip().lower() for h in headers]
+    return _alias_lookup(lower, [_unwrap_custom_field(h) for h in lower], aliases)
+
+
+_CUSTOM_FIELD_RE = re.compile(r"^custom\s+field\s*\((.+)\)$")
+
+
+def _unwrap_custom_field(header: str) -> str:
+    """``custom field (story points)`` -> ``story points``; others unchanged."""
+    m = _CUSTOM_FIELD_RE.match(header)
+    return m.group(1).strip() if m else header
+
+
+def _alias_lookup(lower: List[str], unwrapped: List[str],
+                  aliases: Dict[str, List[str]]) -> Dict[str, List[int]]:
+    """``_build_alias_lookup`` over already lower-cased and unwrapped headers.
+
+    Each header is looked up in a reverse ``alias -> [(field, rank)]``
+    index, so the cost is one dict probe per header rather than a scan
+    of every header for every alias.  Indices come out in the same order
+    as the alias-major scan: by alias rank, then by column.
+    """
+    index: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
     for canonical, alias_list in aliases.items():
-        indices: List[int] = []
-        seen: set = set()
-        for alias in alias_list:
-            # Collect ALL matching columns for each alias
-            for i, (lh, uw) in enumerate(zip(lower_headers, unwrapped)):
-                if i not in seen and (lh == alias or uw == alias):
-                    indices.append(i)
-                    seen.add(i)
-        lookup[canonical] = indices
-    return lookup
+        for rank, alias in enumerate(alias_list):
+            index[alias].append((canonical, rank))
+    found: Dict[str, Dict[int, int]] = {canonical: {} for canonical in aliases}
+    for i, (lh, uw) in enumerate(zip(lower, unwrapped)):
+        for name in (lh, uw) if uw != lh else (lh,):
+            for canonical, rank in index.get(name, ()):
+                ranks = found[canonical]
+                if rank < ranks.get(i, rank + 1):
+                    ranks[i] = rank
+    return {canonical: sorted(ranks, key=lambda i: (ranks[i], i)) for canonical, ranks in found.items()}
 
 
 def _find_comment_columns(headers: List[str]) -> List[int]:
@@ -320,6 +367,122 @@ def _find_comment_columns(headers: List[str]) -> List[int]:
     return indices
 
 
+# ---------------------------------------------------------------------------
+# Compiled schemas
+# ---------------------------------------------------------------------------
+
+# Distinct (config, header row) pairs kept by compile_schema.  Entries are
+# keyed by the config's values, not the object, so equal configs share them
+# and a config changed in place gets fresh ones.
+_SCHEMA_CACHE_SIZE = 128
+_SCHEMAS: Dict[Tuple[Any, ...], "CompiledSchema"] = {}
+_STATUS_CLASSIFIERS: Dict[Tuple[Any, ...], "_StatusClassifier"] = {}
+# id(config) -> (config, its classifier), so the per-ticket status checks
+# skip freezing the config's status sets; holding the config keeps its id
+# from being reused while the entry lives
+_CONFIG_CLASSIFIERS: Dict[int, Tuple[Optional[SourceConfig], "_StatusClassifier"]] = {}
+
+
+def _status_key(config: Optional[SourceConfig]) -> Tuple[Any, ...]:
+    """The status sets *config* classifies by, frozen (the defaults for None)."""
+    if config is None:
+        return (frozenset(_OPEN_STATUSES), frozenset(_CLOSED_STATUSES), frozenset(_BLOCKED_STATUSES))
+    return (frozenset(config.open_statuses), frozenset(config.closed_statuses),
+            frozenset(config.blocked_statuses))
+
+
+class CompiledSchema:
+    """Everything parsing derives from a source config and a header row.
+
+    Holds the lower-cased and ``Custom field (...)``-unwrapped headers,
+    the alias lookup, the comment (or ServiceNow work-notes) columns and
+    the config's status classifier.  Use ``compile_schema``, which builds one
+    per distinct header row and hands it out again for later files of
+    the same shape.
+    """
+
+    def __init__(self, headers: Iterable[str], config: SourceConfig):
+        self.headers: Tuple[str, ...] = tuple(headers)
+        self.config = config
+        self.lower = [h.strip().lower() for h in self.headers]
+        self.unwrapped = [_unwrap_custom_field(h) for h in self.lower]
+        self.lookup = _alias_lookup(self.lower, self.unwrapped, config.column_aliases)
+        if config.name == "servicenow":
+            self.comment_cols = _find_work_notes_columns(list(self.headers))
+        else:
+            self.comment_cols = _find_comment_columns(list(self.headers))
+        # Jira repeats a "Comment" column per comment, oldest first; any other
+        # comment columns are compared by date (see _extract_comments)
+        self.repeated_comment_cols = [i for i in self.comment_cols if self.lower[i] == "comment"]
+        self.other_comment_cols = [i for i in self.comment_cols if self.lower[i] != "comment"]
+        self.statuses = _status_classifier(config)
+
+
+def compile_schema(headers: Iterable[str], config: SourceConfig) -> CompiledSchema:
+    """Return the (memoised) ``CompiledSchema`` for *headers* under *config*."""
+    headers = tuple(headers)
+    aliases = tuple((name, tuple(names)) for name, names in config.column_aliases.items())
+    key = (config.name, aliases, _status_key(config), headers)
+    schema = _SCHEMAS.get(key)
+    if schema is None:
+        if len(_SCHEMAS) >= _SCHEMA_CACHE_SIZE:
+            del _SCHEMAS[next(iter(_SCHEMAS))]
+        schema = _SCHEMAS[key] = CompiledSchema(headers, config)
+    return schema
+
+
+class _StatusFlags(NamedTuple):
+    """How a source config classifies one status value."""
+    is_open: bool
+    is_blocked: bool
+    is_closed: bool
+
+
+class _StatusClassifier(Dict[str, _StatusFlags]):
+    """Raw status value -> ``_StatusFlags`` under one config, filled on demand.
+
+    Each distinct raw value (case and surrounding spaces included) is
+    classified once, so ``classifier[t.status]`` is a single dict hit for
+    every later ticket with that status.  Unknown statuses are open and
+    not blocked.
+    """
+
+    def __init__(self, config: Optional[SourceConfig]):
+        super().__init__()
+        # Frozen copies: later changes to the config must not leak in
+        self._open, self._closed, self._blocked = _status_key(config)
+
+    def __missing__(self, status: str) -> _StatusFlags:
+        sl = status.strip().lower()
+        closed = sl in self._closed
+        flags = self[status] = _StatusFlags(not closed, sl in self._blocked, closed)
+        return flags
+
+
+def _status_classifier(config: Optional[SourceConfig]) -> _StatusClassifier:
+    """Return the shared status classifier for *config* (None: the defaults).
+
+    One classifier is kept per distinct set of statuses, next to the
+    compiled schemas, so every parser, frame and metrics pass under an
+    equal config shares its cache.  Each config object is then remembered
+    by identity, making later calls with it a single dict hit; its status
+    sets are read when it is first classified.
+    """
+    entry = _CONFIG_CLASSIFIERS.get(id(config))
+    if entry is not None and entry[0] is config:
+        return entry[1]
+    key = _status_key(config)
+    classifier = _STATUS_CLASSIFIERS.get(key)
+    if classifier is None:
+        if len(_STATUS_CLASSIFIERS) >= _SCHEMA_CACHE_SIZE:
+            del _STATUS_CLASSIFIERS[next(iter(_STATUS_CLASSIFIERS))]
+        classifier = _STATUS_CLASSIFIERS[key] = _StatusClassifier(config)
+    if len(_CONFIG_CLASSIFIERS) >= _SCHEMA_CACHE_SIZE:
+        del _CONFIG_CLASSIFIERS[next(iter(_CONFIG_CLASSIFIERS))]
+    _CONFIG_CLASSIFIERS[id(config)] = (config, classifier)
+    return classifier
+
+
 # ---------------------------------------------------------------------------
 # Date / duration parsing
 # ---------------------------------------------------------------------------
@@ -350,11 +513,111 @@ _DATE_FORMATS = [
 ]
 
 
+_MONTH_ABBR = {m: i for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+
+
+def _parse_jira_timestamp(value: str) -> Optional[datetime]:
+    """Parse Jira's ``28/Nov/25 5:03 PM`` shape without ``strptime``.
+
+    Covers the ``%d/%b/%y`` and ``%d/%b/%Y`` formats with either a 12-hour
+    (``%I:%M %p``) or 24-hour (``%H:%M``) time.  Returns None for anything
+    it is not sure about so the caller can fall back to the format list.
+    """
+    date_part, _, time_part = value.partition(" ")
+    parts = date_part.split("/")
+    if len(parts) != 3:
+        return None
+    day, mon, year = parts
+    month = _MONTH_ABBR.get(mon.lower())
+    if month is None or not (0 < len(day) <= 2 and day.isdigit()
+                             and len(year) in (2, 4) and year.isdigit()):
+        return None
+    clock, _, meridiem = time_part.partition(" ")
+    hh, _, mm = clock.partition(":")
+    if not (0 < len(hh) <= 2 and hh.isdigit() and len(mm) == 2 and mm.isdigit()):
+        return None
+    meridiem = meridiem.upper()
+    if meridiem not in ("", "AM", "PM"):
+        return None
+    # isdigit() also passes characters such as "²" that int() rejects
+    try:
+        y, hour = int(year), int(hh)
+        if len(year) == 2:
+            y += 2000 if y < 69 else 1900
+        if meridiem:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if meridiem == "PM" else 0)
+        return datetime(y, month, int(day), hour, int(mm))
+    except ValueError:
+        return None
+
+
+def _parse_iso_timestamp(value: str) -> Optional[datetime]:
+    """Parse ``YYYY-MM-DD``, ``YYYY-MM-DD HH:MM`` and ``YYYY-MM-DD[ T]HH:MM:SS``.
+
+    Uses ``datetime.fromisoformat``; fractional seconds and UTC offsets are
+    left to the format list.  Returns None when the shape does not match.
+    """
+    n = len(value)
+    if n == 10:
+        pass
+    elif n == 19:
+        # The exact HH:MM:SS shape: fromisoformat would also take offsets
+        # such as "2024-01-05 10+01:00" and return an aware datetime
+        if (value[10] not in "T " or value[13] != ":" or value[16] != ":"
+                or not (value[11:13].isdigit() and value[14:16].isdigit() and value[17:19].isdigit())):
+            return None
+    elif n == 16:
+        if (value[10] != " " or value[13] != ":"
+                or not (value[11:13].isdigit() and value[14:16].isdigit())):
+            return None
+    else:
+        return None
+    if not (value[:4].isdigit() and value[5:7].isdigit() and value[8:10].isdigit()):
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _parse_date_fast(value: str) -> Optional[datetime]:
+    """Route a stripped value to the hand-written parser for its shape."""
+    if len(value) >= 10 and value[4] == "-" and value[7] == "-":
+        return _parse_iso_timestamp(value)
+    slash = value.find("/")
+    if 0 < slash <= 2 and value[slash + 1:slash + 2].isalpha():
+        return _parse_jira_timestamp(value)
+    return None
+
+
+# Formats whose values the hand-written parsers already cover
+_FAST_DATE_FORMATS = {
+    "%d/%b/%y %I:%M %p": _parse_jira_timestamp,
+    "%d/%b/%y %H:%M": _parse_jira_timestamp,
+    "%d/%b/%Y %I:%M %p": _parse_jira_timestamp,
+    "%d/%b/%Y %H:%M": _parse_jira_timestamp,
+    "%Y-%m-%dT%H:%M:%S": _parse_iso_timestamp,
+    "%Y-%m-%d %H:%M:%S": _parse_iso_timestamp,
+    "%Y-%m-%d %H:%M": _parse_iso_timestamp,
+    "%Y-%m-%d": _parse_iso_timestamp,
+}
+
+
 def parse_date(value: str) -> Optional[datetime]:
-    """Try multiple date formats; return None on failure."""
+    """Try multiple date formats; return None on failure.
+
+    Common ISO and Jira shapes go through hand-written parsers first; the
+    ``strptime`` format list handles everything else.
+    """
     if not value or not value.strip():
         return None
     value = value.strip()
+    dt = _parse_date_fast(value)
+    if dt is not None:
+        return dt
     for fmt in _DATE_FORMATS:
         try:
             dt = datetime.strptime(value, fmt)
@@ -364,6 +627,93 @@ def parse_date(value: str) -> Optional[datetime]:
     return None
 
 
+def _swap_day_month(fmt: str) -> Optional[str]:
+    """Return the day-first/month-first twin of *fmt*, if it is in ``_DATE_FORMATS``."""
+    if "%d/%m" in fmt:
+        twin = fmt.replace("%d/%m", "%m/%d")
+    elif "%m/%d" in fmt:
+        twin = fmt.replace("%m/%d", "%d/%m")
+    else:
+        return None
+    return twin if twin in _DATE_FORMATS else None
+
+
+class _ColumnDateParser:
+    """Date parser for one CSV column that settles on the column's format.
+
+    ``learn()`` scores ``_DATE_FORMATS`` against a sample of the column's
+    values.  An ambiguous value such as ``03/04/2024`` counts for both the
+    day-first and month-first reading, while ``25/04/2024`` counts only for
+    day-first, so the sample decides which one the column uses; a column of
+    only ambiguous values keeps ``parse_date``'s day-first preference.
+
+    Afterwards the learned format is tried first and ``parse_date`` is only
+    consulted when it does not match.  ``hits``, ``fallbacks`` and
+    ``misses`` count how often each path was taken.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.fmt: Optional[str] = None
+        self._fast: Optional[Callable[[str], Optional[datetime]]] = None
+        self.hits = 0
+        self.fallbacks = 0
+        self.misses = 0
+
+    def learn(self, samples: Iterable[str]) -> Optional[str]:
+        """Pick the best-matching format for *samples* and return it."""
+        scores: Dict[str, int] = defaultdict(int)
+        for value in samples:
+            value = value.strip()
+            if not value:
+                continue
+            for fmt in _DATE_FORMATS:
+                try:
+                    datetime.strptime(value, fmt)
+                except ValueError:
+                    continue
+                scores[fmt] += 1
+                twin = _swap_day_month(fmt)
+                if twin is not None:
+                    try:
+                        datetime.strptime(value, twin)
+                        scores[twin] += 1
+                    except ValueError:
+                        pass
+                break
+        if scores:
+            best = max(scores.values())
+            self.use(next(fmt for fmt in _DATE_FORMATS if scores.get(fmt) == best))
+        return self.fmt
+
+    def use(self, fmt: Optional[str]) -> None:
+        """Adopt a format learned elsewhere (e.g. by another process)."""
+        self.fmt = fmt
+        self._fast = _FAST_DATE_FORMATS.get(fmt) if fmt is not None else None
+
+    def __call__(self, value: str) -> Optional[datetime]:
+        if not value or not value.strip():
+            return None
+        value = value.strip()
+        if self._fast is not None:
+            dt = self._fast(value)
+            if dt is not None:
+                self.hits += 1
+                return dt
+        elif self.fmt is not None:
+            try:
+                dt = datetime.strptime(value, self.fmt)
+                self.hits += 1
+                return dt.replace(tzinfo=None)
+            except ValueError:
+                pass
+        self.fallbacks += 1
+        dt = parse_date(value)
+        if dt is None:
+            self.misses += 1
+        return dt
+
+
 _DURATION_RE = re.compile(
     r"(?:(\d+)\s*w)?\s*(?:(\d+)\s*d)?\s*(?:(\d+)\s*h)?\s*(?:(\d+)\s*m)?\s*(?:(\d+)\s*s)?",
     re.IGNORECASE,
@@ -426,8 +776,208 @@ def _format_days(days: float) -> str:
 # Data model
 # ---------------------------------------------------------------------------
 
-@dataclass
+class _HeaderIndex:
+    """De-duplicated header names for one export, shared by all its rows.
+
+    Repeated headers (Jira writes ``Watchers``, ``Comment``, ``Labels`` ...
+    once per value) keep their first occurrence as-is and get a numbered
+    suffix after that — ``Watchers``, ``Watchers (2)``, ``Watchers (3)`` —
+    so no column is lost when rows are viewed as mappings.  Suffixes skip
+    names the header row already uses, so a real ``Watchers (2)`` column
+    keeps its name.
+
+    With *keep* (positions into *headers*) the rows it describes are
+    projected down to those columns by ``project()``, and ``names`` and
+    ``positions`` refer to the projected row.
+
+    ``shown`` groups the row positions of each distinct header, in order
+    of first appearance, when every column is kept and some repeat: the
+    full ticket table then has one column per header holding the last of
+    its cells the row reaches, as the plain ``header -> cell`` dict did
+    before the suffixes existed.  None means the table shows every column.
+    """
+    __slots__ = ("names", "positions", "headers", "keep", "shown")
+
+    def __init__(self, headers: List[str], keep: Optional[Iterable[int]] = None):
+        names: List[str] = []
+        positions: Dict[str, int] = {}
+        taken = set(headers)
+        for i, h in enumerate(headers):
+            name, n = h, 1
+            while name in positions or (n > 1 and name in taken):
+                n += 1
+                name = f"{h} ({n})"
+            names.append(name)
+            positions[name] = i
+        self.headers: Tuple[str, ...] = tuple(headers)
+        self.keep: Optional[Tuple[int, ...]] = None if keep is None else tuple(sorted(set(keep)))
+        self.shown: Optional[Tuple[Tuple[int, ...], ...]] = None
+        if self.keep is None and names != list(headers):
+            groups: Dict[str, List[int]] = {}
+            for i, h in enumerate(headers):
+                groups.setdefault(h, []).append(i)
+            self.shown = tuple(tuple(group) for group in groups.values())
+        if self.keep is not None:
+            names = [names[i] for i in self.keep]
+            positions = {name: i for i, name in enumerate(names)}
+        self.names: Tuple[str, ...] = tuple(names)
+        self.positions = positions
+
+    def project(self, row: List[str]) -> List[str]:
+        """*row* cut down to the kept columns (the row itself if all are kept)."""
+        keep = self.keep
+        if keep is None:
+            return row
+        if not keep or keep[-1] < len(row):
+            return [row[i] for i in keep]
+        return [row[i] for i in keep if i < len(row)]
+
+    def table_names(self, width: int) -> List[str]:
+        """The full table's columns for a row of *width* cells (``shown`` must be set)."""
+        return [self.names[group[0]] for group in self.shown if group[0] < width]  # type: ignore[union-attr]
+
+    def table_cells(self, cells: List[str]) -> List[str]:
+        """*cells* as the full table shows them (``shown`` must be set)."""
+        n = len(cells)
+        shown: List[str] = []
+        for group in self.shown:  # type: ignore[union-attr]
+            if group[-1] < n:
+                shown.append(cells[group[-1]])
+            elif group[0] < n:
+                shown.append(cells[max(i for i in group if i < n)])
+        return shown
+
+
+class _RawFields(Mapping):
+    """Read-only ``header -> cell`` view over one CSV row.
+
+    Holds just the row list and the export's shared ``_HeaderIndex``; a
+    real dict is only built when ``to_dict()`` is called.  Headers beyond
+    the end of a short row are absent, as are cells beyond the last header.
+    """
+    __slots__ = ("_index", "_row")
+
+    def __init__(self, index: _HeaderIndex, row: List[str]):
+        self._index = index
+        self._row = row
+
+    def cells(self) -> List[str]:
+        """The row's cells, in header order."""
+        return self._row
+
+    def __getitem__(self, name: str) -> str:
+        i = self._index.positions[name]
+        if i >= len(self._row):
+            raise KeyError(name)
+        return self._row[i]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        i = self._index.positions.get(name)
+        if i is None or i >= len(self._row):
+            return default
+        return self._row[i]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index.names[:len(self._row)])
+
+    def __len__(self) -> int:
+        return min(len(self._index.names), len(self._row))
+
+    def to_dict(self) -> Dict[str, str]:
+        return dict(zip(self._index.names, self._row))
+
+    def __repr__(self) -> str:
+        return f"_RawFields({self.to_dict()!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_RawFields, (self._index, self._row))
+
+
+class _MappedRawFields(_RawFields):
+    """``_RawFields`` whose large cells stay in the memory-mapped export.
+
+    Cells of ``_LAZY_TEXT_CHARS`` or more are stored as None, and the row
+    remembers the byte span of its record instead.  Reading such a cell
+    re-tokenises just that record from the map, so long descriptions and
+    comments are only decoded when something asks for them.  Pickling
+    materialises the row into a plain ``_RawFields``.
+    """
+    __slots__ = ("_source", "_start", "_end")
+
+    def __init__(self, index: _HeaderIndex, row: List[Optional[str]], source: "_MappedExport",
+                 start: int, end: int):
+        super().__init__(index, row)  # type: ignore[arg-type]
+        self._source = source
+        self._start = start
+        self._end = end
+
+    def cells(self) -> List[str]:
+        return self._index.project(self._source.record(self._start, self._end))
+
+    def __getitem__(self, name: str) -> str:
+        value = super().__getitem__(name)
+        return self.cells()[self._index.positions[name]] if value is None else value
+
+    def get(self, name: str, default: Any = None) -> Any:
+        i = self._index.positions.get(name)
+        if i is None or i >= len(self._row):
+            return default
+        value = self._row[i]
+        return self.cells()[i] if value is None else value
+
+    def to_dict(self) -> Dict[str, str]:
+        return dict(zip(self._index.names, self.cells()))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_RawFields, (self._index, self.cells()))
+
+
+# Low-cardinality ticket fields: interned per export by the parser and
+# integer-coded in a TicketFrame.
+_CATEGORICAL_FIELDS = ("status", "assignee", "reporter", "priority", "issue_type",
+                       "assignment_group", "category", "subcategory", "contact_type",
+                       "escalation", "components", "labels")
+
+
+class _Dictionary:
+    """Distinct values of one column, each with a small integer code.
+
+    Codes are handed out in order of first appearance, and ``intern()``
+    returns the one stored copy of a value so equal cells share a string.
+    """
+    __slots__ = ("values", "_index")
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self.values: List[str] = list(values)
+        self._index: Dict[str, int] = {v: i for i, v in enumerate(self.values)}
+
+    def code(self, value: str) -> int:
+        """Return the code for *value*, adding it to the dictionary if new."""
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def intern(self, value: str) -> str:
+        return self.values[self.code(value)]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+# ``slots=True`` drops the per-instance ``__dict__`` (Python 3.10+); on
+# older interpreters tickets fall back to regular dataclass instances.
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class JiraTicket:
+    """One parsed ticket.
+
+    Slotted, so a large export costs a fixed set of attribute slots per
+    ticket rather than a ~45-entry instance dictionary.
+    """
     key: str = ""
     summary: str = ""
     status: str = ""
@@ -453,7 +1003,7 @@ class JiraTicket:
     parent: str = ""
     last_comment_date: Optional[datetime] = None
     last_comment_text: str = ""
-    raw_fields: Dict[str, str] = field(default_factory=dict)
+    raw_fields: Mapping[str, str] = field(default_factory=dict)
     # ServiceNow-specific fields (harmless defaults when unused)
     category: str = ""
     subcategory: str = ""
@@ -480,15 +1030,20 @@ Ticket = JiraTicket
 # CSV Parsing
 # ---------------------------------------------------------------------------
 
+_SN_NOTE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s*-\s*(.+)")
+_COMMENT_DATE_RE = re.compile(r"^(\d{1,2}/\w{3}/\d{2,4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)")
+
+
 def _extract_sn_work_notes(row: List[str], comment_cols: List[int]) -> Tuple[Optional[datetime], str]:
     """Extract latest comment date and text from ServiceNow work notes columns.
 
     ServiceNow work notes format:  ``YYYY-MM-DD HH:MM:SS - Author\\nText``
-    or plain text.
+    or plain text.  A journal cell lists its newest note first, so only
+    that note is read; the columns themselves (work notes, additional
+    comments, ...) are unordered and all compared.
     """
     latest_date: Optional[datetime] = None
     latest_text = ""
-    sn_note_re = re.compile(r"^(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})\s*-\s*(.+)")
     for ci in comment_cols:
         if ci >= len(row):
             continue
@@ -496,7 +1051,7 @@ def _extract_sn_work_notes(row: List[str], comment_cols: List[int]) -> Tuple[Opt
         if not val:
             continue
         # Try SN format first
-        m = sn_note_re.match(val)
+        m = _SN_NOTE_RE.match(val)
         if m:
             d = parse_date(m.group(1))
             text = val[m.end():].strip().lstrip("-").strip()
@@ -514,35 +1069,53 @@ def _extract_sn_work_notes(row: List[str], comment_cols: List[int]) -> Tuple[Opt
     return latest_date, latest_text
 
 
-def _extract_comments(row: List[str], comment_cols: List[int]) -> Tuple[Optional[datetime], str]:
-    """Extract latest comment date and text from comment columns."""
+def _parse_comment(val: str) -> Tuple[Optional[datetime], str]:
+    """Split one non-empty comment cell into its date (None if absent) and text."""
+    # "date;author;text"; the text is what follows the last ';'
+    head = val.find(";")
+    tail = val.rfind(";")
+    if head != tail:
+        return parse_date(val[:head].strip()), val[tail + 1:].strip()
+    dm = _COMMENT_DATE_RE.match(val)
+    if dm:
+        return parse_date(dm.group(1)), val[dm.end():].strip().lstrip(";").strip()
+    return None, val
+
+
+def _extract_comments(row: List[str], comment_cols: Sequence[int],
+                      repeated: Sequence[int] = ()) -> Tuple[Optional[datetime], str]:
+    """Extract latest comment date and text from comment columns.
+
+    *comment_cols* are in no particular order, so their dates are compared.
+    *repeated* are Jira's repeated ``Comment`` columns, which hold a
+    ticket's comments oldest first: they are scanned newest first, stopping
+    at the first comment older than the latest seen.  Of comments sharing
+    the latest date, the leftmost column's wins.  Without any dated comment
+    the text of the first non-empty column is returned.
+    """
     latest_date: Optional[datetime] = None
     latest_text = ""
-    comment_date_re = re.compile(r"^(\d{1,2}/\w{3}/\d{2,4}\s+\d{1,2}:\d{2}\s*(?:AM|PM)?)")
+    latest_ci = -1
+    for ci in reversed(repeated):
+        val = row[ci].strip() if ci < len(row) else ""
+        if val:
+            d, text = _parse_comment(val)
+            if d is not None:
+                if latest_date is not None and d < latest_date:
+                    break
+                latest_date, latest_text, latest_ci = d, text, ci
     for ci in comment_cols:
-        if ci >= len(row):
-            continue
-        val = row[ci].strip()
-        if not val:
-            continue
-        parts = val.split(";")
-        if len(parts) >= 3:
-            d = parse_date(parts[0].strip())
-            text = parts[-1].strip()
-        else:
-            dm = comment_date_re.match(val)
-            if dm:
-                d = parse_date(dm.group(1))
-                text = val[dm.end():].strip().lstrip(";").strip()
-            else:
-                d = None
-                text = val
-        if d is not None:
-            if latest_date is None or d > latest_date:
-                latest_date = d
-                latest_text = text
-        elif not latest_text:
-            latest_text = text
+        val = row[ci].strip() if ci < len(row) else ""
+        if val:
+            d, text = _parse_comment(val)
+            if d is not None and (latest_date is None or d > latest_date
+                                  or (d == latest_date and ci < latest_ci)):
+                latest_date, latest_text, latest_ci = d, text, ci
+    if latest_date is None:
+        for ci in sorted(itertools.chain(comment_cols, repeated)):
+            val = row[ci].strip() if ci < len(row) else ""
+            if val:
+                return None, _parse_comment(val)[1]
     return latest_date, latest_text
 
 
@@ -556,182 +1129,1517 @@ def _find_work_notes_columns(headers: List[str]) -> List[int]:
     return indices
 
 
-def _read_file(path: Path) -> str:
-    """Read a file trying UTF-8 first, falling back to cp1252 for Windows exports.
+_UTF8_BOM = b"\xef\xbb\xbf"
+_SNIFF_BYTES = 1 << 16
+
+# Byte -> character table used when a byte run fails to decode: cp1252 for
+# the bytes it defines, latin-1 for the five holes cp1252 leaves unmapped.
+_LEGACY_BYTE_MAP: List[str] = []
+for _b in range(256):
+    try:
+        _LEGACY_BYTE_MAP.append(bytes([_b]).decode("cp1252"))
+    except UnicodeDecodeError:
+        _LEGACY_BYTE_MAP.append(chr(_b))
+del _b
+
+
+def _legacy_byte_fallback(exc: UnicodeError) -> Tuple[str, int]:
+    """Codec error handler that decodes only the offending bytes as cp1252.
+
+    Registered as ``jira_dashboard.legacy_bytes`` so the C-level incremental
+    decoder keeps its fast path for the valid text and only the bytes that
+    fail (a stray Windows character in a UTF-8 export, or an unmapped byte
+    in a cp1252 one) take the fallback.
+    """
+    if not isinstance(exc, UnicodeDecodeError):
+        raise exc
+    bad = bytes(exc.object[exc.start:exc.end])
+    return "".join(_LEGACY_BYTE_MAP[b] for b in bad), exc.end
+
+
+codecs.register_error("jira_dashboard.legacy_bytes", _legacy_byte_fallback)
+
+
+def _sniff_encoding(prefix: bytes) -> str:
+    """Guess an export's encoding from a bounded prefix of its bytes.
+
+    Returns ``"utf-8"`` when the prefix is valid UTF-8 (a multi-byte
+    sequence cut off at the end of the prefix is tolerated), otherwise
+    ``"cp1252"`` — the usual encoding of Windows/ServiceNow exports.
+    """
+    if prefix.startswith(_UTF8_BOM):
+        prefix = prefix[len(_UTF8_BOM):]
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(prefix, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "cp1252"
+
+
+# Leading bytes of the compressed formats read transparently
+_COMPRESSION_MAGIC = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"PK\x03\x04", "zip"),
+)
+_DECOMPRESSORS: Dict[str, Callable[..., IO[bytes]]] = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+
+class _ZipMember(NamedTuple):
+    """One CSV inside a zip archive, usable wherever an input path is."""
+    archive: Path
+    member: str
+
+    @property
+    def name(self) -> str:
+        return self.member.rsplit("/", 1)[-1]
+
+    def __str__(self) -> str:
+        return f"{self.archive}:{self.member}"
+
+
+class _Stdin:
+    """Standard input, given as ``-`` on the command line."""
+    name = "<stdin>"
+
+    def __str__(self) -> str:
+        return self.name
+
+
+_STDIN = _Stdin()
+
+_Input = Union[Path, _ZipMember, _Stdin]
+
+
+def _is_regular_input(source: _Input) -> bool:
+    """Whether *source* can be read more than once (not stdin or a pipe)."""
+    return isinstance(source, _ZipMember) or (isinstance(source, Path) and source.is_file())
+
+
+def _compression(path: Path) -> Optional[str]:
+    """Name of *path*'s compression format from its magic bytes, or None."""
+    with path.open("rb") as fh:
+        return _compression_of(fh.read(8))
+
+
+def _compression_of(magic: bytes) -> Optional[str]:
+    for prefix, kind in _COMPRESSION_MAGIC:
+        if magic.startswith(prefix):
+            return kind
+    return None
+
+
+def _zip_members(path: Path) -> List[_ZipMember]:
+    """The CSV files in a zip archive, in natural order."""
+    with zipfile.ZipFile(path) as archive:
+        names = [info.filename for info in archive.infolist()
+                 if not info.is_dir() and info.filename.lower().endswith(".csv")
+                 and not info.filename.startswith("__MACOSX/")]
+    return [_ZipMember(path, name) for name in sorted(names, key=_natural_key)]
+
+
+class _OwningReader(io.BufferedReader):
+    """A buffered decompressor that also closes the stream it reads from."""
+
+    def __init__(self, raw: IO[bytes], source: IO[bytes]):
+        super().__init__(raw, buffer_size=_SNIFF_BYTES)
+        self._source = source
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._source.close()
+
+
+class _StdinReader(io.RawIOBase):
+    """``sys.stdin.buffer`` as a raw stream that leaves stdin open when closed."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._stdin = sys.stdin.buffer
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        data = self._stdin.read1(len(b))
+        b[:len(data)] = data
+        return len(data)
+
+
+def _open_binary(source: _Input) -> IO[bytes]:
+    """Open an input as a byte stream, decompressing it on the fly.
+
+    gzip, bzip2 and xz files are recognised by their magic bytes rather
+    than their extension and read through the matching decompressor, so
+    neither a temporary file nor the whole decompressed export is needed.
+    The magic bytes are peeked from the opened stream, so standard input
+    and named pipes are read exactly once; closing the result leaves
+    standard input itself open.  A zip archive is opened at its only CSV
+    member; it must be a regular file.
+    """
+    if isinstance(source, _ZipMember):
+        with zipfile.ZipFile(source.archive) as archive:
+            # The member stream keeps the archive's file open after this
+            return archive.open(source.member)
+    raw = _StdinReader() if isinstance(source, _Stdin) else source.open("rb", buffering=0)
+    fh = io.BufferedReader(raw, buffer_size=_SNIFF_BYTES)
+    kind = _compression_of(fh.peek(8)[:8])
+    if kind is None:
+        return fh
+    if kind == "zip":
+        fh.close()
+        if not _is_regular_input(source):
+            raise ValueError(f"{source} is a zip archive, which can only be read from a file")
+        members = _zip_members(source)
+        if len(members) != 1:
+            raise ValueError(f"{source} holds {len(members)} CSV files; pass it on the command "
+                             f"line to read them as separate inputs")
+        return _open_binary(members[0])
+    return _OwningReader(_DECOMPRESSORS[kind](fh, "rb"), fh)
+
+
+def _open_text(path: _Input) -> io.TextIOWrapper:
+    """Open a CSV export for streaming, decoded text access.
+
+    The encoding is sniffed from the first ``_SNIFF_BYTES`` bytes; bytes
+    further on that do not decode fall back individually via
+    ``_legacy_byte_fallback``, so the file is decoded in a single pass no
+    matter where odd bytes appear.  A UTF-8 BOM is skipped regardless of
+    the body encoding, and ``newline=""`` lets quoted multi-line cells
+    reach the csv module intact.  Compressed inputs are decoded as they
+    are decompressed (see ``_open_binary``).
+    """
+    fh = _open_binary(path)
+    if not isinstance(fh, io.BufferedReader):
+        fh = io.BufferedReader(fh, buffer_size=_SNIFF_BYTES)
+    prefix = fh.peek(_SNIFF_BYTES)[:_SNIFF_BYTES]
+    if prefix.startswith(_UTF8_BOM):
+        fh.read(len(_UTF8_BOM))
+    return io.TextIOWrapper(fh, encoding=_sniff_encoding(prefix),
+                            errors="jira_dashboard.legacy_bytes", newline="")
+
+
+# ---------------------------------------------------------------------------
+# Memory-mapped input
+# ---------------------------------------------------------------------------
+
+# Cells at least this long are left in the mapped file and decoded on
+# access; every preview the dashboard shows is shorter.
+_LAZY_TEXT_CHARS = 128
+# Comment previews show this many characters
+_PREVIEW_CHARS = 60
+
+
+# A carriage return not followed by a line feed, anywhere in an export
+_BARE_CR_RE = re.compile(rb"\r(?!\n)")
+# Exports mapped again by record() after their session closed, oldest
+# first; beyond this many the oldest is unmapped
+_MAX_OPEN_MAPS = 4
+_OPEN_MAPS: "OrderedDict[_MappedExport, None]" = OrderedDict()
+
+
+class _MappedRow(list):
+    """A CSV row that knows the byte span of its record in a mapped export.
+
+    ``source`` is None for rows that did not come wholly from the map.
+    """
+    __slots__ = ("source", "start", "end")
+
+
+class _MappedExport:
+    """A plain, uncompressed export read through ``mmap``.
+
+    ``rows()`` tokenises it line by line straight from the map, tagging
+    every row with its record's byte span, and ``record()`` re-reads one
+    record later on.
+
+    The owning ``IngestSession`` unmaps the export when it closes.  A later
+    ``record()`` maps it again, after checking that the file's size and
+    mtime are unchanged, and at most ``_MAX_OPEN_MAPS`` such maps stay open
+    at a time.  The file must still not be rewritten in place while a map
+    is open.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.mm: Optional[mmap.mmap] = None
+        self._identity: Optional[Tuple[int, int]] = None
+        prefix = self._map()[:_SNIFF_BYTES]
+        self.encoding = _sniff_encoding(prefix)
+        self.start = len(_UTF8_BOM) if prefix.startswith(_UTF8_BOM) else 0
+
+    @classmethod
+    def open(cls, path: _Input) -> "Optional[_MappedExport]":
+        """Map *path*, or return None if it has to be streamed instead.
+
+        That covers archive members, compressed and empty files, and
+        exports with a bare ``\r`` anywhere (lines are split on ``\n``
+        only), which costs one scan of the map.
+        """
+        if not isinstance(path, Path) or not path.is_file():
+            return None
+        try:
+            export = cls(path)
+        except (OSError, ValueError):
+            return None
+        first_line = export.mm[:export.mm.find(b"\n") + 1]
+        if _compression_of(export.mm[:8]) is not None or not first_line or _BARE_CR_RE.search(export.mm):
+            export.close()
+            return None
+        return export
+
+    def _map(self) -> mmap.mmap:
+        with self.path.open("rb") as fh:
+            stat = os.fstat(fh.fileno())
+            identity = (stat.st_size, stat.st_mtime_ns)
+            if self._identity is not None and identity != self._identity:
+                raise OSError(f"{self.path} has changed since it was read")
+            self._identity = identity
+            self.mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.mm
+
+    def close(self) -> None:
+        """Unmap the export; ``record()`` maps it again if asked."""
+        _OPEN_MAPS.pop(self, None)
+        if self.mm is not None:
+            self.mm.close()
+            self.mm = None
+
+    def rows(self, start: int, end: int, tail: Iterable[str] = ()) -> Iterator[List[str]]:
+        """Yield the rows in bytes ``[start, end)`` as ``_MappedRow`` objects.
+
+        *start* must be the start of a line.  Lines from *tail* are parsed
+        after the range; rows that take any of them have no span (their
+        ``source`` is None).  The map's file position is moved, so only
+        one ``rows()`` iterator may be active at a time.
+        """
+        pos = start
+        in_tail = False
+
+        def lines() -> Iterator[str]:
+            nonlocal pos
+            readline, encoding = self.mm.readline, self.encoding
+            self.mm.seek(start)
+            while pos < end:
+                line = readline()
+                if not line:
+                    break
+                pos += len(line)
+                yield line.decode(encoding, "jira_dashboard.legacy_bytes")
+
+        def tail_lines() -> Iterator[str]:
+            nonlocal in_tail
+            in_tail = True
+            yield from tail
+
+        record_start = start
+        for row in csv.reader(itertools.chain(lines(), tail_lines())):
+            mapped = _MappedRow(row)
+            mapped.source, mapped.start, mapped.end = None if in_tail else self, record_start, pos
+            record_start = pos
+            yield mapped
+
+    def record(self, start: int, end: int) -> List[str]:
+        """Re-tokenise the record in bytes ``[start, end)``."""
+        mm = self.mm
+        if mm is None:
+            mm = self._map()
+            _OPEN_MAPS[self] = None
+            while len(_OPEN_MAPS) > _MAX_OPEN_MAPS:
+                _OPEN_MAPS.popitem(last=False)[0].close()
+        text = mm[start:end].decode(self.encoding, "jira_dashboard.legacy_bytes")
+        return next(csv.reader(io.StringIO(text, newline="")), [])
+
+
+def _raw_fields(index: _HeaderIndex, row: List[str]) -> _RawFields:
+    """The ``raw_fields`` view kept for a parsed row.
+
+    Only the index's kept columns are retained, and rows read from a
+    mapped export also drop their large cells in favour of the record's
+    byte span (see ``_MappedRawFields``).
+    """
+    if type(row) is not _MappedRow or row.source is None:
+        return _RawFields(index, index.project(row))
+    cells: List[Optional[str]] = list(row) if index.keep is None else index.project(row)  # type: ignore
+    large = list(itertools.compress(range(len(cells)), map(_LAZY_TEXT_CHARS.__le__, map(len, cells))))
+    if not large:
+        return _RawFields(index, cells)  # type: ignore[arg-type]
+    for i in large:
+        cells[i] = None
+    return _MappedRawFields(index, cells, row.source, row.start, row.end)
+
+
+# Canonical fields copied verbatim (after stripping) onto the ticket.
+_TEXT_FIELDS = ("key", "summary", "status", "assignee", "reporter", "priority",
+                "issue_type", "labels", "components", "fix_versions", "resolution",
+                "epic_link", "sprint", "project", "parent")
+_SN_TEXT_FIELDS = ("category", "subcategory", "assignment_group", "contact_type",
+                   "impact", "urgency", "escalation", "close_notes", "severity", "active")
+_DATE_FIELDS = ("created", "updated", "resolved", "due_date")
+_SN_DATE_FIELDS = ("closed_at",)
+# Canonical duration field -> JiraTicket attribute
+_DURATION_FIELDS = {
+    "original_estimate": "original_estimate_secs",
+    "time_spent": "time_spent_secs",
+    "remaining_estimate": "remaining_estimate_secs",
+}
+_SN_DURATION_FIELDS = {"business_duration": "business_duration_secs"}
+_SN_COUNT_FIELDS = ("reassignment_count", "reopen_count")
+# Leading data rows buffered to learn date formats, and values kept per column
+_DATE_SAMPLE_ROWS = 200
+_DATE_SAMPLE_SIZE = 50
+
+
+class _RowExtractor:
+    """Row -> JiraTicket converter compiled once from a config and header row.
+
+    The alias lookup is resolved up front into index tuples for the mapped
+    fields only, with single-column fields split out onto a fast path, so
+    per-row work scales with the number of mapped columns and every cell
+    is stripped at most once.  Categorical fields are interned through
+    per-column ``dictionaries``, so repeated values share one string.
+    Raw rows retain only the columns in *keep* (all by default).
+
+    Comment columns are only read for tickets that are open under
+    *config*: the latest comment feeds staleness, which closed tickets
+    never reach, so theirs stay empty.
+    """
+
+    def __init__(self, headers: List[str], config: SourceConfig,
+                 lookup: Optional[Dict[str, List[int]]] = None, keep: Optional[Iterable[int]] = None):
+        schema = compile_schema(headers, config)
+        if lookup is None:
+            lookup = schema.lookup
+        self.headers = headers
+        self.header_index = _HeaderIndex(headers, keep)
+        self.config = config
+        self.is_sn = config.name == "servicenow"
+        self.comment_cols = schema.comment_cols
+        self._comment_cols = (schema.other_comment_cols, schema.repeated_comment_cols)
+        # Shared with the config's frames and metrics; see _status_classifier
+        self.statuses = schema.statuses
+
+        mapped = {c: tuple(indices) for c, indices in lookup.items() if indices}
+        self._single = tuple((c, idx[0]) for c, idx in mapped.items() if len(idx) == 1)
+        self._multi = tuple((c, idx) for c, idx in mapped.items() if len(idx) > 1)
+        self._width = max((i for idx in mapped.values() for i in idx), default=-1) + 1
+
+        text = _TEXT_FIELDS + (_SN_TEXT_FIELDS if self.is_sn else ())
+        dates = _DATE_FIELDS + (_SN_DATE_FIELDS if self.is_sn else ())
+        durations = dict(_DURATION_FIELDS, **(_SN_DURATION_FIELDS if self.is_sn else {}))
+        self._text = tuple(c for c in text if c in mapped)
+        self.dictionaries = {c: _Dictionary() for c in _CATEGORICAL_FIELDS}
+        self._interned = tuple((c, self.dictionaries[c].intern) for c in self._text
+                               if c in self.dictionaries)
+        self.date_parsers = {c: _ColumnDateParser(c) for c in dates if c in mapped}
+        self._durations = tuple((c, attr) for c, attr in durations.items() if c in mapped)
+        self._story_points = "story_points" in mapped
+        self._made_sla = self.is_sn and "made_sla" in mapped
+        self._counts = tuple(c for c in _SN_COUNT_FIELDS if self.is_sn and c in mapped)
+
+    def learn_dates(self, rows: Iterable[List[str]]) -> None:
+        """Settle each date column's format from a sample of data rows."""
+        samples: Dict[str, List[str]] = {c: [] for c in self.date_parsers}
+        for row in rows:
+            values = self.values(row)
+            for c, bucket in samples.items():
+                if values[c] and len(bucket) < _DATE_SAMPLE_SIZE:
+                    bucket.append(values[c])
+        for c, parser in self.date_parsers.items():
+            parser.learn(samples[c])
+
+    def values(self, row: List[str]) -> Dict[str, str]:
+        """Return the stripped value of every mapped field in *row*.
+
+        Multi-column fields take the first non-empty candidate.
+        """
+        n = len(row)
+        if n >= self._width:
+            values = {c: row[i].strip() for c, i in self._single}
+        else:
+            values = {c: row[i].strip() if i < n else "" for c, i in self._single}
+        for c, indices in self._multi:
+            value = ""
+            for i in indices:
+                if i < n:
+                    value = row[i].strip()
+                    if value:
+                        break
+            values[c] = value
+        return values
+
+    def _wants_comments(self, status: str) -> bool:
+        """Whether a ticket with *status* is open, so needs its latest comment."""
+        return bool(self.comment_cols) and self.statuses[status].is_open
+
+    def build(self, row: List[str]) -> JiraTicket:
+        """Build a populated ticket from one CSV row (comments for open tickets only)."""
+        v = self.values(row)
+        for c, intern in self._interned:
+            v[c] = intern(v[c])
+        t = JiraTicket(**{c: v[c] for c in self._text})
+        if not t.assignee:
+            t.assignee = self.config.default_unassigned
+        for c, parse in self.date_parsers.items():
+            setattr(t, c, parse(v[c]))
+        for c, attr in self._durations:
+            setattr(t, attr, parse_duration_seconds(v[c]))
+
+        if self._story_points and v["story_points"]:
+            try:
+                t.story_points = float(v["story_points"])
+            except ValueError:
+                pass
+
+        if self.is_sn:
+            if self._wants_comments(t.status):
+                t.last_comment_date, t.last_comment_text = _extract_sn_work_notes(row, self.comment_cols)
+            # Boolean / numeric SN fields
+            if self._made_sla:
+                sla_val = v["made_sla"].lower()
+                if sla_val in ("true", "1", "yes"):
+                    t.made_sla = True
+                elif sla_val in ("false", "0", "no"):
+                    t.made_sla = False
+            for c in self._counts:
+                if v[c]:
+                    try:
+                        setattr(t, c, int(float(v[c])))
+                    except ValueError:
+                        pass
+        elif self._wants_comments(t.status):
+            t.last_comment_date, t.last_comment_text = _extract_comments(row, *self._comment_cols)
+
+        t.raw_fields = _raw_fields(self.header_index, row)
+        return t
+
+
+def _tickets_from_rows(rows: Iterable[List[str]], extractor: _RowExtractor) -> Iterator[JiraTicket]:
+    """Convert CSV data rows into JiraTicket objects, one row at a time.
+
+    The first ``_DATE_SAMPLE_ROWS`` rows are buffered so the extractor can
+    learn each date column's format before any ticket is built.
+    """
+    rows = iter(rows)
+    head = list(itertools.islice(rows, _DATE_SAMPLE_ROWS))
+    extractor.learn_dates(head)
+    build = extractor.build
+    for row in itertools.chain(head, rows):
+        # Skip rows that are entirely blank
+        if not "".join(row).strip():
+            continue
+        yield build(row)
+
+
+# Leading columns shown by the dashboard's full ticket table
+_TABLE_COLUMNS = 12
+
+
+def _projected_columns(headers: List[str], lookup: Dict[str, List[int]],
+                       columns: "Optional[str | Iterable[str]]") -> Tuple[Optional[List[int]], List[str]]:
+    """Resolve a ``--columns`` selection to the header positions to keep.
+
+    *columns* is None (keep everything), ``"auto"`` (the columns mapped to
+    ticket fields plus those the full ticket table displays), or header
+    names, matched case-insensitively; a name selects every column that
+    carries it.  Returns the positions (None for all) and the names that
+    matched no column.
+    """
+    if columns is None:
+        return None, []
+    if isinstance(columns, str) and columns == "auto":
+        keep = {i for indices in lookup.values() for i in indices}
+        keep.update(range(min(_TABLE_COLUMNS, len(headers))))
+        return sorted(keep), []
+    by_name: Dict[str, List[int]] = defaultdict(list)
+    for i, h in enumerate(headers):
+        by_name[h.strip().lower()].append(i)
+    keep_list: List[int] = []
+    missing = []
+    for name in columns:
+        positions = by_name.get(name.strip().lower())
+        if positions:
+            keep_list.extend(positions)
+        else:
+            missing.append(name)
+    return sorted(set(keep_list)), missing
+
+
+class IngestSession:
+    """A single read of a CSV export shared by detection, parsing and diagnostics.
+
+    The input is opened and decoded once.  The header row is read up front
+    so the source can be auto-detected (when no *config* is given), and the
+    same CSV reader then feeds ``tickets()``; nothing is read twice.
+
+    Plain files are read through ``mmap`` (see ``_MappedExport``), so the
+    tickets' raw rows can leave their long free-text cells in the file.
+    *columns* projects the raw rows (see ``_projected_columns``); cells
+    outside the projection are dropped as soon as a row is tokenised.
+
+    Use as a context manager, or call ``close()`` when done.
+    """
+
+    def __init__(self, path: "str | _Input", config: Optional[SourceConfig] = None,
+                 columns: "Optional[str | Iterable[str]]" = None):
+        self.path = path if isinstance(path, (_ZipMember, _Stdin)) else Path(path)
+        self.mapped = _MappedExport.open(self.path)
+        self._fh: Optional[io.TextIOWrapper] = None
+        if self.mapped is not None:
+            self.encoding = self.mapped.encoding
+            self._reader: Iterator[List[str]] = self.mapped.rows(self.mapped.start, len(self.mapped.mm))
+        else:
+            self._fh = _open_text(self.path)
+            self.encoding = self._fh.encoding
+            self._reader = csv.reader(self._fh)
+        try:
+            self.headers: List[str] = list(next(self._reader))
+        except StopIteration:
+            self.headers = []
+        self.detected = config is None
+        if config is None:
+            detected = _detect_source(self.headers)
+            config = _servicenow_config() if detected == "servicenow" else _jira_config()
+        self.config = config
+        self.schema = compile_schema(self.headers, config)
+        self.lookup = self.schema.lookup
+        self.keep, self.missing_columns = _projected_columns(self.headers, self.lookup, columns)
+        self.extractor = _RowExtractor(self.headers, config, self.lookup, self.keep)
+        self.comment_cols = self.extractor.comment_cols
+        self.first_raw_row: Optional[List[str]] = None
+
+    def __enter__(self) -> "IngestSession":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+        # Rows that kept cells in the map have it mapped again on demand
+        if self.mapped is not None:
+            self.mapped.close()
+
+    def _rows(self) -> Iterator[List[str]]:
+        for row in self._reader:
+            if self.first_raw_row is None and any(cell.strip() for cell in row):
+                self.first_raw_row = list(row)
+            yield row
+
+    def tickets(self, workers: int = 1) -> Iterator[JiraTicket]:
+        """Yield the export's tickets.  The underlying stream is consumed.
+
+        With *workers* > 1 the rows are parsed by a process pool (see
+        ``_parse_parallel``); the tickets are the same either way.
+        """
+        if not self.headers:
+            return iter(())
+        if workers > 1:
+            return iter(_parse_parallel(self, workers))
+        return _tickets_from_rows(self._rows(), self.extractor)
+
+    def frame(self, workers: int = 1) -> "TicketFrame":
+        """Read the export into a ``TicketFrame``; tickets are not retained."""
+        frame = TicketFrame.from_tickets(self.tickets(workers), self.config, self.extractor.dictionaries)
+        frame.date_formats = {c: p.fmt for c, p in self.extractor.date_parsers.items()}
+        frame.header_index = self.extractor.header_index
+        frame.missing_columns = list(self.missing_columns)
+        return frame
+
+    def patch_frame(self, previous: "TicketFrame") -> Optional["TicketFrame"]:
+        """Read the export into a frame, reusing *previous* for unchanged rows.
+
+        *previous* must come from an earlier version of the same export.
+        Rows whose fingerprint is found in its ``row_hashes`` are copied
+        across in runs instead of being parsed; only new and edited rows
+        go through the extractor (all of them when *previous* has no
+        fingerprints).  Returns None when the header row, the column
+        projection or a learned date format differs from *previous*, since
+        its parsed values could then differ from a fresh parse.
+        """
+        index = self.extractor.header_index
+        if (previous.header_index is None or index.headers != previous.header_index.headers
+                or index.keep != previous.header_index.keep):
+            return None
+        rows = self._rows()
+        head = list(itertools.islice(rows, _DATE_SAMPLE_ROWS))
+        self.extractor.learn_dates(head)
+        formats = {c: p.fmt for c, p in self.extractor.date_parsers.items()}
+        if formats.keys() != previous.date_formats.keys():
+            return None
+        for name, fmt in previous.date_formats.items():
+            # A column with no dates yet may learn its format from new rows
+            if fmt != formats[name] and (fmt is not None or any(
+                    v != _NA_INT for v in previous.dates.get(name, ()))):
+                return None
+
+        # Start from previous's dictionaries so its codes stay valid
+        frame = TicketFrame(self.config, {name: _Dictionary(cat.values)
+                                          for name, cat in previous.categories.items()})
+        frame.date_formats = formats
+        frame.header_index = index
+        frame.missing_columns = list(self.missing_columns)
+        frame.row_hashes = array("q")
+        reuse = {h: i for i, h in enumerate(previous.row_hashes or ())}
+        build = self.extractor.build
+        run_start = run_stop = 0
+        run_rows: List[Mapping[str, str]] = []
+        for row in itertools.chain(head, rows):
+            # "\x1f" counts as whitespace, so this is also the blank-row test
+            joined = "\x1f".join(row)
+            if not joined.strip():
+                continue
+            fingerprint = _row_fingerprint(joined)
+            i = reuse.get(fingerprint)
+            frame.reused += i is not None
+            if i is not None and i == run_stop:
+                run_stop += 1
+                run_rows.append(_raw_fields(index, row))
+            else:
+                frame.append_range(previous, run_start, run_stop, run_rows)
+                run_rows = []
+                if i is None:
+                    run_start = run_stop = 0
+                    frame.append(build(row))
+                else:
+                    run_start, run_stop = i, i + 1
+                    run_rows.append(_raw_fields(index, row))
+            frame.row_hashes.append(fingerprint)
+        frame.append_range(previous, run_start, run_stop, run_rows)
+        return frame
+
+    def report_detection(self) -> None:
+        """Print the auto-detection scores for ``--verbose``."""
+        _report_detection(self.headers, self.config)
+
+    def report_parse(self, tickets: "List[JiraTicket] | TicketFrame | _StreamedTickets") -> None:
+        """Print column mapping and sample-row diagnostics for ``--verbose``."""
+        print(f"Parsed {len(tickets)} tickets from {self.path} (source: {self.config.display_name})")
+        mapped = {c: indices for c, indices in self.lookup.items() if indices}
+        unmapped = [c for c, indices in self.lookup.items() if not indices]
+        print(f"  Columns mapped ({len(mapped)}): {', '.join(sorted(mapped))}")
+        if unmapped:
+            print(f"  Columns NOT mapped: {', '.join(sorted(unmapped))}")
+        print(f"  Comment/work-notes columns: {len(self.comment_cols)}")
+        for c, parser in self.extractor.date_parsers.items():
+            print(f"  Date column {c!r}: format {parser.fmt!r}, "
+                  f"{parser.hits} hits, {parser.fallbacks} fallbacks, {parser.misses} unparsed")
+        print(f"  CSV headers (first 5): {self.headers[:5]}")
+        if isinstance(tickets, _StreamedTickets):
+            t0, statuses, created_count = tickets.first, tickets.statuses, tickets.created_count
+        else:
+            t0 = tickets[0] if len(tickets) else None
+            statuses = set(t.status for t in tickets if t.status)
+            created_count = sum(1 for t in tickets if t.created is not None)
+        # Show sample data from first ticket for key diagnostic fields
+        if t0 is not None:
+            # Show raw CSV values for date columns to diagnose parsing
+            def _raw_val(canonical: str) -> str:
+                if self.first_raw_row is None:
+                    return "N/A"
+                for idx in self.lookup.get(canonical, []):
+                    if idx < len(self.first_raw_row) and self.first_raw_row[idx].strip():
+                        return self.first_raw_row[idx].strip()
+                return "(empty)"
+            print(f"  Sample ticket: key={t0.key!r}, status={t0.status!r}, "
+                  f"created={t0.created}, assignee={t0.assignee!r}")
+            print(f"  Raw 'created' (opened_at) value: {_raw_val('created')!r}")
+            if self.config.name == "servicenow":
+                print(f"  Raw 'resolved' value: {_raw_val('resolved')!r}")
+                print(f"  Raw 'updated' value: {_raw_val('updated')!r}")
+                print(f"    category={t0.category!r}, assignment_group={t0.assignment_group!r}, "
+                      f"made_sla={t0.made_sla}, issue_type={t0.issue_type!r}")
+            # Show unique status values to diagnose open/closed classification
+            print(f"  Unique status values ({len(statuses)}): {sorted(statuses)[:15]}")
+            print(f"  Tickets with created date: {created_count}/{len(tickets)}")
+            if created_count == 0:
+                # Extra diagnostic: show what columns are mapped to 'created'
+                created_indices = self.lookup.get("created", [])
+                created_headers = [self.headers[i] for i in created_indices if i < len(self.headers)]
+                print(f"  DEBUG 'created' mapped to columns: {created_headers} (indices: {created_indices})")
+
+
+def iter_tickets(path: "str | Path", config: SourceConfig) -> Iterator[JiraTicket]:
+    """Yield tickets from a CSV export row by row.
+
+    The file is decoded incrementally and each row is turned into a
+    ``JiraTicket`` as soon as it is read, so neither the raw bytes nor the
+    decoded text of the whole export are ever held in memory.
+    """
+    with IngestSession(path, config) as session:
+        yield from session.tickets()
+
+
+def _parse_csv(filepath: str, config: SourceConfig, verbose: bool = False,
+               workers: int = 1) -> List[JiraTicket]:
+    """Parse a CSV export into a list of JiraTicket objects using the given config."""
+    with IngestSession(filepath, config) as session:
+        tickets = list(session.tickets(workers))
+        if verbose:
+            session.report_parse(tickets)
+    return tickets
+
+
+def parse_jira_csv(filepath: str, verbose: bool = False, config: Optional[SourceConfig] = None) -> List[JiraTicket]:
+    """Parse a Jira CSV export into a list of JiraTicket objects.
+
+    Backwards-compatible wrapper around ``_parse_csv``.
+    """
+    if config is None:
+        config = _jira_config()
+    return _parse_csv(filepath, config, verbose=verbose)
+
+
+# ---------------------------------------------------------------------------
+# Parallel parsing
+# ---------------------------------------------------------------------------
+
+# Exports smaller than this per chunk are not worth a worker process
+_MIN_CHUNK_BYTES = 1 << 20
+_CHUNKS_PER_WORKER = 4
+# Appended after a chunk's last line to check that it ends between records
+_CHUNK_SENTINEL = "\ue000jira-dashboard-chunk-end\ue000"
+
+
+def _record_boundaries(path: Path, start: int, end: int, count: int) -> List[int]:
+    """Split bytes ``[start, end)`` of a CSV file into up to *count* chunks.
+
+    Each cut is placed just after the first newline past an even split
+    point at which an even number of ``"`` bytes have been seen since
+    *start*, i.e. outside any quoted (possibly multi-line) cell.  Quotes
+    and newlines are single bytes in UTF-8 and cp1252 alike, so the bytes
+    can be scanned undecoded.  Returns the chunk offsets including
+    *start* and *end*.
+    """
+    bounds = [start]
+    if count < 2 or end - start < 2 * _MIN_CHUNK_BYTES:
+        return bounds + [end]
+    step = max((end - start) // count, _MIN_CHUNK_BYTES)
+    with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos, quotes = start, 0
+        for target in range(start + step, end, step):
+            if target <= pos:
+                continue
+            quotes += mm[pos:target].count(b'"')
+            pos = target
+            while True:
+                newline = mm.find(b"\n", pos, end)
+                if newline < 0:
+                    return bounds + [end]
+                quotes += mm[pos:newline + 1].count(b'"')
+                pos = newline + 1
+                if quotes % 2 == 0:
+                    break
+            if pos >= end:
+                break
+            bounds.append(pos)
+    return bounds + [end]
+
+
+def _parse_chunk(task: Tuple[Any, ...]) -> Tuple[bool, List[JiraTicket], Dict[str, Tuple[int, int, int]]]:
+    """Parse one byte range of an export in a worker process.
+
+    Returns ``(ok, tickets, date_counters)``.  ``ok`` is False when the
+    chunk turned out not to end on a record boundary (quote parity can be
+    fooled by a stray ``"`` inside an unquoted cell), in which case the
+    caller parses serially instead.  Raw rows come back as ``(cells,
+    start, end)`` with their large cells left out (a negative *start* if
+    none were), for the caller to re-attach to its own map.
+    """
+    path, encoding, start, end, headers, keep, config, formats, skip_header, check_end = task
+    source = _MappedExport(Path(path))
+    source.encoding = encoding
+    reader = source.rows(start, end, [_CHUNK_SENTINEL + "\n"] if check_end else ())
+    if skip_header:
+        next(reader, None)
+
+    extractor = _RowExtractor(headers, config, keep=keep)
+    for c, fmt in formats.items():
+        extractor.date_parsers[c].use(fmt)
+    tickets = []
+    last: List[str] = []
+    for row in reader:
+        last = row
+        if check_end and row == [_CHUNK_SENTINEL]:
+            continue
+        if not "".join(row).strip():
+            continue
+        t = extractor.build(row)
+        raw = t.raw_fields
+        t.raw_fields = ((raw._row, raw._start, raw._end) if type(raw) is _MappedRawFields  # type: ignore
+                        else (raw._row, -1, -1))
+        tickets.append(t)
+    ok = not check_end or last == [_CHUNK_SENTINEL]
+    counters = {c: (p.hits, p.fallbacks, p.misses) for c, p in extractor.date_parsers.items()}
+    return ok, tickets, counters
+
+
+def _parse_parallel(session: "IngestSession", workers: int) -> List[JiraTicket]:
+    """Parse the rest of *session*'s export with a pool of *workers* processes.
+
+    The date formats are learned here from the leading rows, exactly as in
+    a serial parse, and handed to every worker.  Each worker decodes and
+    parses its own byte range; results come back in file order with their
+    raw rows re-attached to the session's header index and map, so the tickets
+    are identical to ``_tickets_from_rows``.  Inputs too small to split,
+    and chunks whose boundary check fails, are parsed serially.
+    """
+    extractor = session.extractor
+    head = list(itertools.islice(session._rows(), _DATE_SAMPLE_ROWS))
+
+    def serial() -> List[JiraTicket]:
+        return list(_tickets_from_rows(itertools.chain(head, session._rows()), extractor))
+
+    source = session.mapped
+    if source is None:
+        return serial()
+    path = session.path
+    start, end = source.start, len(source.mm)
+    bounds = _record_boundaries(path, start, end, workers * _CHUNKS_PER_WORKER)
+    if len(bounds) <= 2:
+        return serial()
+
+    extractor.learn_dates(head)
+    formats = {c: p.fmt for c, p in extractor.date_parsers.items()}
+    tasks = [(str(path), session.encoding, a, b, session.headers, session.keep, session.config,
+              formats, i == 0, b != end)
+             for i, (a, b) in enumerate(zip(bounds, bounds[1:]))]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(_parse_chunk, tasks))
+    if not all(ok for ok, _, _ in results):
+        return serial()
+
+    tickets: List[JiraTicket] = []
+    index = extractor.header_index
+    for _, chunk, counters in results:
+        for t in chunk:
+            cells, a, b = t.raw_fields
+            t.raw_fields = _RawFields(index, cells) if a < 0 else _MappedRawFields(index, cells, source, a, b)
+        tickets.extend(chunk)
+        for c, (hits, fallbacks, misses) in counters.items():
+            parser = extractor.date_parsers[c]
+            parser.hits += hits
+            parser.fallbacks += fallbacks
+            parser.misses += misses
+    return tickets
+
+
+def _natural_key(path: Path) -> List[Any]:
+    """Sort key that orders ``export-2.csv`` before ``export-10.csv``."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", str(path))]
+
+
+def _expand_inputs(patterns: List[str]) -> Tuple[List[_Input], List[str]]:
+    """Resolve CLI inputs, expanding globs the shell left unexpanded.
+
+    Returns the input files in order (each glob's matches in natural
+    order, duplicates dropped) and the inputs that matched nothing.  A zip
+    archive contributes each CSV it holds as a separate input, and ``-``
+    stands for standard input.  Raises ValueError for a zip archive
+    without any CSV.
+    """
+    inputs: List[_Input] = []
+    missing: List[str] = []
+    seen = set()
+    for pattern in patterns:
+        if pattern == "-":
+            matches: List[Path] = []
+        elif Path(pattern).exists() or not any(ch in pattern for ch in "*?["):
+            matches = [Path(pattern)] if Path(pattern).exists() else []
+        else:
+            matches = sorted((Path(m) for m in glob.glob(pattern)), key=_natural_key)
+        expanded: List[_Input] = [_STDIN] if pattern == "-" else []
+        for path in matches:
+            if path.is_file() and _compression(path) == "zip":
+                members = _zip_members(path)
+                if not members:
+                    raise ValueError(f"{path}: archive contains no .csv files")
+                expanded.extend(members)
+            else:
+                expanded.append(path)
+        if not expanded:
+            missing.append(pattern)
+        for source in expanded:
+            if isinstance(source, _ZipMember):
+                key: Any = (source.archive.resolve(), source.member)
+            else:
+                key = source if isinstance(source, _Stdin) else source.resolve()
+            if key not in seen:
+                seen.add(key)
+                inputs.append(source)
+    return inputs, missing
+
+
+def _report_detection(headers: List[str], config: SourceConfig) -> None:
+    """Print the auto-detection scores of a header row for ``--verbose``."""
+    jira_hits, custom_fields, sn_hits = _detection_hits(headers)
+    print(f"Auto-detected source: {config.display_name}")
+    print(f"  Jira score: {len(jira_hits) + custom_fields} (headers: {jira_hits}, custom fields: {custom_fields})")
+    print(f"  ServiceNow score: {len(sn_hits)} (headers: {sn_hits[:10]}{'...' if len(sn_hits) > 10 else ''})")
+    if headers:
+        print(f"  First header: {headers[0]!r}")
+
+
+def _read_headers(path: _Input) -> List[str]:
+    """The header row of an export, read without mapping or parsing the rest."""
+    with _open_text(path) as fh:
+        return next(csv.reader(fh), [])
+
+
+def _parse_file(task: Tuple[_Input, Optional[SourceConfig], Any]) -> Tuple[str, List[JiraTicket], List[str]]:
+    """Parse one whole export (in a worker process for multi-file ingest).
+
+    Returns the source name (detected from the export's own header when
+    no config is given), the tickets and the *columns* it does not have.
+    """
+    path, config, columns = task
+    with IngestSession(path, config, columns) as session:
+        return session.config.name, list(session.tickets()), session.missing_columns
+
+
+def _dedupe_tickets(tickets: Iterable[JiraTicket]) -> Tuple[List[JiraTicket], int]:
+    """Keep one ticket per key: the most recently updated copy.
+
+    On equal (or missing) ``updated`` dates the later copy wins, since
+    later exports are normally the newer ones.  A ticket keeps the position
+    of its key's first appearance; tickets without a key are all kept.
+    Returns the tickets and how many copies were dropped.
+    """
+    result: List[JiraTicket] = []
+    position: Dict[str, int] = {}
+    dropped = 0
+    for t in tickets:
+        if not t.key:
+            result.append(t)
+            continue
+        i = position.get(t.key)
+        if i is None:
+            position[t.key] = len(result)
+            result.append(t)
+            continue
+        dropped += 1
+        kept = result[i]
+        if kept.updated is None or (t.updated is not None and t.updated >= kept.updated):
+            result[i] = t
+    return result, dropped
+
+
+def _ingest_files(paths: List[_Input], config: Optional[SourceConfig], workers: int, verbose: bool = False,
+                  columns: "Optional[str | Iterable[str]]" = None) -> Tuple[SourceConfig, List[JiraTicket]]:
+    """Parse several exports of one project into a single de-duplicated list.
+
+    When *config* is None the source is detected for every file, and a
+    ValueError is raised unless they all agree.  Files are parsed concurrently by up to
+    *workers* processes, so the wall time approaches that of the largest
+    file; the tickets are combined in input order.  *columns* projects
+    every file's raw rows, as for ``IngestSession``, and the names a file
+    lacks are warned about on stderr.  Standard input is parsed in this
+    process.  The source is detected from the first input's header row
+    alone, unless that input can only be read once: it is then parsed from
+    the same read.
+    """
+    per_file: List[Optional[Tuple[str, List[JiraTicket], List[str]]]] = [None] * len(paths)
+    detect = config is None
+    if config is None and _is_regular_input(paths[0]):
+        headers = _read_headers(paths[0])
+        config = _servicenow_config() if _detect_source(headers) == "servicenow" else _jira_config()
+        if verbose:
+            _report_detection(headers, config)
+    elif config is None:
+        with IngestSession(paths[0], columns=columns) as session:
+            if verbose:
+                session.report_detection()
+            config = session.config
+            per_file[0] = (config.name, list(session.tickets()), session.missing_columns)
+    tasks = {i: (path, None if detect else config, columns) for i, path in enumerate(paths) if per_file[i] is None}
+    workers = min(workers, len(tasks))
+    if workers > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {i: pool.submit(_parse_file, task) for i, task in tasks.items()
+                       if not isinstance(task[0], _Stdin)}
+            for i, task in tasks.items():
+                if i not in futures:
+                    per_file[i] = _parse_file(task)
+            for i, future in futures.items():
+                per_file[i] = future.result()
+    else:
+        for i, task in tasks.items():
+            per_file[i] = _parse_file(task)
+    for path, (source, _, _) in zip(paths, per_file):
+        if source != config.name:
+            other = _servicenow_config() if source == "servicenow" else _jira_config()
+            raise ValueError(f"{path} looks like a {other.display_name} export but {paths[0]} like a "
+                             f"{config.display_name} one; use --source to read them all as one format")
+    for path, (_, _, missing) in zip(paths, per_file):
+        if missing:
+            print(f"Warning: --columns not found in {path.name}: {', '.join(missing)}", file=sys.stderr)
+    tickets, dropped = _dedupe_tickets(itertools.chain.from_iterable(chunk for _, chunk, _ in per_file))
+    if verbose:
+        for path, (_, chunk, _) in zip(paths, per_file):
+            print(f"Parsed {len(chunk)} tickets from {path}")
+        print(f"Merged {len(tickets)} tickets from {len(paths)} files "
+              f"({dropped} duplicate keys dropped, source: {config.display_name})")
+    return config, tickets
+
+
+# ---------------------------------------------------------------------------
+# Columnar ticket store
+# ---------------------------------------------------------------------------
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_US_PER_DAY = 86_400_000_000
+# Missing-value sentinel for the integer (date and count) columns
+_NA_INT = -(1 << 63)
+
+# TicketFrame column layout, by JiraTicket attribute
+_FRAME_DATES = ("created", "updated", "resolved", "due_date", "closed_at", "last_comment_date")
+_FRAME_FLOATS = ("story_points",)
+_FRAME_INTS = ("original_estimate_secs", "time_spent_secs", "remaining_estimate_secs",
+               "business_duration_secs", "reassignment_count", "reopen_count")
+_FRAME_TEXT = ("key", "summary", "fix_versions", "resolution", "epic_link", "sprint",
+               "project", "parent", "last_comment_text", "impact", "urgency",
+               "close_notes", "severity", "active")
+
+
+def _to_micros(dt: Optional[datetime]) -> int:
+    """Naive datetime -> epoch microseconds (``_NA_INT`` for None)."""
+    if dt is None:
+        return _NA_INT
+    return (dt - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(us: int) -> Optional[datetime]:
+    if us == _NA_INT:
+        return None
+    return _EPOCH + timedelta(microseconds=us)
+
+
+class _Categorical:
+    """Integer-coded string column: ``values[codes[i]]`` is row *i*'s value.
+
+    The ``_Dictionary`` may be shared with the parser that interned the
+    values, in which case codes follow the parser's first-appearance order.
+    """
+    __slots__ = ("codes", "dictionary")
+
+    def __init__(self, dictionary: Optional[_Dictionary] = None) -> None:
+        self.codes = array("i")
+        self.dictionary = dictionary if dictionary is not None else _Dictionary()
+
+    @property
+    def values(self) -> List[str]:
+        return self.dictionary.values
+
+    def append(self, value: str) -> None:
+        self.codes.append(self.dictionary.code(value))
+
+    def __getitem__(self, i: int) -> str:
+        return self.values[self.codes[i]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class TicketFrame:
+    """Columnar store of parsed tickets, for the metrics engine.
+
+    Dates are ``array('q')`` epoch-microsecond columns — integers rather
+    than float seconds so that every age and duration computed from them
+    matches ``datetime`` arithmetic bit for bit.  The ``_CATEGORICAL_FIELDS``
+    are integer-coded ``_Categorical`` columns, ``is_open``/``is_blocked``
+    are byte flags, and the remaining fields
+    are numeric arrays or plain string lists.  Missing values use
+    ``_NA_INT``, NaN, or ``-1`` for ``made_sla``.
+
+    ``compute_dashboard_data`` accepts a frame in place of a ticket list
+    and produces the same ``DashboardData``.
+    """
+
+    def __init__(self, config: SourceConfig, dictionaries: Optional[Dict[str, _Dictionary]] = None):
+        self.config = config
+        dictionaries = dictionaries or {}
+        self.dates = {name: array("q") for name in _FRAME_DATES}
+        self.categories = {name: _Categorical(dictionaries.get(name)) for name in _CATEGORICAL_FIELDS}
+        self.floats = {name: array("d") for name in _FRAME_FLOATS}
+        self.ints = {name: array("q") for name in _FRAME_INTS}
+        self.made_sla = array("b")
+        self.text: Dict[str, List[str]] = {name: [] for name in _FRAME_TEXT}
+        self.raw_fields: List[Mapping[str, str]] = []
+        self.is_open = bytearray()
+        self.is_blocked = bytearray()
+        self.statuses = _status_classifier(config)
+        # Parse provenance, used by the parse cache: the export's header
+        # index (None unless every raw row is viewed through it), learned
+        # date formats, per-row fingerprints of the unprojected rows and
+        # the requested columns the export lacks
+        self.header_index: Optional[_HeaderIndex] = None
+        self.date_formats: Dict[str, Optional[str]] = {}
+        self.row_hashes: Optional[array] = None
+        self.missing_columns: List[str] = []
+        self.reused = 0
+
+    @classmethod
+    def from_tickets(cls, tickets: Iterable[JiraTicket], config: SourceConfig,
+                     dictionaries: Optional[Dict[str, _Dictionary]] = None) -> "TicketFrame":
+        frame = cls(config, dictionaries)
+        for t in tickets:
+            frame.append(t)
+        return frame
+
+    def __len__(self) -> int:
+        return len(self.is_open)
+
+    def append(self, t: JiraTicket) -> None:
+        """Add one ticket's values to the end of every column."""
+        for name, col in self.dates.items():
+            col.append(_to_micros(getattr(t, name)))
+        for name, cat in self.categories.items():
+            cat.append(getattr(t, name))
+        for name, fcol in self.floats.items():
+            value = getattr(t, name)
+            fcol.append(float("nan") if value is None else value)
+        for name, icol in self.ints.items():
+            value = getattr(t, name)
+            icol.append(_NA_INT if value is None else value)
+        self.made_sla.append(-1 if t.made_sla is None else int(t.made_sla))
+        for name, tcol in self.text.items():
+            tcol.append(getattr(t, name))
+        self.raw_fields.append(t.raw_fields)
+        flags = self.statuses[t.status]
+        self.is_open.append(flags.is_open)
+        self.is_blocked.append(flags.is_blocked)
+
+    def append_range(self, other: "TicketFrame", start: int, stop: int,
+                     raw_fields: List[Mapping[str, str]]) -> None:
+        """Copy rows ``start:stop`` of *other* onto the end of this frame.
+
+        *other* must have the same config, and its category dictionaries
+        must be prefixes of this frame's so codes can be copied as-is.
+        *raw_fields* replaces the copied rows' raw fields.
+        """
+        if start == stop:
+            return
+        for group, cols in ((self.dates, other.dates), (self.floats, other.floats),
+                            (self.ints, other.ints)):
+            for name, col in group.items():
+                col.frombytes(_byte_range(cols[name], start, stop))
+        for name, cat in self.categories.items():
+            cat.codes.frombytes(_byte_range(other.categories[name].codes, start, stop))
+        self.made_sla.frombytes(_byte_range(other.made_sla, start, stop))
+        for name, tcol in self.text.items():
+            tcol.extend(other.text[name][start:stop])
+        self.raw_fields.extend(raw_fields)
+        self.is_open += _byte_range(other.is_open, start, stop)
+        self.is_blocked += _byte_range(other.is_blocked, start, stop)
+
+    def ticket(self, i: int) -> JiraTicket:
+        """Rebuild row *i* as a JiraTicket."""
+        if i < 0:
+            i += len(self)
+        t = JiraTicket(**{name: col[i] for name, col in self.text.items()},
+                       **{name: cat[i] for name, cat in self.categories.items()})
+        for name, col in self.dates.items():
+            setattr(t, name, _from_micros(col[i]))
+        for name, fcol in self.floats.items():
+            value = fcol[i]
+            setattr(t, name, None if value != value else value)
+        for name, icol in self.ints.items():
+            value = icol[i]
+            setattr(t, name, None if value == _NA_INT else value)
+        sla = self.made_sla[i]
+        t.made_sla = None if sla < 0 else bool(sla)
+        t.raw_fields = self.raw_fields[i]
+        return t
+
+    __getitem__ = ticket
+
+    def __iter__(self) -> Iterator[JiraTicket]:
+        for i in range(len(self)):
+            yield self.ticket(i)
+
+
+# ---------------------------------------------------------------------------
+# Parse cache
+# ---------------------------------------------------------------------------
+
+_CACHE_MAGIC = b"JDCACHE\x00"
+# Bump when the file layout or anything that changes parsed values does
+_CACHE_VERSION = 6
+# Characters tried, in order, as string separators within a cache file
+_CACHE_SEPARATORS = ("\x00", "\x1f", "\x1e", "\x1d", "\x1c", "\ufffe", "\uffff")
+_CACHE_HEADER = struct.Struct("<8sQ")
 
-    Handles the edge case where a file has a UTF-8 BOM but cp1252 body content
-    (common with ServiceNow/Windows exports that contain special characters).
-    """
-    # Read raw bytes once
-    raw = path.read_bytes()
-    # Strip UTF-8 BOM if present, regardless of actual encoding
-    if raw[:3] == b"\xef\xbb\xbf":
-        raw = raw[3:]
-    for enc in ("utf-8", "cp1252", "latin-1"):
-        try:
-            return raw.decode(enc)
-        except (UnicodeDecodeError, ValueError):
-            continue
-    return raw.decode("utf-8", errors="replace")
 
+def _default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "jira-dashboard"
 
-def _parse_csv(filepath: str, config: SourceConfig, verbose: bool = False) -> List[JiraTicket]:
-    """Parse a CSV export into a list of JiraTicket objects using the given config."""
-    path = Path(filepath)
-    content = _read_file(path)
-    reader = csv.reader(io.StringIO(content))
-    try:
-        headers = next(reader)
-    except StopIteration:
-        return []
 
-    lookup = _build_alias_lookup(headers, config.column_aliases)
-    is_sn = config.name == "servicenow"
-    if is_sn:
-        comment_cols = _find_work_notes_columns(headers)
-    else:
-        comment_cols = _find_comment_columns(headers)
-    tickets: List[JiraTicket] = []
-    first_raw_row: Optional[List[str]] = None
+def _config_fingerprint(config: SourceConfig) -> str:
+    """Digest of everything in *config*, so edited aliases or statuses miss."""
+    payload = json.dumps(asdict(config), sort_keys=True, default=sorted)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
 
-    def _get(row: List[str], canonical: str) -> str:
-        """Return the first non-empty value across all candidate columns."""
-        for idx in lookup.get(canonical, []):
-            if idx < len(row) and row[idx].strip():
-                return row[idx].strip()
-        return ""
 
-    for row_num, row in enumerate(reader, start=2):
-        if not any(cell.strip() for cell in row):
-            continue
-        if first_raw_row is None:
-            first_raw_row = list(row)
-        t = JiraTicket()
-        t.key = _get(row, "key")
-        t.summary = _get(row, "summary")
-        t.status = _get(row, "status")
-        t.assignee = _get(row, "assignee") or config.default_unassigned
-        t.reporter = _get(row, "reporter")
-        t.priority = _get(row, "priority")
-        t.issue_type = _get(row, "issue_type")
-        t.created = parse_date(_get(row, "created"))
-        t.updated = parse_date(_get(row, "updated"))
-        t.resolved = parse_date(_get(row, "resolved"))
-        t.due_date = parse_date(_get(row, "due_date"))
-        t.labels = _get(row, "labels")
-        t.components = _get(row, "components")
-        t.fix_versions = _get(row, "fix_versions")
-        t.resolution = _get(row, "resolution")
-        t.epic_link = _get(row, "epic_link")
-        t.sprint = _get(row, "sprint")
-        t.project = _get(row, "project")
-        t.parent = _get(row, "parent")
-
-        sp = _get(row, "story_points")
-        if sp:
-            try:
-                t.story_points = float(sp)
-            except ValueError:
-                pass
+def _file_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
 
-        t.original_estimate_secs = parse_duration_seconds(_get(row, "original_estimate"))
-        t.time_spent_secs = parse_duration_seconds(_get(row, "time_spent"))
-        t.remaining_estimate_secs = parse_duration_seconds(_get(row, "remaining_estimate"))
-
-        if is_sn:
-            t.last_comment_date, t.last_comment_text = _extract_sn_work_notes(row, comment_cols)
-            # ServiceNow-specific fields
-            t.category = _get(row, "category")
-            t.subcategory = _get(row, "subcategory")
-            t.assignment_group = _get(row, "assignment_group")
-            t.contact_type = _get(row, "contact_type")
-            t.impact = _get(row, "impact")
-            t.urgency = _get(row, "urgency")
-            t.escalation = _get(row, "escalation")
-            t.close_notes = _get(row, "close_notes")
-            t.closed_at = parse_date(_get(row, "closed_at"))
-            t.severity = _get(row, "severity")
-            t.active = _get(row, "active")
-            # Boolean / numeric SN fields
-            sla_val = _get(row, "made_sla").lower()
-            if sla_val in ("true", "1", "yes"):
-                t.made_sla = True
-            elif sla_val in ("false", "0", "no"):
-                t.made_sla = False
-            bd = _get(row, "business_duration")
-            if bd:
-                t.business_duration_secs = parse_duration_seconds(bd)
-            rc = _get(row, "reassignment_count")
-            if rc:
-                try:
-                    t.reassignment_count = int(float(rc))
-                except ValueError:
-                    pass
-            roc = _get(row, "reopen_count")
-            if roc:
-                try:
-                    t.reopen_count = int(float(roc))
-                except ValueError:
-                    pass
-        else:
-            t.last_comment_date, t.last_comment_text = _extract_comments(row, comment_cols)
 
-        for i, h in enumerate(headers):
-            if i < len(row):
-                t.raw_fields[h] = row[i]
+def _row_fingerprint(joined: str) -> int:
+    """Stable 64-bit digest of one raw CSV row, given as ``"\\x1f".join(row)``."""
+    digest = hashlib.blake2b(joined.encode("utf-8", "surrogatepass"), digest_size=8)
+    return int.from_bytes(digest.digest(), "little", signed=True)
 
-        tickets.append(t)
 
-    if verbose:
-        print(f"Parsed {len(tickets)} tickets from {filepath} (source: {config.display_name})")
-        mapped = {c: indices for c, indices in lookup.items() if indices}
-        unmapped = [c for c, indices in lookup.items() if not indices]
-        print(f"  Columns mapped ({len(mapped)}): {', '.join(sorted(mapped))}")
-        if unmapped:
-            print(f"  Columns NOT mapped: {', '.join(sorted(unmapped))}")
-        print(f"  Comment/work-notes columns: {len(comment_cols)}")
-        print(f"  CSV headers (first 5): {headers[:5]}")
-        # Show sample data from first ticket for key diagnostic fields
-        if tickets:
-            t0 = tickets[0]
-            # Show raw CSV values for date columns to diagnose parsing
-            def _raw_val(canonical: str) -> str:
-                if first_raw_row is None:
-                    return "N/A"
-                for idx in lookup.get(canonical, []):
-                    if idx < len(first_raw_row) and first_raw_row[idx].strip():
-                        return first_raw_row[idx].strip()
-                return "(empty)"
-            print(f"  Sample ticket: key={t0.key!r}, status={t0.status!r}, "
-                  f"created={t0.created}, assignee={t0.assignee!r}")
-            print(f"  Raw 'created' (opened_at) value: {_raw_val('created')!r}")
-            if is_sn:
-                print(f"  Raw 'resolved' value: {_raw_val('resolved')!r}")
-                print(f"  Raw 'updated' value: {_raw_val('updated')!r}")
-                print(f"    category={t0.category!r}, assignment_group={t0.assignment_group!r}, "
-                      f"made_sla={t0.made_sla}, issue_type={t0.issue_type!r}")
-            # Show unique status values to diagnose open/closed classification
-            statuses = set(t.status for t in tickets if t.status)
-            print(f"  Unique status values ({len(statuses)}): {sorted(statuses)[:15]}")
-            created_count = sum(1 for t in tickets if t.created is not None)
-            print(f"  Tickets with created date: {created_count}/{len(tickets)}")
-            if created_count == 0 and tickets:
-                # Extra diagnostic: show what columns are mapped to 'created'
-                created_indices = lookup.get("created", [])
-                created_headers = [headers[i] for i in created_indices if i < len(headers)]
-                print(f"  DEBUG 'created' mapped to columns: {created_headers} (indices: {created_indices})")
+def _join_strings(values: List[str], sep: str) -> Optional[str]:
+    """Join *values* with *sep*, or None if *sep* occurs in any value."""
+    text = sep.join(values)
+    return text if text.count(sep) == max(len(values) - 1, 0) else None
 
-    return tickets
 
+def _join_rows(rows: List[List[str]], sep: str, row_sep: str) -> Optional[str]:
+    """Join *rows* of cells, or None if either separator occurs in a cell."""
+    text = row_sep.join([sep.join(row) for row in rows])
+    if text.count(row_sep) != max(len(rows) - 1, 0):
+        return None
+    if text.count(sep) != sum(len(row) - 1 for row in rows if row):
+        return None
+    return text
 
-def parse_jira_csv(filepath: str, verbose: bool = False, config: Optional[SourceConfig] = None) -> List[JiraTicket]:
-    """Parse a Jira CSV export into a list of JiraTicket objects.
 
-    Backwards-compatible wrapper around ``_parse_csv``.
+class _ParseCache:
+    """On-disk cache of parsed exports as ``TicketFrame`` files.
+
+    One file per (export path, requested source, column projection).  The layout is magic,
+    header length, a JSON header padded to 8 bytes, then 8-byte-aligned
+    column blobs at the header's recorded offsets: numeric
+    columns (dates, counts, codes, flags) are raw ``array`` bytes that are
+    memory-mapped back in without copying, and string columns are UTF-8
+    runs joined by a separator character absent from the data, restored
+    with a single ``split``.
+
+    An entry is used when the export's size and mtime match; when only the
+    mtime differs the content digest decides.  The source config's
+    fingerprint and ``_CACHE_VERSION`` must match as well.
+
+    Each entry also keeps a fingerprint per row, so an export that has
+    grown or changed since can be re-ingested incrementally (``refresh``).
     """
-    if config is None:
-        config = _jira_config()
-    return _parse_csv(filepath, config, verbose=verbose)
+
+    def __init__(self, directory: Path, columns: "Optional[str | Iterable[str]]" = None):
+        self.directory = Path(directory)
+        self.columns = columns
+
+    def entry(self, path: Path, source: str) -> Path:
+        columns = self.columns if self.columns is None or isinstance(self.columns, str) else list(self.columns)
+        key = hashlib.blake2b(f"{Path(path).resolve()}\0{source}\0{json.dumps(columns)}".encode("utf-8"),
+                              digest_size=12)
+        return self.directory / f"{key.hexdigest()}.jdc"
+
+    def load(self, path: Path, source: str) -> Optional[TicketFrame]:
+        """Return the cached frame for *path*, or None if absent or stale."""
+        entry = self._open(path, source)
+        if entry is None:
+            return None
+        mm, header, config = entry
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        if header.get("size") != stat.st_size:
+            return None
+        if header.get("mtime_ns") != stat.st_mtime_ns and header.get("digest") != _file_digest(Path(path)):
+            return None
+        return self._read_frame(memoryview(mm), header, config)
+
+    def refresh(self, path: Path, source: str) -> Optional[TicketFrame]:
+        """Re-ingest a changed export, parsing only rows not in the cache.
+
+        Returns the patched frame (and stores it as the new entry), or None
+        when there is no usable entry and a full parse is needed.  The
+        frame's ``reused`` attribute counts the rows taken from the cache.
+        """
+        entry = self._open(path, source)
+        if entry is None:
+            return None
+        mm, header, config = entry
+        previous = self._read_frame(memoryview(mm), header, config, raw_rows=False)
+        stat = Path(path).stat()
+        with IngestSession(path, config, self.columns) as session:
+            frame = session.patch_frame(previous)
+        if frame is not None:
+            self.store(path, source, frame, stat)
+        return frame
+
+    def _open(self, path: Path, source: str) -> Optional[Tuple[mmap.mmap, Dict[str, Any], SourceConfig]]:
+        """Map an entry and check it was written by this code and config."""
+        try:
+            with self.entry(path, source).open("rb") as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        magic, header_len = _CACHE_HEADER.unpack_from(mm, 0) if len(mm) >= _CACHE_HEADER.size else (b"", 0)
+        if magic != _CACHE_MAGIC:
+            return None
+        try:
+            header = json.loads(bytes(mm[_CACHE_HEADER.size:_CACHE_HEADER.size + header_len]))
+        except ValueError:
+            return None
+        header["start"] = _CACHE_HEADER.size + header_len
+        config = _servicenow_config() if header.get("config") == "servicenow" else _jira_config()
+        if (header.get("version") != _CACHE_VERSION
+                or header.get("fingerprint") != _config_fingerprint(config)):
+            return None
+        return mm, header, config
+
+    def store(self, path: Path, source: str, frame: TicketFrame, stat: os.stat_result) -> bool:
+        """Write *frame* as the entry for *path* as it was at *stat*.
+
+        Returns False (writing nothing) for frames the layout cannot hold:
+        rows from more than one header row, or no free separator character.
+        """
+        index = frame.header_index
+        if len(frame) and index is None:
+            return False
+        names = index.headers if index is not None else ()
+        keep = index.keep if index is not None else None
+        raw_rows = [r.cells() for r in frame.raw_fields]
+        row_hashes = frame.row_hashes
+        if row_hashes is None and keep is None:
+            row_hashes = array("q", (_row_fingerprint("\x1f".join(row)) for row in raw_rows))
+        string_columns = ([(f"values.{name}", cat.values) for name, cat in frame.categories.items()]
+                          + [(f"text.{name}", col) for name, col in frame.text.items()])
+        # First separator pair that occurs in none of the strings
+        for sep, row_sep in zip(_CACHE_SEPARATORS, _CACHE_SEPARATORS[1:]):
+            joined = {name: _join_strings(values, sep) for name, values in string_columns}
+            raw = _join_rows(raw_rows, sep, row_sep)
+            if raw is not None and None not in joined.values() and not any(sep in h for h in names):
+                break
+        else:
+            return False
+
+        columns: List[Dict[str, Any]] = []
+        blobs: List[bytes] = []
+        offset = 0
+
+        def add(name: str, data: bytes, **meta: Any) -> None:
+            nonlocal offset
+            columns.append(dict(name=name, offset=offset, length=len(data), **meta))
+            blobs.append(data)
+            offset += len(data)
+            pad = -offset % 8
+            if pad:
+                blobs.append(b"\0" * pad)
+                offset += pad
+
+        def add_strings(name: str) -> None:
+            add(name, joined[name].encode("utf-8", "surrogatepass"), kind="str")
+
+        for group, cols in (("dates", frame.dates), ("floats", frame.floats), ("ints", frame.ints)):
+            for name, col in cols.items():
+                add(f"{group}.{name}", bytes(col), kind="array", typecode=_typecode(col))
+        for name, cat in frame.categories.items():
+            add(f"codes.{name}", bytes(cat.codes), kind="array", typecode=_typecode(cat.codes))
+            add_strings(f"values.{name}")
+        for name in frame.text:
+            add_strings(f"text.{name}")
+        # Projected rows cannot be fingerprinted; the next refresh adds them
+        if row_hashes is not None:
+            add("row_hashes", bytes(row_hashes), kind="array", typecode="q")
+        add("made_sla", bytes(frame.made_sla), kind="array", typecode="b")
+        add("is_open", bytes(frame.is_open), kind="array", typecode="B")
+        add("is_blocked", bytes(frame.is_blocked), kind="array", typecode="B")
+        add("raw", raw.encode("utf-8", "surrogatepass"), kind="rows")
+        # Cell counts per raw row, as "" splits back into one empty cell
+        add("raw_widths", bytes(array("I", map(len, raw_rows))), kind="array", typecode="I")
+
+        header = json.dumps({
+            "version": _CACHE_VERSION, "config": frame.config.name,
+            "fingerprint": _config_fingerprint(frame.config),
+            "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": _file_digest(Path(path)),
+            "rows": len(frame), "separators": [sep, row_sep],
+            "headers": list(names), "keep": None if keep is None else list(keep),
+            "date_formats": frame.date_formats, "missing_columns": frame.missing_columns,
+            "columns": columns,
+        }).encode("utf-8")
+        header += b" " * (-(_CACHE_HEADER.size + len(header)) % 8)
+
+        target = self.entry(path, source)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        with tmp.open("wb") as fh:
+            fh.write(_CACHE_HEADER.pack(_CACHE_MAGIC, len(header)))
+            fh.write(header)
+            for blob in blobs:
+                fh.write(blob)
+        os.replace(tmp, target)
+        return True
+
+    @staticmethod
+    def _read_frame(view: memoryview, header: Dict[str, Any], config: SourceConfig,
+                    raw_rows: bool = True) -> TicketFrame:
+        """Rebuild a frame from a mapped entry.
+
+        With *raw_rows* False the raw rows are left out (``raw_fields`` is
+        empty), which is all ``IngestSession.patch_frame`` needs.
+        """
+        sep, row_sep = header["separators"]
+        n = header["rows"]
+        columns = {c["name"]: c for c in header["columns"]}
+
+        def data(name: str) -> memoryview:
+            c = columns[name]
+            start = header["start"] + c["offset"]
+            return view[start:start + c["length"]]
+
+        def numeric(name: str) -> memoryview:
+            return data(name).cast(columns[name]["typecode"])
+
+        def strings(name: str) -> List[str]:
+            return str(data(name), "utf-8", "surrogatepass").split(sep) if n else []
+
+        frame = TicketFrame(config)
+        for group, cols in (("dates", frame.dates), ("floats", frame.floats), ("ints", frame.ints)):
+            for name in cols:
+                cols[name] = numeric(f"{group}.{name}")
+        for name, cat in frame.categories.items():
+            values = str(data(f"values.{name}"), "utf-8", "surrogatepass")
+            cat.dictionary = _Dictionary(values.split(sep) if n else ())
+            cat.codes = numeric(f"codes.{name}")
+        for name in frame.text:
+            frame.text[name] = strings(f"text.{name}")
+        frame.row_hashes = numeric("row_hashes") if "row_hashes" in columns else None
+        frame.date_formats = header["date_formats"]
+        frame.missing_columns = header["missing_columns"]
+        frame.made_sla = numeric("made_sla")
+        frame.is_open = numeric("is_open")
+        frame.is_blocked = numeric("is_blocked")
+        index = _HeaderIndex(header["headers"], header["keep"])
+        frame.header_index = index
+        if raw_rows and n:
+            raw = str(data("raw"), "utf-8", "surrogatepass").split(row_sep)
+            frame.raw_fields = [_RawFields(index, row.split(sep) if width else [])
+                                for row, width in zip(raw, numeric("raw_widths"))]
+        return frame
+
+
+def _typecode(col: Any) -> str:
+    """Item type of an ``array`` or a memoryview over one."""
+    return col.typecode if isinstance(col, array) else col.format
+
+
+def _byte_range(col: Any, start: int, stop: int) -> memoryview:
+    """Raw bytes of items ``start:stop`` of an array-like column."""
+    return memoryview(col)[start:stop].cast("B")
 
 
 # ---------------------------------------------------------------------------
@@ -748,31 +2656,38 @@ _BLOCKED_STATUSES = {"blocked", "waiting", "on hold", "impediment"}
 
 
 def _is_open(status: str, config: Optional[SourceConfig] = None) -> bool:
-    sl = status.strip().lower()
-    closed = config.closed_statuses if config else _CLOSED_STATUSES
-    open_s = config.open_statuses if config else _OPEN_STATUSES
-    if sl in closed:
-        return False
-    if sl in open_s:
-        return True
-    return True
+    entry = _CONFIG_CLASSIFIERS.get(id(config))
+    if entry is not None and entry[0] is config:
+        return entry[1][status].is_open
+    return _status_classifier(config)[status].is_open
 
 
 def _is_blocked(status: str, config: Optional[SourceConfig] = None) -> bool:
-    blocked = config.blocked_statuses if config else _BLOCKED_STATUSES
-    return status.strip().lower() in blocked
+    entry = _CONFIG_CLASSIFIERS.get(id(config))
+    if entry is not None and entry[0] is config:
+        return entry[1][status].is_blocked
+    return _status_classifier(config)[status].is_blocked
+
+
+_CSV_FIELD_SEP = re.compile(r"[,;]+")
 
 
 def _split_csv_field(value: str) -> List[str]:
     """Split a comma/semicolon-separated Jira field into individual values."""
+    return list(_split_csv_parts(value))
+
+
+@functools.lru_cache(maxsize=65536)
+def _split_csv_parts(value: str) -> Tuple[str, ...]:
+    """``_split_csv_field`` as a tuple, memoised per distinct field value."""
     if not value.strip():
-        return []
+        return ()
     items = []
-    for item in re.split(r"[,;]+", value):
+    for item in _CSV_FIELD_SEP.split(value):
         item = item.strip()
         if item:
             items.append(item)
-    return items
+    return tuple(items)
 
 
 @dataclass
@@ -847,7 +2762,12 @@ def _cluster_descriptions(tickets: List[JiraTicket], max_themes: int = 25) -> Li
     Groups similar descriptions by normalising text and finding common 2-3 word
     phrases (ngrams).  Returns top themes with counts and sample descriptions.
     """
-    descriptions = [t.summary for t in tickets if t.summary and t.summary.strip()]
+    return _cluster_summaries((t.summary for t in tickets), max_themes)
+
+
+def _cluster_summaries(summaries: Iterable[str], max_themes: int = 25) -> List[Dict[str, Any]]:
+    """``_cluster_descriptions`` over an iterable of summary strings."""
+    descriptions = [s for s in summaries if s and s.strip()]
     if not descriptions:
         return []
 
@@ -910,441 +2830,1429 @@ def _cluster_descriptions(tickets: List[JiraTicket], max_themes: int = 25) -> Li
     return used_themes
 
 
-def compute_dashboard_data(tickets: List[JiraTicket], stale_days: int = 14,
-                           now: Optional[datetime] = None,
-                           config: Optional[SourceConfig] = None) -> DashboardData:
-    """Compute all dashboard metrics from parsed tickets."""
-    if now is None:
-        now = datetime.now()
-    if config is None:
-        config = _jira_config()
-
-    d = DashboardData()
-    d.source_type = config.name
-    d.total_tickets = len(tickets)
-
-    open_ages: List[float] = []
-    all_resolution_days: List[float] = []
-    resolution_times_by_type: Dict[str, List[float]] = defaultdict(list)
-    resolution_times_by_priority: Dict[str, List[float]] = defaultdict(list)
-    bucket_labels = ["< 7d", "7–14d", "14–30d", "30–60d", "60–90d", "90d+"]
-    d.age_buckets = {b: 0 for b in bucket_labels}
-
-    # Epic/Sprint tracking
-    epic_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-        "total": 0, "open": 0, "closed": 0, "story_points": 0.0,
-    })
-    sprint_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-        "total": 0, "open": 0, "closed": 0, "story_points": 0.0,
-    })
-
-    # Estimation accuracy tracking
-    estimate_by_type: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: {
-        "estimated": [], "actual": [],
-    })
-
-    # Reporter-Assignee flow
-    ra_flow: Dict[Tuple[str, str], int] = defaultdict(int)
-
-    # Component/Label counting
-    component_counter: Dict[str, int] = defaultdict(int)
-    label_counter: Dict[str, int] = defaultdict(int)
-
-    # ServiceNow-specific accumulators
-    sla_met = 0
-    sla_missed = 0
-    category_counter: Dict[str, int] = defaultdict(int)
-    subcategory_counter: Dict[str, int] = defaultdict(int)
-    assignment_group_counter: Dict[str, int] = defaultdict(int)
-    contact_type_counter: Dict[str, int] = defaultdict(int)
-    escalation_counter: Dict[str, int] = defaultdict(int)
-    reassignment_values: List[int] = []
-    reopen_values: List[int] = []
-    sla_by_pri: Dict[str, Dict[str, int]] = defaultdict(lambda: {"met": 0, "missed": 0})
-
-    # Assignment group stats (for breakdown table)
-    ag_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-        "total": 0, "open": 0, "closed": 0, "sla_met": 0, "sla_missed": 0,
-    })
-
-    for t in tickets:
-        is_open = _is_open(t.status, config)
-        if is_open:
-            d.open_tickets += 1
-        else:
-            d.closed_tickets += 1
+_AGE_BUCKET_LABELS = ("< 7d", "7–14d", "14–30d", "30–60d", "60–90d", "90d+")
 
-        # Blocked
-        if is_open and _is_blocked(t.status, config):
-            d.blocked_tickets += 1
 
-        # Unassigned
-        if is_open and t.assignee in (config.default_unassigned, ""):
-            d.unassigned_tickets += 1
+def _comment_preview(text: str) -> str:
+    """The staleness table's preview of a last comment ("—" if there is none)."""
+    return (text[:_PREVIEW_CHARS] + "…") if len(text) > _PREVIEW_CHARS else text or "—"
 
-        # Story points
-        if t.story_points is not None:
-            d.total_story_points += t.story_points
-            if is_open:
-                d.open_story_points += t.story_points
-
-        # Status
-        status_display = t.status or "Unknown"
-        d.status_counts[status_display] = d.status_counts.get(status_display, 0) + 1
-
-        # Assignee (open tickets only for workload)
-        if is_open:
-            d.assignee_counts[t.assignee] = d.assignee_counts.get(t.assignee, 0) + 1
-
-        # Priority
-        if t.priority:
-            d.priority_counts[t.priority] = d.priority_counts.get(t.priority, 0) + 1
-
-        # Issue type
-        if t.issue_type:
-            d.type_counts[t.issue_type] = d.type_counts.get(t.issue_type, 0) + 1
-
-        # Components
-        for comp in _split_csv_field(t.components):
-            component_counter[comp] += 1
-
-        # Labels
-        for lbl in _split_csv_field(t.labels):
-            label_counter[lbl] += 1
-
-        # Created/Resolved trend (monthly)
-        if t.created:
-            month_key = t.created.strftime("%Y-%m")
-            d.created_by_month[month_key] = d.created_by_month.get(month_key, 0) + 1
-        if t.resolved:
-            month_key = t.resolved.strftime("%Y-%m")
-            d.resolved_by_month[month_key] = d.resolved_by_month.get(month_key, 0) + 1
-
-        # Age of open tickets
-        if is_open and t.created:
-            age_days = (now - t.created).total_seconds() / 86400
-            open_ages.append(age_days)
-            if age_days < 7:
-                d.age_buckets["< 7d"] += 1
-            elif age_days < 14:
-                d.age_buckets["7–14d"] += 1
-            elif age_days < 30:
-                d.age_buckets["14–30d"] += 1
-            elif age_days < 60:
-                d.age_buckets["30–60d"] += 1
-            elif age_days < 90:
-                d.age_buckets["60–90d"] += 1
-            else:
-                d.age_buckets["90d+"] += 1
-
-        # Overdue
-        if is_open and t.due_date and t.due_date < now:
-            d.overdue_tickets += 1
-
-        # Staleness
-        last_activity = t.last_comment_date or t.updated
-        days_since = None
-        if last_activity:
-            days_since = (now - last_activity).total_seconds() / 86400
-        if is_open:
-            if days_since is not None and days_since > stale_days:
-                d.stale_tickets += 1
-            elif days_since is None and t.created:
-                created_days = (now - t.created).total_seconds() / 86400
-                if created_days > stale_days:
-                    d.stale_tickets += 1
 
-        # Staleness table row (all open tickets)
-        if is_open:
-            d.staleness_rows.append({
-                "key": t.key,
-                "summary": t.summary[:80],
-                "reporter": t.reporter or "Unknown",
-                "assignee": t.assignee,
-                "status": t.status,
-                "last_comment_date": last_activity.strftime("%Y-%m-%d") if last_activity else "—",
-                "days_since": round(days_since, 1) if days_since is not None else 999,
-                "comment_preview": (t.last_comment_text[:60] + "…") if len(t.last_comment_text) > 60 else t.last_comment_text or "—",
-            })
+def _mean_pair(zero: Any = 0.0) -> Dict[str, Any]:
+    """A fresh ``{"sum", "count"}`` accumulator for a mean."""
+    return {"sum": zero, "count": 0}
 
-        # Resolution time
-        if not is_open and t.created and t.resolved:
-            res_days = (t.resolved - t.created).total_seconds() / 86400
-            all_resolution_days.append(res_days)
-            itype = t.issue_type or "Unknown"
-            resolution_times_by_type[itype].append(res_days)
-            if t.priority:
-                resolution_times_by_priority[t.priority].append(res_days)
 
-        # Epic progress
-        if t.epic_link:
-            epic_stats[t.epic_link]["total"] += 1
-            if is_open:
-                epic_stats[t.epic_link]["open"] += 1
-            else:
-                epic_stats[t.epic_link]["closed"] += 1
-            if t.story_points:
-                epic_stats[t.epic_link]["story_points"] += t.story_points
+def _mean(pair: Dict[str, Any]) -> float:
+    """The mean of a ``_mean_pair``, to one decimal (0.0 when empty)."""
+    return round(pair["sum"] / pair["count"], 1) if pair["count"] else 0.0
 
-        # Sprint progress
-        if t.sprint:
-            sprint_stats[t.sprint]["total"] += 1
-            if is_open:
-                sprint_stats[t.sprint]["open"] += 1
-            else:
-                sprint_stats[t.sprint]["closed"] += 1
-            if t.story_points:
-                sprint_stats[t.sprint]["story_points"] += t.story_points
 
-        # Estimation accuracy
-        if t.original_estimate_secs is not None and t.time_spent_secs is not None:
-            itype = t.issue_type or "Unknown"
-            estimate_by_type[itype]["estimated"].append(t.original_estimate_secs)
-            estimate_by_type[itype]["actual"].append(t.time_spent_secs)
+class _MetricsState:
+    """Accumulators filled per ticket by ``MetricsAccumulator``.
 
-        # Reporter-Assignee flow
-        reporter = t.reporter or "Unknown"
-        ra_flow[(reporter, t.assignee)] += 1
+    ``finish()`` turns them into the ``DashboardData`` fields.
+    """
 
-        # --- ServiceNow-specific per-ticket ---
-        if config.has_sla and t.made_sla is not None:
-            if t.made_sla:
-                sla_met += 1
-            else:
-                sla_missed += 1
-            pri = t.priority or "Unknown"
-            if t.made_sla:
-                sla_by_pri[pri]["met"] += 1
-            else:
-                sla_by_pri[pri]["missed"] += 1
+    def __init__(self) -> None:
+        self.d = DashboardData()
+        self.d.age_buckets = {b: 0 for b in _AGE_BUCKET_LABELS}
 
-        if config.has_categories and t.category:
-            category_counter[t.category] += 1
-        if config.has_categories and t.subcategory:
-            subcategory_counter[t.subcategory] += 1
+        # Means are kept as {"sum", "count"} pairs so states add up exactly
+        self.open_age: Dict[str, Any] = _mean_pair()
+        self.resolution_days: Dict[str, Any] = _mean_pair()
+        self.resolution_by_type: Dict[str, Dict[str, Any]] = defaultdict(_mean_pair)
+        self.resolution_by_priority: Dict[str, Dict[str, Any]] = defaultdict(_mean_pair)
 
-        if config.has_assignment_groups and t.assignment_group:
-            assignment_group_counter[t.assignment_group] += 1
-            ag_stats[t.assignment_group]["total"] += 1
-            if is_open:
-                ag_stats[t.assignment_group]["open"] += 1
-            else:
-                ag_stats[t.assignment_group]["closed"] += 1
-            if t.made_sla is True:
-                ag_stats[t.assignment_group]["sla_met"] += 1
-            elif t.made_sla is False:
-                ag_stats[t.assignment_group]["sla_missed"] += 1
-
-        if config.has_contact_type and t.contact_type:
-            contact_type_counter[t.contact_type] += 1
-
-        if config.has_escalation and t.escalation:
-            escalation_counter[t.escalation] += 1
-
-        if config.has_reassignment and t.reassignment_count is not None:
-            reassignment_values.append(t.reassignment_count)
-        if config.has_reassignment and t.reopen_count is not None:
-            reopen_values.append(t.reopen_count)
-
-    # --- Aggregations ---
-
-    # Summary values
-    d.avg_age_open_days = round(sum(open_ages) / len(open_ages), 1) if open_ages else 0.0
-    d.resolution_rate = round((d.closed_tickets / d.total_tickets * 100), 1) if d.total_tickets else 0.0
-    d.avg_resolution_days = round(sum(all_resolution_days) / len(all_resolution_days), 1) if all_resolution_days else 0.0
-    d.total_story_points = round(d.total_story_points, 1)
-    d.open_story_points = round(d.open_story_points, 1)
-
-    # Resolution by type
-    for itype, times in resolution_times_by_type.items():
-        d.avg_resolution_by_type[itype] = round(sum(times) / len(times), 1)
-
-    # Resolution by priority
-    for pri, times in resolution_times_by_priority.items():
-        d.avg_resolution_by_priority[pri] = round(sum(times) / len(times), 1)
-
-    # Component/Label counts (sorted by count desc)
-    d.component_counts = dict(sorted(component_counter.items(), key=lambda x: -x[1]))
-    d.label_counts = dict(sorted(label_counter.items(), key=lambda x: -x[1]))
-
-    # Ensure created_by_month and resolved_by_month cover the same date range
-    all_months = sorted(set(list(d.created_by_month.keys()) + list(d.resolved_by_month.keys())))
-    for m in all_months:
-        d.created_by_month.setdefault(m, 0)
-        d.resolved_by_month.setdefault(m, 0)
-    # Re-sort by month key
-    d.created_by_month = dict(sorted(d.created_by_month.items()))
-    d.resolved_by_month = dict(sorted(d.resolved_by_month.items()))
-
-    # Sort staleness rows (most stale first)
-    d.staleness_rows.sort(key=lambda r: -r["days_since"])
-
-    # Top 10 oldest open
-    open_with_age = []
-    for t in tickets:
-        if _is_open(t.status, config) and t.created:
-            age = (now - t.created).total_seconds() / 86400
-            open_with_age.append({
-                "key": t.key,
-                "summary": t.summary[:60],
-                "assignee": t.assignee,
-                "status": t.status,
-                "age_days": round(age, 1),
-                "created": t.created.strftime("%Y-%m-%d"),
-            })
-    open_with_age.sort(key=lambda r: -r["age_days"])
-    d.oldest_open = open_with_age[:10]
-
-    # Assignee breakdown (with story points)
-    assignee_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-        "total": 0, "open": 0, "closed": 0, "overdue": 0, "stale": 0,
-        "open_age_sum": 0.0, "open_count_for_age": 0, "story_points": 0.0,
-    })
-    reporter_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-        "total": 0, "open": 0, "closed": 0, "overdue": 0,
-    })
-    for t in tickets:
-        is_open_t = _is_open(t.status, config)
-        a = t.assignee
-        assignee_stats[a]["total"] += 1
-        if t.story_points:
-            assignee_stats[a]["story_points"] += t.story_points
-        if is_open_t:
-            assignee_stats[a]["open"] += 1
-            if t.created:
-                age = (now - t.created).total_seconds() / 86400
-                assignee_stats[a]["open_age_sum"] += age
-                assignee_stats[a]["open_count_for_age"] += 1
-            if t.due_date and t.due_date < now:
-                assignee_stats[a]["overdue"] += 1
-            last_act = t.last_comment_date or t.updated
-            if last_act:
-                ds = (now - last_act).total_seconds() / 86400
-                if ds > stale_days:
-                    assignee_stats[a]["stale"] += 1
-            elif t.created:
-                if (now - t.created).total_seconds() / 86400 > stale_days:
-                    assignee_stats[a]["stale"] += 1
-        else:
-            assignee_stats[a]["closed"] += 1
-        r = t.reporter or "Unknown"
-        reporter_stats[r]["total"] += 1
-        if is_open_t:
-            reporter_stats[r]["open"] += 1
-            if t.due_date and t.due_date < now:
-                reporter_stats[r]["overdue"] += 1
-        else:
-            reporter_stats[r]["closed"] += 1
-
-    for name, s in sorted(assignee_stats.items(), key=lambda x: -x[1]["total"]):
-        avg_age = round(s["open_age_sum"] / s["open_count_for_age"], 1) if s["open_count_for_age"] else 0.0
-        d.assignee_breakdown.append({
-            "assignee": name, "total": s["total"], "open": s["open"],
-            "closed": s["closed"], "avg_age": avg_age,
-            "overdue": s["overdue"], "stale": s["stale"],
-            "story_points": round(s["story_points"], 1),
+        # Epic/Sprint tracking
+        self.epic_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+            "total": 0, "open": 0, "closed": 0, "story_points": 0.0,
         })
-    for name, s in sorted(reporter_stats.items(), key=lambda x: -x[1]["total"]):
-        d.reporter_breakdown.append({
-            "reporter": name, "total": s["total"], "open": s["open"],
-            "closed": s["closed"], "overdue": s["overdue"],
+        self.sprint_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+            "total": 0, "open": 0, "closed": 0, "story_points": 0.0,
         })
 
-    # Epic progress
-    for epic, s in sorted(epic_stats.items(), key=lambda x: -x[1]["total"]):
-        pct = round(s["closed"] / s["total"] * 100, 1) if s["total"] else 0
-        d.epic_progress.append({
-            "epic": epic, "total": s["total"], "open": s["open"],
-            "closed": s["closed"], "pct_done": pct,
-            "story_points": round(s["story_points"], 1),
+        # Estimation accuracy tracking
+        self.estimate_by_type: Dict[str, Dict[str, int]] = defaultdict(lambda: {
+            "estimated": 0, "actual": 0, "count": 0,
         })
 
-    # Sprint progress
-    for sprint, s in sorted(sprint_stats.items(), key=lambda x: -x[1]["total"]):
-        pct = round(s["closed"] / s["total"] * 100, 1) if s["total"] else 0
-        d.sprint_progress.append({
-            "sprint": sprint, "total": s["total"], "open": s["open"],
-            "closed": s["closed"], "pct_done": pct,
-            "story_points": round(s["story_points"], 1),
+        # Reporter-Assignee flow
+        self.ra_flow: Dict[Tuple[str, str], int] = defaultdict(int)
+
+        # Component/Label counting
+        self.component_counter: Dict[str, int] = defaultdict(int)
+        self.label_counter: Dict[str, int] = defaultdict(int)
+
+        # ServiceNow-specific accumulators
+        self.sla_met = 0
+        self.sla_missed = 0
+        self.category_counter: Dict[str, int] = defaultdict(int)
+        self.subcategory_counter: Dict[str, int] = defaultdict(int)
+        self.assignment_group_counter: Dict[str, int] = defaultdict(int)
+        self.contact_type_counter: Dict[str, int] = defaultdict(int)
+        self.escalation_counter: Dict[str, int] = defaultdict(int)
+        self.reassignment: Dict[str, int] = _mean_pair(0)
+        self.reopen: Dict[str, int] = _mean_pair(0)
+        self.sla_by_pri: Dict[str, Dict[str, int]] = defaultdict(lambda: {"met": 0, "missed": 0})
+
+        # Assignment group stats (for breakdown table)
+        self.ag_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+            "total": 0, "open": 0, "closed": 0, "sla_met": 0, "sla_missed": 0,
         })
 
-    # Estimation accuracy
-    for itype, data_est in sorted(estimate_by_type.items()):
-        estimated = data_est["estimated"]
-        actual = data_est["actual"]
-        avg_est = sum(estimated) / len(estimated) if estimated else 0
-        avg_act = sum(actual) / len(actual) if actual else 0
-        accuracy = round((avg_act / avg_est * 100), 1) if avg_est > 0 else 0
-        d.estimation_accuracy.append({
-            "type": itype,
-            "count": len(estimated),
-            "avg_estimated": format_duration(int(avg_est)),
-            "avg_actual": format_duration(int(avg_act)),
-            "accuracy_pct": accuracy,
-        })
+        # Top 10 oldest open candidates
+        self.open_with_age: List[Dict[str, Any]] = []
 
-    # Reporter-Assignee matrix (top 20)
-    ra_sorted = sorted(ra_flow.items(), key=lambda x: -x[1])[:20]
-    for (reporter, assignee), count in ra_sorted:
-        d.reporter_assignee_matrix.append({
-            "reporter": reporter, "assignee": assignee, "count": count,
+        # Assignee / reporter breakdown
+        self.assignee_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+            "total": 0, "open": 0, "closed": 0, "overdue": 0, "stale": 0,
+            "open_age_sum": 0.0, "open_count_for_age": 0, "story_points": 0.0,
+        })
+        self.reporter_stats: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
+            "total": 0, "open": 0, "closed": 0, "overdue": 0,
         })
 
-    # --- ServiceNow-specific aggregations ---
-    if config.has_sla:
-        sla_total = sla_met + sla_missed
-        d.sla_met_count = sla_met
-        d.sla_missed_count = sla_missed
-        d.sla_compliance_pct = round(sla_met / sla_total * 100, 1) if sla_total else 0.0
-        for pri, counts in sorted(sla_by_pri.items()):
-            d.sla_by_priority[pri] = dict(counts)
+    def add_age(self, age_days: float) -> None:
+        """Record the age of an open ticket for the average and the buckets."""
+        self.open_age["sum"] += age_days
+        self.open_age["count"] += 1
+        buckets = self.d.age_buckets
+        if age_days < 7:
+            buckets["< 7d"] += 1
+        elif age_days < 14:
+            buckets["7–14d"] += 1
+        elif age_days < 30:
+            buckets["14–30d"] += 1
+        elif age_days < 60:
+            buckets["30–60d"] += 1
+        elif age_days < 90:
+            buckets["60–90d"] += 1
+        else:
+            buckets["90d+"] += 1
+
+    def add_resolution(self, issue_type: str, priority: str, res_days: float) -> None:
+        """Record the resolution time of a closed ticket."""
+        for pair in (self.resolution_days, self.resolution_by_type[issue_type or "Unknown"]):
+            pair["sum"] += res_days
+            pair["count"] += 1
+        if priority:
+            pair = self.resolution_by_priority[priority]
+            pair["sum"] += res_days
+            pair["count"] += 1
+
+    def finish(self, config: SourceConfig) -> DashboardData:
+        """Aggregate the accumulators into the DashboardData fields."""
+        d = self.d
+
+        # Summary values
+        d.avg_age_open_days = _mean(self.open_age)
+        d.resolution_rate = round((d.closed_tickets / d.total_tickets * 100), 1) if d.total_tickets else 0.0
+        d.avg_resolution_days = _mean(self.resolution_days)
+        d.total_story_points = round(d.total_story_points, 1)
+        d.open_story_points = round(d.open_story_points, 1)
+
+        # Resolution by type
+        for itype, pair in self.resolution_by_type.items():
+            d.avg_resolution_by_type[itype] = _mean(pair)
+
+        # Resolution by priority
+        for pri, pair in self.resolution_by_priority.items():
+            d.avg_resolution_by_priority[pri] = _mean(pair)
+
+        # Component/Label counts (sorted by count desc)
+        d.component_counts = dict(sorted(self.component_counter.items(), key=lambda x: -x[1]))
+        d.label_counts = dict(sorted(self.label_counter.items(), key=lambda x: -x[1]))
+
+        # Ensure created_by_month and resolved_by_month cover the same date range
+        all_months = sorted(set(list(d.created_by_month.keys()) + list(d.resolved_by_month.keys())))
+        for m in all_months:
+            d.created_by_month.setdefault(m, 0)
+            d.resolved_by_month.setdefault(m, 0)
+        # Re-sort by month key
+        d.created_by_month = dict(sorted(d.created_by_month.items()))
+        d.resolved_by_month = dict(sorted(d.resolved_by_month.items()))
+
+        # Sort staleness rows (most stale first)
+        d.staleness_rows.sort(key=lambda r: -r["days_since"])
+
+        # Top 10 oldest open
+        self.open_with_age.sort(key=lambda r: -r["age_days"])
+        d.oldest_open = self.open_with_age[:10]
+
+        # Assignee / reporter breakdown
+        for name, s in sorted(self.assignee_stats.items(), key=lambda x: -x[1]["total"]):
+            avg_age = round(s["open_age_sum"] / s["open_count_for_age"], 1) if s["open_count_for_age"] else 0.0
+            d.assignee_breakdown.append({
+                "assignee": name, "total": s["total"], "open": s["open"],
+                "closed": s["closed"], "avg_age": avg_age,
+                "overdue": s["overdue"], "stale": s["stale"],
+                "story_points": round(s["story_points"], 1),
+            })
+        for name, s in sorted(self.reporter_stats.items(), key=lambda x: -x[1]["total"]):
+            d.reporter_breakdown.append({
+                "reporter": name, "total": s["total"], "open": s["open"],
+                "closed": s["closed"], "overdue": s["overdue"],
+            })
 
-    if config.has_categories:
-        d.category_counts = dict(sorted(category_counter.items(), key=lambda x: -x[1]))
-        d.subcategory_counts = dict(sorted(subcategory_counter.items(), key=lambda x: -x[1]))
+        # Epic progress
+        for epic, s in sorted(self.epic_stats.items(), key=lambda x: -x[1]["total"]):
+            pct = round(s["closed"] / s["total"] * 100, 1) if s["total"] else 0
+            d.epic_progress.append({
+                "epic": epic, "total": s["total"], "open": s["open"],
+                "closed": s["closed"], "pct_done": pct,
+                "story_points": round(s["story_points"], 1),
+            })
 
-    if config.has_assignment_groups:
-        d.assignment_group_counts = dict(sorted(assignment_group_counter.items(), key=lambda x: -x[1]))
-        for ag_name, s in sorted(ag_stats.items(), key=lambda x: -x[1]["total"]):
-            sla_t = s["sla_met"] + s["sla_missed"]
-            sla_pct = round(s["sla_met"] / sla_t * 100, 1) if sla_t else 0.0
-            d.assignment_group_breakdown.append({
-                "group": ag_name, "total": s["total"], "open": s["open"],
-                "closed": s["closed"], "sla_pct": sla_pct,
+        # Sprint progress
+        for sprint, s in sorted(self.sprint_stats.items(), key=lambda x: -x[1]["total"]):
+            pct = round(s["closed"] / s["total"] * 100, 1) if s["total"] else 0
+            d.sprint_progress.append({
+                "sprint": sprint, "total": s["total"], "open": s["open"],
+                "closed": s["closed"], "pct_done": pct,
+                "story_points": round(s["story_points"], 1),
             })
 
-    if config.has_contact_type:
-        d.contact_type_counts = dict(sorted(contact_type_counter.items(), key=lambda x: -x[1]))
+        # Estimation accuracy
+        for itype, data_est in sorted(self.estimate_by_type.items()):
+            count = data_est["count"]
+            avg_est = data_est["estimated"] / count if count else 0
+            avg_act = data_est["actual"] / count if count else 0
+            accuracy = round((avg_act / avg_est * 100), 1) if avg_est > 0 else 0
+            d.estimation_accuracy.append({
+                "type": itype,
+                "count": count,
+                "avg_estimated": format_duration(int(avg_est)),
+                "avg_actual": format_duration(int(avg_act)),
+                "accuracy_pct": accuracy,
+            })
 
-    if config.has_escalation:
-        d.escalation_counts = dict(sorted(escalation_counter.items(), key=lambda x: -x[1]))
+        # Reporter-Assignee matrix (top 20)
+        ra_sorted = sorted(self.ra_flow.items(), key=lambda x: -x[1])[:20]
+        for (reporter, assignee), count in ra_sorted:
+            d.reporter_assignee_matrix.append({
+                "reporter": reporter, "assignee": assignee, "count": count,
+            })
 
-    if config.has_reassignment:
-        d.avg_reassignment_count = round(sum(reassignment_values) / len(reassignment_values), 1) if reassignment_values else 0.0
-        d.avg_reopen_count = round(sum(reopen_values) / len(reopen_values), 1) if reopen_values else 0.0
+        # --- ServiceNow-specific aggregations ---
+        if config.has_sla:
+            sla_total = self.sla_met + self.sla_missed
+            d.sla_met_count = self.sla_met
+            d.sla_missed_count = self.sla_missed
+            d.sla_compliance_pct = round(self.sla_met / sla_total * 100, 1) if sla_total else 0.0
+            for pri, counts in sorted(self.sla_by_pri.items()):
+                d.sla_by_priority[pri] = dict(counts)
 
-    # Issue themes from short_description clustering
-    d.issue_themes = _cluster_descriptions(tickets)
+        if config.has_categories:
+            d.category_counts = dict(sorted(self.category_counter.items(), key=lambda x: -x[1]))
+            d.subcategory_counts = dict(sorted(self.subcategory_counter.items(), key=lambda x: -x[1]))
 
-    # Full ticket table data
-    all_rows = []
-    all_headers_set: Dict[str, None] = {}
+        if config.has_assignment_groups:
+            d.assignment_group_counts = dict(sorted(self.assignment_group_counter.items(), key=lambda x: -x[1]))
+            for ag_name, s in sorted(self.ag_stats.items(), key=lambda x: -x[1]["total"]):
+                sla_t = s["sla_met"] + s["sla_missed"]
+                sla_pct = round(s["sla_met"] / sla_t * 100, 1) if sla_t else 0.0
+                d.assignment_group_breakdown.append({
+                    "group": ag_name, "total": s["total"], "open": s["open"],
+                    "closed": s["closed"], "sla_pct": sla_pct,
+                })
+
+        if config.has_contact_type:
+            d.contact_type_counts = dict(sorted(self.contact_type_counter.items(), key=lambda x: -x[1]))
+
+        if config.has_escalation:
+            d.escalation_counts = dict(sorted(self.escalation_counter.items(), key=lambda x: -x[1]))
+
+        if config.has_reassignment:
+            d.avg_reassignment_count = _mean(self.reassignment)
+            d.avg_reopen_count = _mean(self.reopen)
+
+        return d
+
+
+# ---------------------------------------------------------------------------
+# Mergeable metrics accumulator
+# ---------------------------------------------------------------------------
+
+# The per-ticket values MetricsAccumulator folds, in the frame's encoding:
+# dates and counts as epoch microseconds / integers with _NA_INT for
+# missing, story points as a float (NaN if missing), made_sla as -1/0/1.
+#   (key, summary, status, is_open, is_blocked, assignee, reporter,
+#    priority, issue_type, components, labels, created, resolved,
+#    last activity, due date, story points, epic link, sprint, original
+#    estimate, time spent, made_sla, category, subcategory, assignment
+#    group, contact type, escalation, reassignment count, reopen count,
+#    last comment text)
+
+def _ticket_facts(tickets: Iterable[JiraTicket], statuses: _StatusClassifier) -> Iterator[Tuple[Any, ...]]:
+    """The per-ticket values of ticket objects."""
+    na = _NA_INT
+    nan = float("nan")
+    to_micros = _to_micros
     for t in tickets:
-        for h in t.raw_fields:
+        flags = statuses[t.status]
+        sp, made_sla = t.story_points, t.made_sla
+        estimate, spent = t.original_estimate_secs, t.time_spent_secs
+        reassignment, reopen = t.reassignment_count, t.reopen_count
+        yield (
+            t.key, t.summary, t.status, flags.is_open, flags.is_blocked, t.assignee, t.reporter,
+            t.priority, t.issue_type, t.components, t.labels, to_micros(t.created),
+            to_micros(t.resolved), to_micros(t.last_comment_date or t.updated), to_micros(t.due_date),
+            nan if sp is None else sp, t.epic_link, t.sprint,
+            na if estimate is None else estimate, na if spent is None else spent,
+            -1 if made_sla is None else int(made_sla), t.category, t.subcategory,
+            t.assignment_group, t.contact_type, t.escalation,
+            na if reassignment is None else reassignment, na if reopen is None else reopen,
+            t.last_comment_text,
+        )
+
+
+class MetricsAccumulator(_MetricsState):
+    """Dashboard metrics built up incrementally.
+
+    ``add()`` / ``update()`` fold tickets in, ``update_frame()`` a
+    ``TicketFrame``'s rows, and ``merge()`` folds in another
+    accumulator for the same source, so exports or chunks can be aggregated
+    separately (one per worker, say) and combined.  ``finalize()`` turns
+    the result into a ``DashboardData`` and leaves the accumulator usable.
+
+    Everything that does not depend on the reference time is aggregated as
+    tickets arrive, with means kept as sum/count pairs.  Open tickets keep
+    one compact row each, for the age, overdue and staleness figures
+    ``finalize()`` works out.  Issue themes and the full ticket table need
+    every ticket and are filled in by ``compute_dashboard_data``.
+
+    ``to_partial()`` / ``from_partial()`` carry the metrics between machines
+    (see ``_write_partial``).
+    """
+
+    # Plain sums on DashboardData, and its {name: count} fields
+    _TOTALS = ("total_tickets", "open_tickets", "closed_tickets", "blocked_tickets",
+               "unassigned_tickets", "total_story_points", "open_story_points",
+               "overdue_tickets", "stale_tickets")
+    _DATA_COUNTS = ("status_counts", "assignee_counts", "priority_counts", "type_counts",
+                    "created_by_month", "resolved_by_month", "age_buckets")
+    # {name: count} accumulators (ra_flow's keys are pairs), {name: {field:
+    # number}} ones, and mean pairs
+    _COUNTERS = ("component_counter", "label_counter", "category_counter", "subcategory_counter",
+                 "assignment_group_counter", "contact_type_counter", "escalation_counter")
+    _STATS = ("resolution_by_type", "resolution_by_priority", "epic_stats", "sprint_stats",
+              "estimate_by_type", "sla_by_pri", "ag_stats", "assignee_stats", "reporter_stats")
+    _MEANS = ("open_age", "resolution_days", "reassignment", "reopen")
+
+    def __init__(self, config: Optional[SourceConfig] = None) -> None:
+        super().__init__()
+        self.config = config or _jira_config()
+        self.statuses = _status_classifier(self.config)
+        self.d.source_type = self.config.name
+        # (key, summary, assignee, status, reporter, created, last activity,
+        #  due date, comment preview) per open ticket, in ticket order, with
+        #  dates as epoch microseconds
+        self.open_rows: List[Tuple[Any, ...]] = []
+        # The same for the NumPy engine, a column block per frame
+        self.open_columns: List["_OpenColumns"] = []
+        # Tickets share far fewer distinct days than they have dates
+        self._day_labels: Dict[int, Tuple[str, str]] = {}
+
+    def _labels(self, us: int) -> Tuple[str, str]:
+        """Return the ``(YYYY-MM, YYYY-MM-DD)`` labels for a timestamp."""
+        day = us // _US_PER_DAY
+        labels = self._day_labels.get(day)
+        if labels is None:
+            dt = _from_micros(us)
+            labels = self._day_labels[day] = (dt.strftime("%Y-%m"), dt.strftime("%Y-%m-%d"))
+        return labels
+
+    def add(self, ticket: JiraTicket) -> None:
+        """Fold one ticket into the metrics."""
+        self.update((ticket,))
+
+    def update(self, tickets: Iterable[JiraTicket]) -> None:
+        """Fold tickets into the metrics, in order."""
+        self._fold(_ticket_facts(tickets, self.statuses))
+
+    def update_frame(self, frame: TicketFrame) -> None:
+        """Fold a ``TicketFrame``'s rows into the metrics, in order.
+
+        ``_fold()``'s rules, column by column.  Categorical fields are
+        counted by integer code (``Counter`` over the code column, which
+        keeps first appearances in order) and each code is named once, so
+        every dict comes out in the order ``update()`` leaves it.  Floats
+        are still added a row at a time onto the running totals, so sums
+        match to the last bit.
+        """
+        n = len(frame)
+        if not n:
+            return
+        m = self
+        d = m.d
+        config = m.config
+        labels = m._labels
+        na = _NA_INT
+        cats, dates, ints, text = frame.categories, frame.dates, frame.ints, frame.text
+        status, assignee, reporter = cats["status"], cats["assignee"], cats["reporter"]
+        priority, issue_type = cats["priority"], cats["issue_type"]
+        created, resolved = dates["created"], dates["resolved"]
+        story_points, made_sla = frame.floats["story_points"], frame.made_sla
+        epics, sprints = text["epic_link"], text["sprint"]
+
+        # Per-code tables
+        statuses = m.statuses
+        open_by = [statuses[v].is_open for v in status.values]
+        blocked_by = [statuses[v].is_blocked for v in status.values]
+        if statuses is frame.statuses:
+            open_flags: Sequence[int] = frame.is_open
+        else:
+            open_flags = bytearray(map(open_by.__getitem__, status.codes))
+        reporter_names = [r or "Unknown" for r in reporter.values]
+        type_names = [t or "Unknown" for t in issue_type.values]
+        unassigned = (config.default_unassigned, "")
+
+        # Totals and status counts
+        status_counts = Counter(status.codes)
+        opened = sum(count for code, count in status_counts.items() if open_by[code])
+        d.total_tickets += n
+        d.open_tickets += opened
+        d.closed_tickets += n - opened
+        d.blocked_tickets += sum(count for code, count in status_counts.items()
+                                 if open_by[code] and blocked_by[code])
+        for code, count in status_counts.items():
+            name = status.values[code] or "Unknown"
+            d.status_counts[name] = d.status_counts.get(name, 0) + count
+
+        # Assignee (open tickets only for workload), priority, issue type
+        for code, count in Counter(itertools.compress(assignee.codes, open_flags)).items():
+            name = assignee.values[code]
+            d.assignee_counts[name] = d.assignee_counts.get(name, 0) + count
+            if name in unassigned:
+                d.unassigned_tickets += count
+        for cat, counts in ((priority, d.priority_counts), (issue_type, d.type_counts)):
+            for code, count in Counter(cat.codes).items():
+                name = cat.values[code]
+                if name:
+                    counts[name] = counts.get(name, 0) + count
+
+        # Assignee / reporter breakdown
+        for cat, names, stats in ((assignee, assignee.values, m.assignee_stats),
+                                  (reporter, reporter_names, m.reporter_stats)):
+            open_counts = Counter(itertools.compress(cat.codes, open_flags))
+            for code, count in Counter(cat.codes).items():
+                s = stats[names[code]]
+                s["total"] += count
+                s["open"] += open_counts[code]
+                s["closed"] += count - open_counts[code]
+
+        # Reporter-Assignee flow
+        for (reporter_code, assignee_code), count in Counter(zip(reporter.codes, assignee.codes)).items():
+            m.ra_flow[(reporter_names[reporter_code], assignee.values[assignee_code])] += count
+
+        # Epic / sprint progress
+        for column, stats in ((epics, m.epic_stats), (sprints, m.sprint_stats)):
+            open_counts = Counter(itertools.compress(column, open_flags))
+            for name, count in Counter(column).items():
+                if name:
+                    s = stats[name]
+                    s["total"] += count
+                    s["open"] += open_counts[name]
+                    s["closed"] += count - open_counts[name]
+
+        # Components / labels, each distinct value split once
+        for name, counter in (("components", m.component_counter), ("labels", m.label_counter)):
+            cat = cats[name]
+            for code, count in Counter(cat.codes).items():
+                for part in _split_csv_parts(cat.values[code]):
+                    counter[part] += count
+
+        # Story points, added in row order
+        assignee_stats = [m.assignee_stats.get(name) for name in assignee.values]
+        for sp, is_open, assignee_code, epic, sprint in zip(story_points, open_flags, assignee.codes,
+                                                             epics, sprints):
+            if sp != sp:
+                continue
+            d.total_story_points += sp
+            if is_open:
+                d.open_story_points += sp
+            if sp:
+                assignee_stats[assignee_code]["story_points"] += sp  # type: ignore[index]
+                if epic:
+                    m.epic_stats[epic]["story_points"] += sp
+                if sprint:
+                    m.sprint_stats[sprint]["story_points"] += sp
+
+        # Created/Resolved trend (monthly), counted per calendar day
+        missing_day = na // _US_PER_DAY
+        for column, counts in ((created, d.created_by_month), (resolved, d.resolved_by_month)):
+            for day, count in Counter(map(operator.floordiv, column, itertools.repeat(_US_PER_DAY))).items():
+                if day != missing_day:
+                    month_key = labels(day * _US_PER_DAY)[0]
+                    counts[month_key] = counts.get(month_key, 0) + count
+
+        # Resolution time, per-code pairs looked up on first use
+        by_type: List[Optional[Dict[str, Any]]] = [None] * len(issue_type.values)
+        by_priority: List[Optional[Dict[str, Any]]] = [None] * len(priority.values)
+        resolution_days = m.resolution_days
+        for is_open, c, res, type_code, priority_code in zip(open_flags, created, resolved,
+                                                             issue_type.codes, priority.codes):
+            if is_open or c == na or res == na:
+                continue
+            res_days = (res - c) / 1000000 / 86400
+            pair = by_type[type_code]
+            if pair is None:
+                pair = by_type[type_code] = m.resolution_by_type[type_names[type_code]]
+            for pair in (resolution_days, pair):
+                pair["sum"] += res_days
+                pair["count"] += 1
+            if priority.values[priority_code]:
+                pair = by_priority[priority_code]
+                if pair is None:
+                    pair = by_priority[priority_code] = m.resolution_by_priority[priority.values[priority_code]]
+                pair["sum"] += res_days
+                pair["count"] += 1
+
+        # Estimation accuracy
+        estimates: List[Optional[Dict[str, int]]] = [None] * len(issue_type.values)
+        for estimate, spent, type_code in zip(ints["original_estimate_secs"], ints["time_spent_secs"],
+                                              issue_type.codes):
+            if estimate != na and spent != na:
+                est = estimates[type_code]
+                if est is None:
+                    est = estimates[type_code] = m.estimate_by_type[type_names[type_code]]
+                est["estimated"] += estimate
+                est["actual"] += spent
+                est["count"] += 1
+
+        # Open tickets; age, overdue and staleness depend on the reference time
+        assignee_values, status_values = assignee.values, status.values
+        columns = (text["key"], text["summary"], assignee.codes, status.codes, reporter.codes, created,
+                   dates["last_comment_date"], dates["updated"], dates["due_date"], text["last_comment_text"])
+        m.open_rows.extend(
+            (key, summary[:80], assignee_values[assignee_code], status_values[status_code],
+             reporter_names[reporter_code], c, updated if last_comment == na else last_comment, due_date,
+             _comment_preview(comment_text))
+            for (key, summary, assignee_code, status_code, reporter_code, c, last_comment, updated, due_date,
+                 comment_text) in zip(*(itertools.compress(column, open_flags) for column in columns)))
+
+        # --- ServiceNow-specific ---
+        if config.has_sla:
+            for (priority_code, sla), count in Counter(zip(priority.codes, made_sla)).items():
+                if sla >= 0:
+                    pri = m.sla_by_pri[priority.values[priority_code] or "Unknown"]
+                    if sla:
+                        m.sla_met += count
+                        pri["met"] += count
+                    else:
+                        m.sla_missed += count
+                        pri["missed"] += count
+
+        for name, counter, enabled in (
+                ("category", m.category_counter, config.has_categories),
+                ("subcategory", m.subcategory_counter, config.has_categories),
+                ("assignment_group", m.assignment_group_counter, config.has_assignment_groups),
+                ("contact_type", m.contact_type_counter, config.has_contact_type),
+                ("escalation", m.escalation_counter, config.has_escalation)):
+            if enabled:
+                cat = cats[name]
+                for code, count in Counter(cat.codes).items():
+                    if cat.values[code]:
+                        counter[cat.values[code]] += count
+
+        if config.has_assignment_groups:
+            group = cats["assignment_group"]
+            for (group_code, is_open, sla), count in Counter(zip(group.codes, open_flags, made_sla)).items():
+                if group.values[group_code]:
+                    s = m.ag_stats[group.values[group_code]]
+                    s["total"] += count
+                    s["open" if is_open else "closed"] += count
+                    if sla == 1:
+                        s["sla_met"] += count
+                    elif sla == 0:
+                        s["sla_missed"] += count
+
+        if config.has_reassignment:
+            for name, pair in (("reassignment_count", m.reassignment), ("reopen_count", m.reopen)):
+                present = [value for value in ints[name] if value != na]
+                pair["sum"] += sum(present)
+                pair["count"] += len(present)
+
+    def _fold(self, facts: Iterable[Tuple[Any, ...]]) -> None:
+        """Fold per-ticket facts (see ``_ticket_facts``) into the metrics.
+
+        Every per-ticket rule lives here; ``update_frame()`` applies the
+        same rules column by column, and ``_numpy_update`` vectorises them.
+        """
+        m = self
+        d = m.d
+        config = m.config
+        labels = m._labels
+        open_rows = m.open_rows
+        na = _NA_INT
+        unassigned = (config.default_unassigned, "")
+
+        for (key, summary, status, is_open, is_blocked, assignee, reporter, priority, issue_type,
+             components, label_list, created, resolved, last_activity, due_date, story_points,
+             epic_link, sprint, estimate, spent, made_sla, category, subcategory, assignment_group,
+             contact_type, escalation, reassignment, reopen, comment_text) in facts:
+            reporter = reporter or "Unknown"
+            has_sp = story_points == story_points
+            d.total_tickets += 1
+
+            if is_open:
+                d.open_tickets += 1
+            else:
+                d.closed_tickets += 1
+
+            # Blocked
+            if is_open and is_blocked:
+                d.blocked_tickets += 1
+
+            # Unassigned
+            if is_open and assignee in unassigned:
+                d.unassigned_tickets += 1
+
+            # Story points
+            if has_sp:
+                d.total_story_points += story_points
+                if is_open:
+                    d.open_story_points += story_points
+
+            # Status
+            status_display = status or "Unknown"
+            d.status_counts[status_display] = d.status_counts.get(status_display, 0) + 1
+
+            # Assignee (open tickets only for workload)
+            if is_open:
+                d.assignee_counts[assignee] = d.assignee_counts.get(assignee, 0) + 1
+
+            # Priority
+            if priority:
+                d.priority_counts[priority] = d.priority_counts.get(priority, 0) + 1
+
+            # Issue type
+            if issue_type:
+                d.type_counts[issue_type] = d.type_counts.get(issue_type, 0) + 1
+
+            # Components
+            for comp in _split_csv_parts(components):
+                m.component_counter[comp] += 1
+
+            # Labels
+            for lbl in _split_csv_parts(label_list):
+                m.label_counter[lbl] += 1
+
+            # Created/Resolved trend (monthly)
+            if created != na:
+                month_key = labels(created)[0]
+                d.created_by_month[month_key] = d.created_by_month.get(month_key, 0) + 1
+            if resolved != na:
+                month_key = labels(resolved)[0]
+                d.resolved_by_month[month_key] = d.resolved_by_month.get(month_key, 0) + 1
+
+            # Assignee / reporter breakdown (with story points)
+            a = m.assignee_stats[assignee]
+            a["total"] += 1
+            if has_sp and story_points:
+                a["story_points"] += story_points
+            r = m.reporter_stats[reporter]
+            r["total"] += 1
+
+            if is_open:
+                a["open"] += 1
+                r["open"] += 1
+                # Age, overdue and staleness depend on the reference time
+                open_rows.append((
+                    key, summary[:80], assignee, status, reporter, created, last_activity, due_date,
+                    _comment_preview(comment_text),
+                ))
+            else:
+                a["closed"] += 1
+                r["closed"] += 1
+                # Resolution time
+                if created != na and resolved != na:
+                    m.add_resolution(issue_type, priority, (resolved - created) / 1000000 / 86400)
+
+            # Epic / sprint progress
+            for name, stats in ((epic_link, m.epic_stats), (sprint, m.sprint_stats)):
+                if name:
+                    s = stats[name]
+                    s["total"] += 1
+                    if is_open:
+                        s["open"] += 1
+                    else:
+                        s["closed"] += 1
+                    if has_sp and story_points:
+                        s["story_points"] += story_points
+
+            # Estimation accuracy
+            if estimate != na and spent != na:
+                est = m.estimate_by_type[issue_type or "Unknown"]
+                est["estimated"] += estimate
+                est["actual"] += spent
+                est["count"] += 1
+
+            # Reporter-Assignee flow
+            m.ra_flow[(reporter, assignee)] += 1
+
+            # --- ServiceNow-specific per-ticket ---
+            if config.has_sla and made_sla >= 0:
+                pri = m.sla_by_pri[priority or "Unknown"]
+                if made_sla:
+                    m.sla_met += 1
+                    pri["met"] += 1
+                else:
+                    m.sla_missed += 1
+                    pri["missed"] += 1
+
+            if config.has_categories and category:
+                m.category_counter[category] += 1
+            if config.has_categories and subcategory:
+                m.subcategory_counter[subcategory] += 1
+
+            if config.has_assignment_groups and assignment_group:
+                m.assignment_group_counter[assignment_group] += 1
+                ag_stats = m.ag_stats[assignment_group]
+                ag_stats["total"] += 1
+                if is_open:
+                    ag_stats["open"] += 1
+                else:
+                    ag_stats["closed"] += 1
+                if made_sla == 1:
+                    ag_stats["sla_met"] += 1
+                elif made_sla == 0:
+                    ag_stats["sla_missed"] += 1
+
+            if config.has_contact_type and contact_type:
+                m.contact_type_counter[contact_type] += 1
+
+            if config.has_escalation and escalation:
+                m.escalation_counter[escalation] += 1
+
+            if config.has_reassignment and reassignment != na:
+                m.reassignment["sum"] += reassignment
+                m.reassignment["count"] += 1
+            if config.has_reassignment and reopen != na:
+                m.reopen["sum"] += reopen
+                m.reopen["count"] += 1
+
+    def merge(self, other: "MetricsAccumulator") -> None:
+        """Fold in another accumulator's metrics, as if its tickets followed ours."""
+        if other.config.name != self.config.name:
+            raise ValueError(f"Cannot merge {other.config.name} metrics into {self.config.name} metrics")
+        d, od = self.d, other.d
+        for name in self._TOTALS:
+            setattr(d, name, getattr(d, name) + getattr(od, name))
+        for name in self._DATA_COUNTS:
+            counts = getattr(d, name)
+            for key, count in getattr(od, name).items():
+                counts[key] = counts.get(key, 0) + count
+        for name in self._COUNTERS + ("ra_flow",):
+            counter = getattr(self, name)
+            for key, count in getattr(other, name).items():
+                counter[key] += count
+        for name in self._STATS:
+            stats = getattr(self, name)
+            for key, values in getattr(other, name).items():
+                s = stats[key]
+                for stat, value in values.items():
+                    s[stat] += value
+        for name in self._MEANS:
+            pair, other_pair = getattr(self, name), getattr(other, name)
+            pair["sum"] += other_pair["sum"]
+            pair["count"] += other_pair["count"]
+        self.sla_met += other.sla_met
+        self.sla_missed += other.sla_missed
+        self.open_rows.extend(other.open_rows)
+        self.open_columns.extend(other.open_columns)
+        self.open_with_age.extend(other.open_with_age)
+        d.staleness_rows.extend(od.staleness_rows)
+
+    def finalize(self, now: Optional[datetime] = None, stale_days: int = 14) -> DashboardData:
+        """The ``DashboardData`` for the tickets so far, as of *now*."""
+        if now is None:
+            now = datetime.now()
+        return self._as_of(now, stale_days).finish(self.config)
+
+    def _as_of(self, now: datetime, stale_days: int) -> "MetricsAccumulator":
+        """A copy with the open tickets' age, overdue and staleness figures folded in."""
+        # A copy, as finish() rounds and sorts in place
+        m = MetricsAccumulator(self.config)
+        m.merge(self)
+        d = m.d
+        labels = self._labels
+        now_us = _to_micros(now)
+        na = _NA_INT
+
+        # Only the 10 oldest of these can make the table, whatever is merged in
+        aged = []
+        for key, summary, assignee, status, reporter, created, last_activity, due_date, preview in m.open_rows:
+            age_days = (now_us - created) / 1000000 / 86400 if created != na else None
+            days_since = (now_us - last_activity) / 1000000 / 86400 if last_activity != na else None
+            a = m.assignee_stats[assignee]
+
+            if age_days is not None:
+                # Age of open tickets, and the top 10 oldest candidates
+                m.add_age(age_days)
+                a["open_age_sum"] += age_days
+                a["open_count_for_age"] += 1
+                aged.append((round(age_days, 1), key, summary, assignee, status, created))
+            if due_date != na and due_date < now_us:
+                d.overdue_tickets += 1
+                a["overdue"] += 1
+                m.reporter_stats[reporter]["overdue"] += 1
+            if days_since is not None:
+                stale = days_since > stale_days
+            else:
+                stale = age_days is not None and age_days > stale_days
+            if stale:
+                d.stale_tickets += 1
+                a["stale"] += 1
+
+            # Staleness table row (all open tickets)
+            d.staleness_rows.append({
+                "key": key,
+                "summary": summary,
+                "reporter": reporter,
+                "assignee": assignee,
+                "status": status,
+                "last_comment_date": labels(last_activity)[1] if last_activity != na else "—",
+                "days_since": round(days_since, 1) if days_since is not None else 999,
+                "comment_preview": preview,
+            })
+        for columns in m.open_columns:
+            _np_open_figures(m, columns, now, stale_days, aged)
+        # nsmallest() keeps ties in order, as finish()'s stable sort does
+        for age_days, key, summary, assignee, status, created in heapq.nsmallest(10, aged, key=lambda r: -r[0]):
+            m.open_with_age.append({
+                "key": key,
+                "summary": summary[:60],
+                "assignee": assignee,
+                "status": status,
+                "age_days": age_days,
+                "created": labels(created)[1],
+            })
+        m.open_rows = []
+        m.open_columns = []
+        return m
+
+    def to_partial(self, now: datetime, stale_days: int) -> Dict[str, Any]:
+        """The un-finalised metrics as of *now*, as JSON-ready data.
+
+        Open tickets are folded into the age, overdue and staleness
+        aggregates, so the result grows with the number of groups (assignees,
+        epics, months...) rather than tickets: only the 10 oldest and the
+        ``_PARTIAL_STALE_ROWS`` most stale open tickets keep a row.
+        ``from_partial`` reads it back for ``merge()``.
+        """
+        m = self._as_of(now, stale_days)
+        d = m.d
+        m.open_with_age.sort(key=lambda r: -r["age_days"])
+        d.staleness_rows.sort(key=lambda r: -r["days_since"])
+        return {
+            "totals": {name: getattr(d, name) for name in self._TOTALS},
+            "counts": {name: getattr(d, name) for name in self._DATA_COUNTS},
+            "counters": {name: getattr(m, name) for name in self._COUNTERS},
+            "ra_flow": [[reporter, assignee, count] for (reporter, assignee), count in m.ra_flow.items()],
+            "stats": {name: getattr(m, name) for name in self._STATS},
+            "means": {name: getattr(m, name) for name in self._MEANS},
+            "sla": [m.sla_met, m.sla_missed],
+            "oldest_open": m.open_with_age[:10],
+            "staleness_rows": d.staleness_rows[:_PARTIAL_STALE_ROWS],
+        }
+
+    @classmethod
+    def from_partial(cls, state: Dict[str, Any], config: SourceConfig) -> "MetricsAccumulator":
+        """An accumulator holding the metrics saved by ``to_partial``."""
+        m = cls(config)
+        d = m.d
+        for name in cls._TOTALS:
+            setattr(d, name, state["totals"][name])
+        for name in cls._DATA_COUNTS:
+            getattr(d, name).update(state["counts"][name])
+        for name in cls._COUNTERS:
+            getattr(m, name).update(state["counters"][name])
+        for reporter, assignee, count in state["ra_flow"]:
+            m.ra_flow[(reporter, assignee)] = count
+        for name in cls._STATS:
+            stats = getattr(m, name)
+            for key, values in state["stats"][name].items():
+                stats[key].update(values)
+        for name in cls._MEANS:
+            getattr(m, name).update(state["means"][name])
+        m.sla_met, m.sla_missed = state["sla"]
+        m.open_with_age = list(state["oldest_open"])
+        d.staleness_rows = list(state["staleness_rows"])
+        return m
+
+
+def _table_names(raw: Mapping[str, str]) -> Iterable[str]:
+    """The columns of *raw* shown in the full ticket table (see ``_HeaderIndex.shown``)."""
+    if isinstance(raw, _RawFields) and raw._index.shown is not None:
+        return raw._index.table_names(len(raw._row))
+    return raw
+
+
+def _ticket_table(raw_rows: Iterable[Mapping[str, str]]) -> Tuple[List[str], str]:
+    """Build the full-table header list and its embedded JSON rows."""
+    raw_rows = list(raw_rows)
+    all_headers_set: Dict[str, None] = {}
+    for raw in raw_rows:
+        for h in _table_names(raw):
             if h not in all_headers_set:
                 all_headers_set[h] = None
-    d.all_headers = list(all_headers_set.keys())
+    all_headers = list(all_headers_set.keys())
+
+    # Rows viewed through one export's header index already line up with
+    # all_headers position for position, so they zip straight into dicts.
+    width = len(all_headers)
+    shared = raw_rows[0]._index if raw_rows and isinstance(raw_rows[0], _RawFields) else None
+    if shared is not None and all(isinstance(raw, _RawFields) and raw._index is shared for raw in raw_rows):
+        # Serialised a row at a time, so cells decoded from a mapped export
+        # are dropped again straight away; the result matches json.dumps.
+        padding = [""] * width
+        dumps = json.JSONEncoder(default=str).encode
+        cell_rows: Iterable[List[str]] = (raw.cells() for raw in raw_rows)
+        if shared.shown is not None:
+            cell_rows = map(shared.table_cells, cell_rows)
+        all_json = ", ".join(dumps(dict(zip(all_headers, cells if len(cells) >= width else cells + padding)))
+                             for cells in cell_rows)
+        return all_headers, f"[{all_json}]".replace("</", "<\\/")
 
-    for t in tickets:
+    all_rows = []
+    for raw in raw_rows:
+        if isinstance(raw, _RawFields) and raw._index.shown is not None:
+            cells = raw.cells()
+            raw = dict(zip(raw._index.table_names(len(cells)), raw._index.table_cells(cells)))
         row_data = {}
-        for h in d.all_headers:
-            row_data[h] = t.raw_fields.get(h, "")
+        for h in all_headers:
+            row_data[h] = raw.get(h, "")
         all_rows.append(row_data)
-    d.all_tickets_json = json.dumps(all_rows, default=str).replace("</", "<\\/")
+    return all_headers, json.dumps(all_rows, default=str).replace("</", "<\\/")
+
 
+_ENGINES = ("python", "numpy")
+
+
+def compute_dashboard_data(tickets: "List[JiraTicket] | TicketFrame", stale_days: int = 14,
+                           now: Optional[datetime] = None,
+                           config: Optional[SourceConfig] = None,
+                           engine: str = "python") -> DashboardData:
+    """Compute all dashboard metrics from parsed tickets.
+
+    *tickets* may also be a ``TicketFrame``, whose columns are folded in
+    directly (with the frame's own config unless one is given).
+    ``engine="numpy"`` vectorises the per-ticket rules instead (see
+    ``_numpy_update``); it needs NumPy and gives the same result.
+    """
+    if engine not in _ENGINES:
+        raise ValueError(f"Unknown metrics engine {engine!r}; expected one of {', '.join(_ENGINES)}")
+    if now is None:
+        now = datetime.now()
+    if engine == "numpy":
+        if np is None:
+            raise ImportError("The numpy metrics engine needs NumPy (pip install numpy)")
+        if not isinstance(tickets, TicketFrame):
+            tickets = TicketFrame.from_tickets(tickets, config or _jira_config())
+    if isinstance(tickets, TicketFrame):
+        metrics = MetricsAccumulator(config or tickets.config)
+        if engine == "numpy":
+            _numpy_update(metrics, tickets)
+        else:
+            metrics.update_frame(tickets)
+        return _dashboard_data(metrics, now, stale_days, tickets.text["summary"], tickets.raw_fields)
+    metrics = MetricsAccumulator(config)
+    metrics.update(tickets)
+    return _dashboard_data(metrics, now, stale_days, (t.summary for t in tickets),
+                           (t.raw_fields for t in tickets))
+
+
+def _dashboard_data(metrics: MetricsAccumulator, now: datetime, stale_days: int,
+                    summaries: Iterable[str], raw_rows: Iterable[Mapping[str, str]]) -> DashboardData:
+    """Finalise *metrics* and add the issue themes and full ticket table."""
+    d = metrics.finalize(now, stale_days)
+    d.issue_themes = _cluster_summaries(summaries)
+    d.all_headers, d.all_tickets_json = _ticket_table(raw_rows)
     return d
 
 
+class _StreamedTickets:
+    """Tickets folded into a ``MetricsAccumulator`` as they are parsed.
+
+    Only what the dashboard needs besides the metrics is kept: keys and
+    projects for the title, summaries for the issue themes and the
+    (projected) raw rows for the full ticket table, neither of the last
+    two with *metrics_only* (``--partial``).  The first ticket, the status
+    values and the created-date count are kept for ``report_parse``.
+    """
+
+    def __init__(self, config: SourceConfig, metrics_only: bool = False) -> None:
+        self.metrics = MetricsAccumulator(config)
+        self.metrics_only = metrics_only
+        self.keys: List[str] = []
+        self.projects: List[str] = []
+        self.summaries: List[str] = []
+        self.raw_rows: List[Mapping[str, str]] = []
+        self.first: Optional[JiraTicket] = None
+        self.statuses: set = set()
+        self.created_count = 0
+        self.missing_columns: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def feed(self, tickets: Iterable[JiraTicket]) -> "_StreamedTickets":
+        """Fold *tickets* in, in order; each is dropped once folded."""
+        self.metrics.update(self._kept(tickets))
+        return self
+
+    def _kept(self, tickets: Iterable[JiraTicket]) -> Iterator[JiraTicket]:
+        for t in tickets:
+            if self.first is None:
+                self.first = t
+            self.keys.append(t.key)
+            self.projects.append(t.project)
+            if t.status:
+                self.statuses.add(t.status)
+            if t.created is not None:
+                self.created_count += 1
+            if not self.metrics_only:
+                self.summaries.append(t.summary)
+                self.raw_rows.append(t.raw_fields)
+            yield t
+
+    def finalize(self, now: datetime, stale_days: int) -> DashboardData:
+        """The dashboard data, issue themes and ticket table included."""
+        return _dashboard_data(self.metrics, now, stale_days, self.summaries, self.raw_rows)
+
+
+# ---------------------------------------------------------------------------
+# Vectorised metrics engine (optional, NumPy)
+# ---------------------------------------------------------------------------
+
+def _np_value_counts(codes: Any) -> List[Tuple[int, int]]:
+    """``(value, count)`` pairs of an integer array, in first-appearance order."""
+    values, first, counts = np.unique(codes, return_index=True, return_counts=True)
+    order = np.argsort(first, kind="stable")
+    return list(zip(values[order].tolist(), counts[order].tolist()))
+
+
+def _np_groups(codes: Any, name_of: Callable[[int], Optional[str]]) -> List[Tuple[str, Any]]:
+    """Group rows by ``name_of(code)``: ``(name, row mask)`` pairs.
+
+    Names come in first-appearance order and codes sharing a name share
+    a group, as a per-row loop filling a dict would leave them; codes
+    named None are left out.
+    """
+    if not len(codes):
+        return []
+    names: Dict[Optional[str], int] = {}
+    name_ids = np.array([names.setdefault(name_of(code), len(names)) for code in range(int(codes.max()) + 1)])
+    ids = name_ids[codes]
+    by_id = list(names)
+    return [(by_id[i], ids == i) for i, _ in _np_value_counts(ids) if by_id[i] is not None]
+
+
+def _np_running_sum(values: Any, start: float = 0.0) -> float:
+    """Sum left to right from *start*, exactly as a ``+=`` loop would.
+
+    ``np.sum`` adds pairwise, which can differ in the last bit.
+    """
+    return float(np.add.accumulate(np.concatenate(([start], values)))[-1])
+
+
+def _np_day_labels(us: Any) -> List[str]:
+    """``YYYY-MM-DD`` labels for epoch-microsecond timestamps ("—" if missing), one strftime per day."""
+    present = us != _NA_INT
+    days, inverse = np.unique(np.where(present, us, 0) // _US_PER_DAY, return_inverse=True)
+    by_day = [_from_micros(day * _US_PER_DAY).strftime("%Y-%m-%d") for day in days.tolist()]
+    labels = np.array(by_day, dtype=object)[inverse.reshape(-1)]
+    labels[~present] = "—"
+    return labels.tolist()
+
+
+class _OpenColumns(NamedTuple):
+    """The open tickets of one frame, kept by ``_numpy_update`` for ``finalize()``.
+
+    ``MetricsAccumulator.open_rows`` as columns: names stay coded against
+    the frame's dictionaries and dates are epoch-microsecond arrays.
+    """
+    keys: List[str]
+    summaries: List[str]
+    previews: List[str]
+    assignee_codes: Any
+    assignees: List[str]
+    status_codes: Any
+    statuses: List[str]
+    reporter_codes: Any
+    reporters: List[str]
+    created: Any
+    last_activity: Any
+    due_date: Any
+
+
+def _np_open_figures(m: MetricsAccumulator, columns: _OpenColumns, now: datetime, stale_days: int,
+                     aged: List[Tuple[Any, ...]]) -> None:
+    """``MetricsAccumulator._as_of``'s open-ticket loop over *columns*, vectorised.
+
+    Ages are ``datetime64`` differences, turned into days with the same
+    float arithmetic as the loop; buckets come from ``np.digitize``, the
+    per-assignee and per-reporter figures from ``np.bincount`` and the
+    overdue and stale flags from boolean masks.  Staleness rows are still
+    one dict per ticket, and only tickets within rounding distance of the
+    tenth-oldest age are added to *aged*.
+    """
+    d = m.d
+    now64 = np.datetime64(now, "us")
+    created = columns.created.view("datetime64[us]")
+    activity = columns.last_activity.view("datetime64[us]")
+    has_created = ~np.isnat(created)
+    has_activity = ~np.isnat(activity)
+    # NaT differences give meaningless ages, masked out below
+    age_days = (now64 - created).astype(np.int64) / 1000000 / 86400
+    days_since = (now64 - activity).astype(np.int64) / 1000000 / 86400
+    overdue = columns.due_date.view("datetime64[us]") < now64
+    stale = np.where(has_activity, days_since > stale_days, has_created & (age_days > stale_days))
+
+    # Age of open tickets
+    ages = age_days[has_created]
+    m.open_age["sum"] = _np_running_sum(ages, m.open_age["sum"])
+    m.open_age["count"] += len(ages)
+    buckets = np.bincount(np.digitize(ages, [7, 14, 30, 60, 90]), minlength=len(_AGE_BUCKET_LABELS))
+    for label, count in zip(_AGE_BUCKET_LABELS, buckets.tolist()):
+        d.age_buckets[label] += count
+    d.overdue_tickets += int(overdue.sum())
+    d.stale_tickets += int(stale.sum())
+
+    # Per-assignee / per-reporter figures
+    assignee_codes, reporter_codes = columns.assignee_codes, columns.reporter_codes
+
+    def _per_code(codes: Any, size: int, mask: Any, weights: Any = None) -> List[Any]:
+        return np.bincount(codes[mask], None if weights is None else weights[mask], minlength=size).tolist()
+
+    size = len(columns.assignees)
+    age_sum = _per_code(assignee_codes, size, has_created, age_days)
+    age_count = _per_code(assignee_codes, size, has_created)
+    late = _per_code(assignee_codes, size, overdue)
+    stale_by = _per_code(assignee_codes, size, stale)
+    for code, _ in _np_value_counts(assignee_codes):
+        a = m.assignee_stats[columns.assignees[code]]
+        a["open_age_sum"] += age_sum[code]
+        a["open_count_for_age"] += age_count[code]
+        a["overdue"] += late[code]
+        a["stale"] += stale_by[code]
+    late = _per_code(reporter_codes, len(columns.reporters), overdue)
+    for code, _ in _np_value_counts(reporter_codes[overdue]):
+        m.reporter_stats[columns.reporters[code]]["overdue"] += late[code]
+
+    def _gather(values: List[Any], codes: Any) -> List[Any]:
+        return np.array(values, dtype=object)[codes].tolist()
+
+    assignees = _gather(columns.assignees, assignee_codes)
+    statuses = _gather(columns.statuses, columns.status_codes)
+
+    # Top 10 oldest candidates
+    candidates = np.flatnonzero(has_created)
+    if len(candidates) > 10:
+        tenth = np.partition(age_days[candidates], -10)[-10]
+        candidates = candidates[age_days[candidates] >= tenth - 0.2]
+    for i, age in zip(candidates.tolist(), age_days[candidates].tolist()):
+        aged.append((round(age, 1), columns.keys[i], columns.summaries[i], assignees[i], statuses[i],
+                     int(columns.created[i])))
+
+    # Staleness table row (all open tickets)
+    d.staleness_rows.extend({
+        "key": key,
+        "summary": summary,
+        "reporter": reporter,
+        "assignee": assignee,
+        "status": status,
+        "last_comment_date": label,
+        "days_since": round(since, 1) if active else 999,
+        "comment_preview": preview,
+    } for key, summary, reporter, assignee, status, label, since, active, preview in zip(
+        columns.keys, columns.summaries, _gather(columns.reporters, reporter_codes), assignees, statuses,
+        _np_day_labels(columns.last_activity), days_since.tolist(), has_activity.tolist(), columns.previews))
+
+
+def _numpy_update(metrics: MetricsAccumulator, frame: TicketFrame) -> None:
+    """``metrics.update_frame(frame)`` with the per-ticket rules vectorised in NumPy.
+
+    The frame's columns are viewed as arrays without copying.  Resolution
+    times use the same integer microsecond arithmetic as the accumulator,
+    per-name stats come from ``np.bincount`` on the categorical codes and
+    the monthly trends from integer month indices.  Float totals are
+    summed in row order (``_np_running_sum``, or ``np.bincount`` weights,
+    which add in row order), and every dict is filled in first-appearance
+    order, so the result equals ``update_frame``'s exactly.  Open tickets
+    are kept as ``_OpenColumns``, whose age, overdue and staleness figures
+    ``finalize()`` works out with ``_np_open_figures``.
+    """
+    n = len(frame)
+    if not n:
+        return
+    m = metrics
+    d = m.d
+    config = m.config
+    na = _NA_INT
+
+    def _column(values: Any, dtype: Any) -> Any:
+        return np.frombuffer(values, dtype=dtype)
+
+    created = _column(frame.dates["created"], np.int64)
+    updated = _column(frame.dates["updated"], np.int64)
+    resolved = _column(frame.dates["resolved"], np.int64)
+    due = _column(frame.dates["due_date"], np.int64)
+    last_comment = _column(frame.dates["last_comment_date"], np.int64)
+    cats = frame.categories
+    codes = {name: _column(cat.codes, np.intc) for name, cat in cats.items()}
+    status_codes, status_values = codes["status"], cats["status"].values
+    assignee_codes, assignee_values = codes["assignee"], cats["assignee"].values
+    reporter_codes, reporter_values = codes["reporter"], cats["reporter"].values
+    priority_codes, priority_values = codes["priority"], cats["priority"].values
+    type_codes, type_values = codes["issue_type"], cats["issue_type"].values
+    story_points = _column(frame.floats["story_points"], np.float64)
+    made_sla = _column(frame.made_sla, np.int8)
+    text = frame.text
+
+    statuses = m.statuses
+    if statuses is frame.statuses:
+        is_open = _column(frame.is_open, np.uint8).astype(bool)
+        is_blocked = _column(frame.is_blocked, np.uint8).astype(bool)
+    else:
+        is_open = np.array([statuses[s].is_open for s in status_values], dtype=bool)[status_codes]
+        is_blocked = np.array([statuses[s].is_blocked for s in status_values], dtype=bool)[status_codes]
+    is_closed = ~is_open
+    has_sp = ~np.isnan(story_points)
+    sp = np.where(has_sp, story_points, 0.0)
+
+    opened_total = int(is_open.sum())
+    d.total_tickets += n
+    d.open_tickets += opened_total
+    d.closed_tickets += n - opened_total
+    d.blocked_tickets += int((is_open & is_blocked).sum())
+    unassigned_by = np.array([a in (config.default_unassigned, "") for a in assignee_values], dtype=bool)
+    d.unassigned_tickets += int((is_open & unassigned_by[assignee_codes]).sum())
+    if has_sp.any():
+        d.total_story_points += _np_running_sum(sp)
+        d.open_story_points += _np_running_sum(np.where(is_open, sp, 0.0))
+
+    # Categorical counts by code, back to names in first-appearance order
+    for code, count in _np_value_counts(status_codes):
+        name = status_values[code] or "Unknown"
+        d.status_counts[name] = d.status_counts.get(name, 0) + count
+    for code, count in _np_value_counts(assignee_codes[is_open]):
+        name = assignee_values[code]
+        d.assignee_counts[name] = d.assignee_counts.get(name, 0) + count
+    for code, count in _np_value_counts(priority_codes):
+        if priority_values[code]:
+            d.priority_counts[priority_values[code]] = d.priority_counts.get(priority_values[code], 0) + count
+    for code, count in _np_value_counts(type_codes):
+        if type_values[code]:
+            d.type_counts[type_values[code]] = d.type_counts.get(type_values[code], 0) + count
+    reporter_names = [r or "Unknown" for r in reporter_values]
+    n_assignees = len(assignee_values)
+    for flow, count in _np_value_counts(reporter_codes.astype(np.int64) * n_assignees + assignee_codes):
+        reporter_code, assignee_code = divmod(flow, n_assignees)
+        m.ra_flow[(reporter_names[reporter_code], assignee_values[assignee_code])] += count
+
+    # Monthly trends from integer month indices
+    for dates, counts in ((created, d.created_by_month), (resolved, d.resolved_by_month)):
+        months = dates[dates != na].astype("datetime64[us]").astype("datetime64[M]").astype(np.int64)
+        for month, count in _np_value_counts(months):
+            label = datetime(1970 + month // 12, month % 12 + 1, 1).strftime("%Y-%m")
+            counts[label] = counts.get(label, 0) + count
+
+    # Per-assignee / per-reporter stats
+    def _per_code(codes_: Any, mask: Any = None, weights: Any = None) -> List[Any]:
+        size = int(codes_.max()) + 1
+        if mask is not None:
+            codes_ = codes_[mask]
+            weights = weights[mask] if weights is not None else None
+        return np.bincount(codes_, weights=weights, minlength=size).tolist()
+
+    total = _per_code(assignee_codes)
+    opened = _per_code(assignee_codes, is_open)
+    sp_sum = _per_code(assignee_codes, None, sp)
+    for code, _ in _np_value_counts(assignee_codes):
+        a = m.assignee_stats[assignee_values[code]]
+        a["total"] += total[code]
+        a["open"] += opened[code]
+        a["closed"] += total[code] - opened[code]
+        a["story_points"] += sp_sum[code]
+    total = _per_code(reporter_codes)
+    opened = _per_code(reporter_codes, is_open)
+    for code, _ in _np_value_counts(reporter_codes):
+        r = m.reporter_stats[reporter_names[code]]
+        r["total"] += total[code]
+        r["open"] += opened[code]
+        r["closed"] += total[code] - opened[code]
+
+    def _gather(values: List[Any], rows: Any) -> List[Any]:
+        """``[values[i] for i in rows]``, without a Python-level loop."""
+        return np.array(values, dtype=object)[rows].tolist()
+
+    # Open tickets, as columns for finalize()
+    open_rows = np.flatnonzero(is_open)
+    last_activity = np.where(last_comment != na, last_comment, updated)
+    m.open_columns.append(_OpenColumns(
+        keys=_gather(text["key"], open_rows),
+        summaries=[summary[:80] for summary in _gather(text["summary"], open_rows)],
+        previews=list(map(_comment_preview, _gather(text["last_comment_text"], open_rows))),
+        assignee_codes=assignee_codes[open_rows], assignees=list(assignee_values),
+        status_codes=status_codes[open_rows], statuses=list(status_values),
+        reporter_codes=reporter_codes[open_rows], reporters=reporter_names,
+        created=created[open_rows], last_activity=last_activity[open_rows], due_date=due[open_rows],
+    ))
+
+    # Resolution time
+    done = is_closed & (created != na) & (resolved != na)
+    res_days = (resolved - created)[done] / 1000000 / 86400
+    m.resolution_days["sum"] += _np_running_sum(res_days)
+    m.resolution_days["count"] += len(res_days)
+    for name, rows in _np_groups(type_codes[done], lambda code: type_values[code] or "Unknown"):
+        pair = m.resolution_by_type[name]
+        pair["sum"] += _np_running_sum(res_days[rows])
+        pair["count"] += int(rows.sum())
+    for name, rows in _np_groups(priority_codes[done], lambda code: priority_values[code] or None):
+        pair = m.resolution_by_priority[name]
+        pair["sum"] += _np_running_sum(res_days[rows])
+        pair["count"] += int(rows.sum())
+
+    # Epic / sprint progress, with the text columns coded on the fly
+    for column, stats in ((text["epic_link"], m.epic_stats), (text["sprint"], m.sprint_stats)):
+        index = {name: code for code, name in enumerate(dict.fromkeys(column))}
+        ids = np.fromiter(map(index.__getitem__, column), dtype=np.int64, count=n)
+        total = _per_code(ids)
+        opened = _per_code(ids, is_open)
+        sp_sum = _per_code(ids, None, sp)
+        for name, code in index.items():
+            if name:
+                s = stats[name]
+                s["total"] += total[code]
+                s["open"] += opened[code]
+                s["closed"] += total[code] - opened[code]
+                s["story_points"] += sp_sum[code]
+
+    # Estimation accuracy
+    estimate = _column(frame.ints["original_estimate_secs"], np.int64)
+    spent = _column(frame.ints["time_spent_secs"], np.int64)
+    estimated = (estimate != na) & (spent != na)
+    for name, rows in _np_groups(type_codes[estimated], lambda code: type_values[code] or "Unknown"):
+        est = m.estimate_by_type[name]
+        est["estimated"] += sum(estimate[estimated][rows].tolist())
+        est["actual"] += sum(spent[estimated][rows].tolist())
+        est["count"] += int(rows.sum())
+
+    # --- ServiceNow-specific ---
+    if config.has_sla:
+        rated = made_sla >= 0
+        m.sla_met += int((made_sla == 1).sum())
+        m.sla_missed += int((made_sla == 0).sum())
+        met = _per_code(priority_codes, made_sla == 1)
+        missed = _per_code(priority_codes, made_sla == 0)
+        for code, _ in _np_value_counts(priority_codes[rated]):
+            pri = m.sla_by_pri[priority_values[code] or "Unknown"]
+            pri["met"] += met[code]
+            pri["missed"] += missed[code]
+
+    if config.has_assignment_groups:
+        group_codes, group_values = codes["assignment_group"], cats["assignment_group"].values
+        total = _per_code(group_codes)
+        opened = _per_code(group_codes, is_open)
+        met = _per_code(group_codes, made_sla == 1)
+        missed = _per_code(group_codes, made_sla == 0)
+        for code, _ in _np_value_counts(group_codes):
+            if group_values[code]:
+                g = m.ag_stats[group_values[code]]
+                g["total"] += total[code]
+                g["open"] += opened[code]
+                g["closed"] += total[code] - opened[code]
+                g["sla_met"] += met[code]
+                g["sla_missed"] += missed[code]
+
+    if config.has_reassignment:
+        for name, pair in (("reassignment_count", m.reassignment), ("reopen_count", m.reopen)):
+            column = _column(frame.ints[name], np.int64)
+            present = column[column != na]
+            pair["sum"] += sum(present.tolist())
+            pair["count"] += len(present)
+
+    # Value counters; list fields are split once per distinct value
+    for name, counter, enabled in (
+            ("assignment_group", m.assignment_group_counter, config.has_assignment_groups),
+            ("category", m.category_counter, config.has_categories),
+            ("subcategory", m.subcategory_counter, config.has_categories),
+            ("contact_type", m.contact_type_counter, config.has_contact_type),
+            ("escalation", m.escalation_counter, config.has_escalation)):
+        if enabled:
+            for code, count in _np_value_counts(codes[name]):
+                if cats[name].values[code]:
+                    counter[cats[name].values[code]] += count
+    for name, counter in (("components", m.component_counter), ("labels", m.label_counter)):
+        for code, count in _np_value_counts(codes[name]):
+            for part in _split_csv_parts(cats[name].values[code]):
+                counter[part] += count
+
+
+# ---------------------------------------------------------------------------
+# Partial-aggregate files
+# ---------------------------------------------------------------------------
+
+_PARTIAL_FORMAT = "jira-dashboard-partial"
+# Bump when the layout of to_partial() changes
+_PARTIAL_VERSION = 1
+# Open-ticket rows kept per partial-aggregate file, most stale first
+_PARTIAL_STALE_ROWS = 50
+
+
+class _Partial(NamedTuple):
+    metrics: MetricsAccumulator
+    as_of: datetime
+    stale_days: int
+    title: str
+    source_file: str
+
+
+def _write_partial(path: Path, metrics: MetricsAccumulator, now: datetime, stale_days: int,
+                   title: str, source_file: str) -> None:
+    """Save *metrics* as of *now* as a partial-aggregate file (gzipped JSON)."""
+    payload = {
+        "format": _PARTIAL_FORMAT,
+        "version": _PARTIAL_VERSION,
+        "source": metrics.config.name,
+        "as_of": now.isoformat(),
+        "stale_days": stale_days,
+        "title": title,
+        "source_file": source_file,
+        "metrics": metrics.to_partial(now, stale_days),
+    }
+    text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    Path(path).write_bytes(gzip.compress(text.encode("utf-8"), mtime=0))
+
+
+def _read_partial(path: Path) -> _Partial:
+    """Load a file written by ``_write_partial``.
+
+    Raises ValueError for anything else, including files written by a
+    different ``_PARTIAL_VERSION``.
+    """
+    data = Path(path).read_bytes()
+    try:
+        payload = json.loads(gzip.decompress(data))
+    except (OSError, EOFError, ValueError):
+        payload = None
+    if not isinstance(payload, dict) or payload.get("format") != _PARTIAL_FORMAT:
+        raise ValueError(f"{path} is not a partial-aggregate file")
+    if payload.get("version") != _PARTIAL_VERSION:
+        raise ValueError(f"{path} has partial-aggregate format version {payload.get('version')}; "
+                         f"this version reads {_PARTIAL_VERSION}")
+    config = _servicenow_config() if payload.get("source") == "servicenow" else _jira_config()
+    try:
+        return _Partial(MetricsAccumulator.from_partial(payload["metrics"], config),
+                        datetime.fromisoformat(payload["as_of"]), int(payload["stale_days"]),
+                        str(payload["title"]), str(payload["source_file"]))
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError(f"{path} is a damaged partial-aggregate file ({exc!r})") from None
+
+
 # ---------------------------------------------------------------------------
 # HTML Generation
 # ---------------------------------------------------------------------------
@@ -1355,11 +4263,18 @@ _SN_PREFIX_MAP = {
 }
 
 
-def _auto_title(tickets: List[JiraTicket], user_title: Optional[str],
+def _auto_title(tickets: "List[JiraTicket] | TicketFrame | _StreamedTickets", user_title: Optional[str],
                 config: Optional[SourceConfig] = None) -> str:
     if user_title:
         return user_title
-    if not tickets:
+    if isinstance(tickets, TicketFrame):
+        keys, projects_ = tickets.text["key"], tickets.text["project"]
+    elif isinstance(tickets, _StreamedTickets):
+        keys, projects_ = tickets.keys, tickets.projects
+    else:
+        keys = [t.key for t in tickets]
+        projects_ = [t.project for t in tickets]
+    if not keys:
         default = "Dashboard"
         if config:
             default = f"{config.display_name} Dashboard"
@@ -1368,9 +4283,9 @@ def _auto_title(tickets: List[JiraTicket], user_title: Optional[str],
     if config and config.name == "servicenow":
         # Detect SN ticket prefixes
         prefix_counts: Dict[str, int] = defaultdict(int)
-        for t in tickets:
-            if t.key:
-                prefix = re.match(r"^([A-Z]+)", t.key)
+        for key in keys:
+            if key:
+                prefix = re.match(r"^([A-Z]+)", key)
                 if prefix:
                     prefix_counts[prefix.group(1)] += 1
         if prefix_counts:
@@ -1381,11 +4296,11 @@ def _auto_title(tickets: List[JiraTicket], user_title: Optional[str],
 
     # Jira: group by project key
     projects = set()
-    for t in tickets:
-        if t.key and "-" in t.key:
-            projects.add(t.key.split("-")[0])
-        elif t.project:
-            projects.add(t.project)
+    for key, project in zip(keys, projects_):
+        if key and "-" in key:
+            projects.add(key.split("-")[0])
+        elif project:
+            projects.add(project)
     if projects:
         return ", ".join(sorted(projects)) + " Dashboard"
     return "Jira Dashboard"
@@ -2277,7 +5192,7 @@ function sortTickets(col) {{
 function renderTicketTable() {{
     const el = document.getElementById('ticket-table');
     if (!allTickets || allTickets.length === 0) {{ el.innerHTML = '<div class="no-data">No ticket data available</div>'; return; }}
-    const cols = allHeaders.slice(0, 12);
+    const cols = allHeaders.slice(0, {_TABLE_COLUMNS});
     const totalPages = Math.ceil(filteredTickets.length / pageSize);
     const start = (currentPage - 1) * pageSize;
     const pageData = filteredTickets.slice(start, start + pageSize);
@@ -2414,11 +5329,82 @@ safeRender('ticket-table', () => renderTicketTable());
 # CLI
 # ---------------------------------------------------------------------------
 
+def _merge_main(argv: List[str]) -> int:
+    """``merge`` subcommand: one dashboard from several partial-aggregate files."""
+    parser = argparse.ArgumentParser(
+        prog="jira_dashboard.py merge",
+        description="Combine partial-aggregate files written with --partial into one dashboard."
+    )
+    parser.add_argument("partial_files", nargs="+",
+                        help="Files written by --partial, from any number of exports or machines")
+    parser.add_argument("-o", "--output", default="dashboard.html",
+                        help="Output HTML file (default: dashboard.html)")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Print each file's snapshot details")
+    parser.add_argument("--title", default=None,
+                        help="Dashboard title (default: the files' own title when they share one)")
+    args = parser.parse_args(argv)
+
+    partials: List[_Partial] = []
+    for name in args.partial_files:
+        try:
+            partial = _read_partial(Path(name))
+        except FileNotFoundError:
+            print(f"Error: File not found: {name}", file=sys.stderr)
+            return 1
+        except (OSError, ValueError) as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        if args.verbose:
+            print(f"{name}: {partial.metrics.d.total_tickets} tickets from {partial.source_file}, "
+                  f"as of {partial.as_of:%Y-%m-%d %H:%M}")
+        partials.append(partial)
+
+    stale_values = sorted({p.stale_days for p in partials})
+    if len(stale_values) > 1:
+        print(f"Error: the files were written with different --stale-days values "
+              f"({', '.join(map(str, stale_values))})", file=sys.stderr)
+        return 1
+    stale_days = stale_values[0]
+    config = partials[0].metrics.config
+    metrics = MetricsAccumulator(config)
+    try:
+        for partial in partials:
+            metrics.merge(partial.metrics)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    # Each file's age and staleness figures are as of its own snapshot
+    data = metrics.finalize(max(p.as_of for p in partials), stale_days)
+
+    titles = {p.title for p in partials}
+    title = args.title or (titles.pop() if len(titles) == 1 else f"{config.display_name} Dashboard")
+    source_file = partials[0].source_file
+    if len(partials) > 1:
+        source_file = f"{source_file} + {len(partials) - 1} more"
+    html_content = generate_html([], data, title=title, source_file=source_file,
+                                 stale_days=stale_days, config=config)
+    output_path = Path(args.output)
+    output_path.write_text(html_content, encoding="utf-8")
+    print(f"Dashboard written to {output_path}")
+    return 0
+
+
 def main(argv: Optional[List[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    # An export that is itself named "merge" still wins over the subcommand
+    if argv and argv[0] == "merge" and not os.path.exists(argv[0]):
+        return _merge_main(argv[1:])
     parser = argparse.ArgumentParser(
-        description="Generate an HTML dashboard from a Jira or ServiceNow CSV export."
+        description="Generate an HTML dashboard from a Jira or ServiceNow CSV export.",
+        epilog="To roll several exports up into one dashboard without their CSVs, write each "
+               "with --partial and combine the files with 'jira_dashboard.py merge FILE...'. "
+               "An existing file named 'merge' is read as an export instead."
     )
-    parser.add_argument("input_csv", help="Path to Jira or ServiceNow CSV export")
+    parser.add_argument("input_csv", nargs="+",
+                        help="Jira or ServiceNow CSV export(s), or - for standard input; "
+                             "several files or globs are merged into one dashboard")
     parser.add_argument("-o", "--output", default="dashboard.html",
                         help="Output HTML file (default: dashboard.html)")
     parser.add_argument("-v", "--verbose", action="store_true",
@@ -2430,55 +5416,130 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--source", choices=["jira", "servicenow", "auto"],
                         default="auto",
                         help="CSV source format (default: auto-detect from headers)")
+    parser.add_argument("--workers", type=int, default=None, metavar="N",
+                        help="Worker processes for splitting one large export, or for "
+                             "parsing several at once (default: 1 for a single file, "
+                             "one per CPU for several)")
+    parser.add_argument("--cache", nargs="?", const=str(_default_cache_dir()), default=None,
+                        metavar="DIR",
+                        help="Reuse parsed exports from an on-disk cache, refreshed when the "
+                             f"file changes (default DIR: {_default_cache_dir()})")
+    parser.add_argument("--columns", default=None, metavar="COLS",
+                        help="Keep only these comma-separated columns in the full ticket table, "
+                             "or 'auto' for the columns the dashboard uses (default: all)")
+    parser.add_argument("--engine", choices=_ENGINES, default="python",
+                        help="Metrics engine; 'numpy' is vectorised and needs NumPy (default: python)")
+    parser.add_argument("--partial", default=None, metavar="FILE",
+                        help="Instead of a dashboard, write the export's mergeable metrics to FILE "
+                             "for the merge subcommand")
     args = parser.parse_args(argv)
+    if args.engine == "numpy" and np is None:
+        print("Error: --engine numpy needs NumPy (pip install numpy)", file=sys.stderr)
+        return 1
+    columns: "Optional[str | List[str]]" = None
+    if args.columns is not None:
+        columns = "auto" if args.columns.strip().lower() == "auto" else [
+            name for name in args.columns.split(",") if name.strip()]
 
-    input_path = Path(args.input_csv)
-    if not input_path.exists():
-        print(f"Error: File not found: {args.input_csv}", file=sys.stderr)
+    try:
+        input_paths, missing = _expand_inputs(args.input_csv)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return 1
+    for pattern in missing:
+        print(f"Error: File not found: {pattern}", file=sys.stderr)
+    if missing:
         return 1
+    input_path = input_paths[0]
 
-    # Determine source config
-    if args.source == "auto":
-        # Read headers to auto-detect
-        content = _read_file(input_path)
-        reader = csv.reader(io.StringIO(content))
-        try:
-            headers = next(reader)
-        except StopIteration:
-            headers = []
-        detected = _detect_source(headers)
-        config = _servicenow_config() if detected == "servicenow" else _jira_config()
-        if args.verbose:
-            print(f"Auto-detected source: {config.display_name}")
-            lower = {h.strip().lower() for h in headers}
-            jira_indicators = {"issue key", "issue_key", "sprint", "epic link", "epic_link",
-                               "story points", "story_points", "issue type", "issuetype",
-                               "fix version/s"}
-            sn_indicators = {"number", "opened at", "opened_at", "assignment group",
-                             "assignment_group", "made sla", "made_sla", "short description",
-                             "short_description", "configuration item", "configuration_item",
-                             "cmdb_ci", "contact type", "contact_type", "opened by",
-                             "opened_by", "caller_id", "resolved at", "resolved_at",
-                             "reassignment count", "reassignment_count", "incident_state",
-                             "sys_class_name", "sys_created_on", "sys_updated_on",
-                             "service_offering", "business_service"}
-            j_hits = sorted(ind for ind in jira_indicators if ind in lower)
-            s_hits = sorted(ind for ind in sn_indicators if ind in lower)
-            j_cf = sum(1 for h in lower if h.startswith("custom field"))
-            print(f"  Jira score: {len(j_hits) + j_cf} (headers: {j_hits}, custom fields: {j_cf})")
-            print(f"  ServiceNow score: {len(s_hits)} (headers: {s_hits[:10]}{'...' if len(s_hits) > 10 else ''})")
-            print(f"  First header: {headers[0]!r}")
-    elif args.source == "servicenow":
-        config = _servicenow_config()
-    else:
+    # Determine source config; "auto" detects it from the header row of the
+    # same read that feeds the parser.
+    if args.source == "servicenow":
+        config: Optional[SourceConfig] = _servicenow_config()
+    elif args.source == "jira":
         config = _jira_config()
+    else:
+        config = None
 
-    tickets = _parse_csv(str(input_path), config, verbose=args.verbose)
-    if not tickets:
+    if len(input_paths) > 1:
+        try:
+            config, merged = _ingest_files(input_paths, config, args.workers or os.cpu_count() or 1,
+                                           args.verbose, columns)
+        except ValueError as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        if args.engine == "numpy":
+            tickets = TicketFrame.from_tickets(merged, config)
+        else:
+            tickets = _StreamedTickets(config, metrics_only=bool(args.partial)).feed(merged)
+        source_file = f"{input_path.name} + {len(input_paths) - 1} more"
+        if args.cache:
+            print("Warning: --cache is only used for a single input file; "
+                  "parsing all inputs afresh", file=sys.stderr)
+    else:
+        # Archive members have no file of their own to validate an entry
+        # against, and stdin and pipes no file at all
+        cache = (_ParseCache(Path(args.cache), columns)
+                 if args.cache and isinstance(input_path, Path) and input_path.is_file() else None)
+        if args.cache and cache is None:
+            print(f"Warning: --cache is only used for plain files; parsing {input_path} afresh",
+                  file=sys.stderr)
+        cached = cache.load(input_path, args.source) if cache else None
+        if cached is not None:
+            if args.verbose:
+                print(f"Loaded {len(cached)} tickets for {input_path} from cache "
+                      f"{cache.entry(input_path, args.source)} (source: {cached.config.display_name})")
+        elif cache is not None:
+            cached = cache.refresh(input_path, args.source)
+            if cached is not None and args.verbose:
+                print(f"Re-ingested {input_path} incrementally: {len(cached) - cached.reused} of "
+                      f"{len(cached)} rows parsed, the rest reused from cache "
+                      f"(source: {cached.config.display_name})")
+        if cached is not None:
+            config = cached.config
+            tickets = cached
+        else:
+            stat = input_path.stat() if cache is not None else None
+            with IngestSession(input_path, config, columns) as session:
+                if args.verbose and session.detected:
+                    session.report_detection()
+                config = session.config
+                if cache is None and args.engine == "python":
+                    # Nothing needs a frame: fold the tickets in as they are parsed
+                    tickets = _StreamedTickets(config, metrics_only=bool(args.partial))
+                    tickets.feed(session.tickets(args.workers or 1))
+                    tickets.missing_columns = list(session.missing_columns)
+                else:
+                    tickets = session.frame(args.workers or 1)
+                if args.verbose:
+                    session.report_parse(tickets)
+            if cache is not None:
+                cache.store(input_path, args.source, tickets, stat)
+        # Kept with the cache entry, so warm runs warn as well
+        if tickets.missing_columns:
+            print(f"Warning: --columns not found in {input_path.name}: "
+                  f"{', '.join(tickets.missing_columns)}", file=sys.stderr)
+        source_file = input_path.name
+    if not len(tickets):
         print("Warning: No tickets found in CSV.", file=sys.stderr)
 
     title = _auto_title(tickets, args.title, config)
-    data = compute_dashboard_data(tickets, stale_days=args.stale_days, config=config)
+    if args.partial:
+        if isinstance(tickets, _StreamedTickets):
+            metrics = tickets.metrics
+        else:
+            metrics = MetricsAccumulator(config)
+            if args.engine == "numpy":
+                _numpy_update(metrics, tickets)
+            else:
+                metrics.update_frame(tickets)
+        _write_partial(Path(args.partial), metrics, datetime.now(), args.stale_days, title, source_file)
+        print(f"Partial metrics written to {args.partial}")
+        return 0
+    if isinstance(tickets, _StreamedTickets):
+        data = tickets.finalize(datetime.now(), args.stale_days)
+    else:
+        data = compute_dashboard_data(tickets, stale_days=args.stale_days, config=config, engine=args.engine)
 
     if args.verbose:
         print(f"  Open: {data.open_tickets}, Closed: {data.closed_tickets}")
@@ -2499,9 +5560,9 @@ def main(argv: Optional[List[str]] = None) -> int:
             print(f"  Avg reassignments: {data.avg_reassignment_count}, Avg reopens: {data.avg_reopen_count}")
 
     html_content = generate_html(
-        tickets, data,
+        [], data,
         title=title,
-        source_file=input_path.name,
+        source_file=source_file,
         stale_days=args.stale_days,
         config=config,
     )
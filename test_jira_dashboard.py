@@ -1,43 +1,96 @@
 #!/usr/bin/env python3
 """Tests for jira_dashboard.py."""
 
+import bz2
+import contextlib
 import csv
+import dataclasses
+import gzip
+import importlib.util
 import io
 import json
+import lzma
 import os
+import pickle
+import re
 import sys
 import tempfile
+import threading
 import unittest
+import zipfile
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest import mock
 
 # Ensure the module is importable
 sys.path.insert(0, os.path.dirname(__file__))
 
+import jira_dashboard
 from jira_dashboard import (
     COLUMN_ALIASES,
+    IngestSession,
     JiraTicket,
+    MetricsAccumulator,
     SourceConfig,
     Ticket,
+    TicketFrame,
+    _ColumnDateParser,
+    _HeaderIndex,
+    _LAZY_TEXT_CHARS,
+    _MAX_OPEN_MAPS,
+    _MappedExport,
+    _MappedRawFields,
+    _OPEN_MAPS,
+    _PREVIEW_CHARS,
+    _ParseCache,
+    _RowExtractor,
+    _STDIN,
+    _StatusClassifier,
+    _TABLE_COLUMNS,
     _build_alias_lookup,
+    _dedupe_tickets,
     _detect_source,
+    _expand_inputs,
     _extract_comments,
     _find_comment_columns,
+    _ingest_files,
     _is_blocked,
     _is_open,
     _jira_config,
     _parse_csv,
+    _parse_iso_timestamp,
+    _parse_jira_timestamp,
+    _raw_fields,
+    _read_partial,
+    _record_boundaries,
     _servicenow_config,
+    _sniff_encoding,
     _split_csv_field,
+    _status_classifier,
+    _write_partial,
+    compile_schema,
     compute_dashboard_data,
     format_duration,
     generate_html,
+    iter_tickets,
     main,
     parse_date,
     parse_duration_seconds,
     parse_jira_csv,
 )
 
+HERE = Path(__file__).resolve().parent
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+def _accumulated_metrics(data):
+    """Serialise the DashboardData fields a MetricsAccumulator produces."""
+    # Themes and the ticket table are not accumulator output
+    fields = dataclasses.asdict(data)
+    for name in ("issue_themes", "all_headers", "all_tickets_json"):
+        del fields[name]
+    return json.dumps(fields)
+
 
 class TestDateParsing(unittest.TestCase):
     def test_jira_format_am_pm(self):
@@ -83,6 +136,69 @@ class TestDateParsing(unittest.TestCase):
         self.assertEqual(dt.year, 2024)
 
 
+class TestFastDateParsers(unittest.TestCase):
+    def test_jira_shapes(self):
+        self.assertEqual(_parse_jira_timestamp("28/Nov/25 5:03 PM"), datetime(2025, 11, 28, 17, 3))
+        self.assertEqual(_parse_jira_timestamp("01/jan/24 12:15 AM"), datetime(2024, 1, 1, 0, 15))
+        self.assertEqual(_parse_jira_timestamp("15/Jan/2024 17:45"), datetime(2024, 1, 15, 17, 45))
+        self.assertEqual(_parse_jira_timestamp("15/Jan/70 09:00 AM"), datetime(1970, 1, 15, 9, 0))
+        self.assertIsNone(_parse_jira_timestamp("15/Foo/24 09:30 AM"))
+        self.assertIsNone(_parse_jira_timestamp("15/Jan/24 13:30 PM"))
+        # Digits int() cannot read fall back instead of raising
+        self.assertIsNone(_parse_jira_timestamp("1\u00b2/Jan/24 09:30 AM"))
+        self.assertIsNone(_parse_jira_timestamp("15/Jan/24 9:3\u00b2 AM"))
+        self.assertIsNone(parse_date("15/Jan/2\u00b2 09:30 AM"))
+
+    def test_iso_shapes(self):
+        self.assertEqual(_parse_iso_timestamp("2024-01-15T14:30:00"), datetime(2024, 1, 15, 14, 30))
+        self.assertEqual(_parse_iso_timestamp("2024-01-15 14:30"), datetime(2024, 1, 15, 14, 30))
+        self.assertEqual(_parse_iso_timestamp("2024-01-15"), datetime(2024, 1, 15))
+        # Fractions and offsets are left to the strptime format list
+        self.assertIsNone(_parse_iso_timestamp("2024-01-15T14:30:00+00:00"))
+        self.assertEqual(parse_date("2024-01-15T14:30:00.5+01:00"), datetime(2024, 1, 15, 14, 30, 0, 500000))
+
+    def test_iso_offsets_of_fast_path_length(self):
+        # 16 and 19 characters long, but with a UTC offset: never aware datetimes
+        for value in ("2024-01-05T10:00+01", "2024-01-05 10+01:00", "2024-01-05 10:00Z"):
+            self.assertIsNone(_parse_iso_timestamp(value), value)
+            parsed = parse_date(value)
+            self.assertTrue(parsed is None or parsed.tzinfo is None, value)
+
+
+class TestColumnDateParser(unittest.TestCase):
+    def test_learns_month_first_from_sample(self):
+        p = _ColumnDateParser("created")
+        self.assertEqual(p.learn(["03/04/2024", "12/25/2024", "01/02/2024"]), "%m/%d/%Y")
+        self.assertEqual(p("03/04/2024"), datetime(2024, 3, 4))
+        self.assertEqual(p.hits, 1)
+
+    def test_ambiguous_sample_keeps_day_first(self):
+        p = _ColumnDateParser("created")
+        self.assertEqual(p.learn(["03/04/2024", "01/02/2024"]), "%d/%m/%Y")
+        self.assertEqual(p("03/04/2024"), datetime(2024, 4, 3))
+
+    def test_fallback_counters(self):
+        p = _ColumnDateParser("updated")
+        p.learn(["2024-01-15"])
+        self.assertEqual(p("2024-01-16"), datetime(2024, 1, 16))
+        self.assertEqual(p("15/Jan/24 09:30 AM"), datetime(2024, 1, 15, 9, 30))
+        self.assertIsNone(p("garbage"))
+        self.assertIsNone(p(""))
+        self.assertEqual((p.hits, p.fallbacks, p.misses), (1, 2, 1))
+
+    def test_csv_column_learned(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "us.csv")
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["Issue key", "Created"])
+                writer.writerow(["US-1", "03/04/2024"])
+                writer.writerow(["US-2", "12/31/2024"])
+            tickets = parse_jira_csv(path)
+            self.assertEqual(tickets[0].created, datetime(2024, 3, 4))
+            self.assertEqual(tickets[1].created, datetime(2024, 12, 31))
+
+
 class TestDurationParsing(unittest.TestCase):
     def test_weeks(self):
         self.assertEqual(parse_duration_seconds("1w"), 5 * 8 * 3600)
@@ -168,6 +284,70 @@ class TestColumnNormalisation(unittest.TestCase):
         indices = _find_comment_columns(headers)
         self.assertEqual(indices, [2, 3])
 
+    def test_lookup_matches_alias_scan(self):
+        cf = re.compile(r"^custom\s+field\s*\((.+)\)$")
+        for name, config in (("Jira.csv", _jira_config()), ("servicenow.csv", _servicenow_config())):
+            with open(HERE / name, newline="", encoding="utf-8-sig") as f:
+                headers = next(csv.reader(f)) + ["Custom field (Sprint)", "Custom field ( Labels )"]
+            # The alias-major scan _build_alias_lookup used to run
+            expected = {}
+            for canonical, aliases in config.column_aliases.items():
+                found = expected[canonical] = []
+                for alias in aliases:
+                    for i, h in enumerate(headers):
+                        hl = h.strip().lower()
+                        m = cf.match(hl)
+                        if (hl == alias or (m and m.group(1).strip() == alias)) and i not in found:
+                            found.append(i)
+            self.assertEqual(_build_alias_lookup(headers, config.column_aliases), expected)
+
+    def test_compiled_schema_is_memoised(self):
+        config = _servicenow_config()
+        self.assertIsNot(config, _servicenow_config())
+        headers = ["Number", "State", "Work notes", "Comments"]
+        schema = compile_schema(headers, config)
+        self.assertIs(compile_schema(tuple(headers), config), schema)
+        # Keyed by value: equal configs share it, one changed in place does not
+        self.assertIs(compile_schema(headers, _servicenow_config()), schema)
+        self.assertIsNot(compile_schema(headers + ["Priority"], config), schema)
+        changed = _servicenow_config()
+        changed.column_aliases["key"] = ["state"]
+        self.assertEqual(compile_schema(headers, changed).lookup["key"], [1])
+        self.assertEqual(schema.lookup["key"], [0])
+        self.assertEqual(schema.comment_cols, [2, 3])
+        for status in ("New", " on hold ", "Closed", "Something else"):
+            flags = schema.statuses[status]
+            self.assertEqual(flags[:2], (_is_open(status, config), _is_blocked(status, config)))
+
+
+class TestRowExtractor(unittest.TestCase):
+    def test_values_coalesce_and_strip(self):
+        headers = ["Issue key", "Sprint", "Sprint", "Summary"]
+        ex = _RowExtractor(headers, _jira_config())
+        values = ex.values(["  K-1 ", "", " Sprint 2 ", " Title "])
+        self.assertEqual(values["key"], "K-1")
+        self.assertEqual(values["sprint"], "Sprint 2")
+        self.assertEqual(values["summary"], "Title")
+        self.assertNotIn("priority", values)
+
+    def test_short_row(self):
+        ex = _RowExtractor(["Issue key", "Summary", "Created"], _jira_config())
+        t = ex.build(["K-2"])
+        self.assertEqual(t.key, "K-2")
+        self.assertEqual(t.summary, "")
+        self.assertIsNone(t.created)
+        self.assertEqual(t.assignee, "Unassigned")
+        self.assertEqual(t.raw_fields, {"Issue key": "K-2"})
+
+    def test_categorical_values_interned(self):
+        ex = _RowExtractor(["Issue key", "Status", "Assignee"], _jira_config())
+        # Equal cells from different rows arrive as distinct string objects
+        t1 = ex.build(["K-1", "".join(["In ", "Progress"]), "Alice"])
+        t2 = ex.build(["K-2", "".join(["In ", "Progress"]), "Bob"])
+        self.assertIs(t1.status, t2.status)
+        self.assertEqual(ex.dictionaries["assignee"].values, ["Alice", "Bob"])
+        self.assertEqual(ex.dictionaries["status"].code("In Progress"), 0)
+
 
 class TestCSVParsing(unittest.TestCase):
     def _write_csv(self, tmpdir, rows, filename="test.csv", bom=False):
@@ -251,6 +431,82 @@ class TestCSVParsing(unittest.TestCase):
             tickets = parse_jira_csv(path)
             self.assertEqual(tickets[0].raw_fields["Custom Field"], "custom_value")
 
+    def test_iter_tickets_streams_rows(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = self._write_csv(td, [
+                ["Issue key", "Summary", "Status"],
+                ["IT-1", "First", "Open"],
+                ["", "", ""],
+                ["IT-2", "Second", "Done"],
+            ])
+            it = iter_tickets(path, _jira_config())
+            self.assertIs(iter(it), it)
+            self.assertEqual(next(it).key, "IT-1")
+            self.assertEqual([t.key for t in it], ["IT-2"])
+
+    def test_cp1252_fallback(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "win.csv")
+            Path(path).write_bytes("Issue key,Summary\r\nWIN-1,Caf\u00e9 \u2013 menu\r\n".encode("cp1252"))
+            tickets = parse_jira_csv(path)
+            self.assertEqual(tickets[0].summary, "Caf\u00e9 \u2013 menu")
+
+    def test_late_invalid_byte_only_affects_that_byte(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "mixed.csv")
+            filler = "".join(f"F-{i},na\u00efve r\u00e9sum\u00e9\n" for i in range(5000))
+            data = ("Issue key,Summary\n" + filler).encode("utf-8") + "LATE-1,Caf\u00e9\n".encode("cp1252")
+            Path(path).write_bytes(data)
+            tickets = parse_jira_csv(path)
+            self.assertEqual(tickets[0].summary, "na\u00efve r\u00e9sum\u00e9")
+            self.assertEqual(tickets[-1].key, "LATE-1")
+            self.assertEqual(tickets[-1].summary, "Caf\u00e9")
+
+    def test_sniff_encoding(self):
+        self.assertEqual(_sniff_encoding("caf\u00e9".encode("utf-8")), "utf-8")
+        self.assertEqual(_sniff_encoding("caf\u00e9".encode("utf-8")[:-1]), "utf-8")
+        self.assertEqual(_sniff_encoding(b"\xef\xbb\xbfcaf\xe9 ok"), "cp1252")
+
+    def test_duplicate_headers_kept(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = self._write_csv(td, [
+                ["Issue key", "Labels", "Labels", "Watchers"],
+                ["DUP-1", "alpha", "beta"],
+            ])
+            t = parse_jira_csv(path)[0]
+            self.assertEqual(t.raw_fields["Labels"], "alpha")
+            self.assertEqual(t.raw_fields["Labels (2)"], "beta")
+            # Short row: trailing header absent rather than empty
+            self.assertNotIn("Watchers", t.raw_fields)
+            self.assertEqual(list(t.raw_fields), ["Issue key", "Labels", "Labels (2)"])
+            self.assertEqual(t.raw_fields.to_dict(),
+                             {"Issue key": "DUP-1", "Labels": "alpha", "Labels (2)": "beta"})
+            # The full ticket table shows one column per header, with the
+            # last of its cells the row reaches
+            data = compute_dashboard_data([t])
+            self.assertEqual(data.all_headers, ["Issue key", "Labels"])
+            self.assertEqual(json.loads(data.all_tickets_json), [{"Issue key": "DUP-1", "Labels": "beta"}])
+            with IngestSession(path, columns=["labels"]) as session:
+                frame = session.frame()
+            self.assertEqual(compute_dashboard_data(frame).all_headers, ["Labels", "Labels (2)"])
+
+    def test_duplicate_suffix_skips_real_headers(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = self._write_csv(td, [
+                ["Issue key", "Labels", "Labels", "Labels (2)", "Labels"],
+                ["DUP-1", "alpha", "beta", "real", "gamma"],
+                ["DUP-2", "one", "two", "real"],
+            ])
+            tickets = parse_jira_csv(path)
+            self.assertEqual(list(tickets[0].raw_fields), ["Issue key", "Labels", "Labels (3)", "Labels (2)", "Labels (4)"])
+            self.assertEqual(tickets[0].raw_fields["Labels (2)"], "real")
+            data = compute_dashboard_data(tickets)
+            self.assertEqual(data.all_headers, ["Issue key", "Labels", "Labels (2)"])
+            self.assertEqual(json.loads(data.all_tickets_json), [
+                {"Issue key": "DUP-1", "Labels": "gamma", "Labels (2)": "real"},
+                {"Issue key": "DUP-2", "Labels": "two", "Labels (2)": "real"},
+            ])
+
     def test_verbose_output(self):
         with tempfile.TemporaryDirectory() as td:
             path = self._write_csv(td, [
@@ -278,6 +534,38 @@ class TestIsOpen(unittest.TestCase):
     def test_unknown_defaults_open(self):
         self.assertTrue(_is_open("Some Custom Status"))
 
+    def test_classifier_caches_each_raw_status(self):
+        config = _servicenow_config()
+        classifier = _status_classifier(config)
+        self.assertIs(compile_schema(["Number", "State"], config).statuses, classifier)
+        self.assertIs(_status_classifier(dataclasses.replace(config)), classifier)
+        # A config changed in place is classified afresh, and the shared
+        # classifier is unaffected
+        changed = _servicenow_config()
+        changed.closed_statuses.add("on hold")
+        self.assertEqual(_status_classifier(changed)["On Hold"], (False, True, True))
+        self.assertFalse(_is_open("On Hold", changed))
+        flags = classifier[" Closed Complete "]
+        self.assertEqual(flags, (False, False, True))
+        self.assertIs(classifier[" Closed Complete "], flags)
+        self.assertEqual(classifier["On Hold"], (True, True, False))
+        self.assertEqual(_status_classifier(None)["Whatever"], (True, False, False))
+
+        # Frames stamp the same flags per row at ingest
+        with IngestSession(HERE / "servicenow.csv") as session:
+            frame = session.frame()
+        statuses = frame.categories["status"]
+        self.assertEqual([bool(b) for b in frame.is_open],
+                         [classifier[statuses.values[c]].is_open for c in statuses.codes])
+
+    def test_repeat_checks_skip_freezing_the_status_sets(self):
+        config = _servicenow_config()
+        classifier = _status_classifier(config)
+        with mock.patch.object(jira_dashboard, "_status_key", side_effect=AssertionError):
+            self.assertIs(_status_classifier(config), classifier)
+            self.assertFalse(_is_open("Closed", config))
+            self.assertTrue(_is_blocked("On Hold", config))
+
 
 class TestMetricsComputation(unittest.TestCase):
     def _make_ticket(self, key="T-1", status="Open", created_days_ago=10,
@@ -351,6 +639,44 @@ class TestMetricsComputation(unittest.TestCase):
         data = compute_dashboard_data(tickets, stale_days=3, now=now)
         self.assertEqual(data.stale_tickets, 1)
 
+    def test_single_pass_over_tickets(self):
+        now = datetime(2024, 6, 15)
+        tickets = [
+            self._make_ticket("T-1", "Open", last_comment_days_ago=20, due_days_from_now=-1),
+            self._make_ticket("T-2", "Open", assignee="Bob"),
+            self._make_ticket("T-3", "Done", resolved_days_ago=2),
+        ]
+        # A one-shot generator: a second pass over it would see no tickets
+        walked = []
+
+        def once():
+            for t in tickets:
+                walked.append(t.key)
+                yield t
+
+        # ...and each ticket's status is classified exactly once
+        classified = []
+
+        class CountingClassifier(_StatusClassifier):
+            def __getitem__(self, status):
+                classified.append(status)
+                return super().__getitem__(status)
+
+        metrics = MetricsAccumulator()
+        metrics.statuses = CountingClassifier(metrics.config)
+        metrics.update(once())
+        data = metrics.finalize(now, stale_days=14)
+        self.assertEqual(walked, ["T-1", "T-2", "T-3"])
+        self.assertEqual(classified, ["Open", "Open", "Done"])
+        self.assertEqual(_accumulated_metrics(data),
+                         _accumulated_metrics(compute_dashboard_data(tickets, stale_days=14, now=now)))
+        self.assertEqual((data.total_tickets, data.open_tickets, data.stale_tickets, data.overdue_tickets),
+                         (3, 2, 1, 1))
+        self.assertEqual([r["key"] for r in data.oldest_open], ["T-1", "T-2"])
+        alice = data.assignee_breakdown[0]
+        self.assertEqual((alice["assignee"], alice["open"], alice["closed"], alice["overdue"], alice["stale"]),
+                         ("Alice", 1, 1, 1, 1))
+
     def test_status_counts(self):
         now = datetime(2024, 6, 15)
         tickets = [
@@ -615,6 +941,11 @@ class TestSplitCsvField(unittest.TestCase):
     def test_single(self):
         self.assertEqual(_split_csv_field("one"), ["one"])
 
+    def test_memoised_result_not_shared(self):
+        first = _split_csv_field("x; y")
+        first.append("z")
+        self.assertEqual(_split_csv_field("x; y"), ["x", "y"])
+
 
 class TestNewMetrics(unittest.TestCase):
     """Tests for all new enhancement metrics."""
@@ -921,6 +1252,52 @@ class TestCommentExtraction(unittest.TestCase):
         self.assertIsNone(date)
         self.assertEqual(text, "")
 
+    def test_newest_dated_comment_wins(self):
+        row = ["Plain first", "15/Jan/24 09:30 AM;user1;Old comment",
+               "20/Jan/24 02:00 PM;user2;Newer; with a semicolon", "No date here"]
+        date, text = _extract_comments(row, [0, 1, 2, 3])
+        self.assertEqual(date, datetime(2024, 1, 20, 14, 0))
+        self.assertEqual(text, "with a semicolon")
+        self.assertEqual(_extract_comments(["Plain first", "", "Plain last"], [0, 1, 2]),
+                         (None, "Plain first"))
+
+    def test_only_repeated_comment_columns_are_taken_as_ordered(self):
+        headers = ["Issue key", "Status", "Latest Comment", "Comment", "Comment", "Comment Summary"]
+        ex = _RowExtractor(headers, _jira_config())
+        row = ["K-1", "Open", "25/Jan/24 10:00 AM;user3;Newest, in another column",
+               "15/Jan/24 09:30 AM;user1;Old", "20/Jan/24 02:00 PM;user2;Newer",
+               "01/Jan/24 08:00 AM;user0;Oldest"]
+        t = ex.build(row)
+        self.assertEqual((t.last_comment_date, t.last_comment_text),
+                         (datetime(2024, 1, 25, 10, 0), "Newest, in another column"))
+        # Columns other than the repeated ones are compared by date, in any order
+        self.assertEqual(_extract_comments(row, [5, 2, 3], [4])[1], "Newest, in another column")
+        t = ex.build(row[:2] + ["", row[3], row[4], row[5]])
+        self.assertEqual(t.last_comment_text, "Newer")
+
+    def test_first_of_equally_dated_comments_wins(self):
+        headers = ["Issue key", "Status", "Comment", "Comment", "Comment", "Comment"]
+        ex = _RowExtractor(headers, _jira_config())
+        row = ["K-1", "Open", "15/Jan/24 09:30 AM;user1;Old",
+               "20/Jan/24 02:00 PM;user2;First reply", "20/Jan/24 02:00 PM;user3;Second reply", ""]
+        t = ex.build(row)
+        self.assertEqual((t.last_comment_date, t.last_comment_text),
+                         (datetime(2024, 1, 20, 14, 0), "First reply"))
+        # Same as comparing every column by date, leftmost first
+        self.assertEqual(_extract_comments(row, [2, 3, 4, 5]), (t.last_comment_date, "First reply"))
+        other = ["K-1", "Open", "20/Jan/24 02:00 PM;user4;Elsewhere"] + row[3:]
+        self.assertEqual(_extract_comments(other, [2], [3, 4, 5])[1], "Elsewhere")
+
+    def test_comments_read_for_open_tickets_only(self):
+        ex = _RowExtractor(["Issue key", "Status", "Comment"], _jira_config())
+        comment = "15/Jan/24 09:30 AM;user;Still looking"
+        open_ticket = ex.build(["K-1", "In Progress", comment])
+        closed_ticket = ex.build(["K-2", "Done", comment])
+        self.assertEqual(open_ticket.last_comment_date, datetime(2024, 1, 15, 9, 30))
+        self.assertEqual(open_ticket.last_comment_text, "Still looking")
+        self.assertIsNone(closed_ticket.last_comment_date)
+        self.assertEqual(closed_ticket.last_comment_text, "")
+
 
 class TestAutoDetect(unittest.TestCase):
     """Tests for _detect_source auto-detection."""
@@ -1279,6 +1656,15 @@ class TestBackwardsCompat(unittest.TestCase):
         t = JiraTicket(key="T-1", summary="Test")
         self.assertEqual(t.key, "T-1")
 
+    @unittest.skipIf(sys.version_info < (3, 10), "slotted dataclasses need Python 3.10+")
+    def test_jiraticket_is_slotted(self):
+        t = JiraTicket(key="T-3")
+        self.assertFalse(hasattr(t, "__dict__"))
+        t.status = "Open"
+        self.assertEqual(t.status, "Open")
+        with self.assertRaises(AttributeError):
+            t.not_a_field = 1
+
     def test_ticket_alias(self):
         # Ticket should be an alias for JiraTicket
         t = Ticket(key="T-2", summary="Test2")
@@ -1305,6 +1691,733 @@ class TestBackwardsCompat(unittest.TestCase):
         self.assertEqual(lookup["key"], [0])
 
 
+class TestTicketFrame(unittest.TestCase):
+    """The columnar engine must reproduce the ticket-list metrics exactly."""
+
+    def _check_parity(self, filename, config, frame=None):
+        tickets = _parse_csv(str(HERE / filename), config)
+        if frame is None:
+            frame = TicketFrame.from_tickets(tickets, config)
+        now = datetime(2026, 1, 1)
+        expected = compute_dashboard_data(tickets, now=now, config=config)
+        # Frames are folded column by column, never a ticket at a time
+        with mock.patch.object(MetricsAccumulator, "_fold", side_effect=AssertionError):
+            actual = compute_dashboard_data(frame, now=now)
+        self.assertEqual(actual, expected)
+        # Dict ordering reaches the HTML, so it must match too
+        self.assertEqual(json.dumps(dataclasses.asdict(actual)), json.dumps(dataclasses.asdict(expected)))
+        return tickets, frame
+
+    def test_jira_csv_parity(self):
+        self._check_parity("Jira.csv", _jira_config())
+
+    def test_servicenow_csv_parity(self):
+        self._check_parity("servicenow.csv", _servicenow_config())
+
+    def test_session_frame_parity(self):
+        # The parser's shared dictionaries also hold values no ticket keeps
+        # (blank assignees become "Unassigned"), so codes are not in order
+        # of first appearance.
+        with IngestSession(HERE / "Jira.csv", _jira_config()) as session:
+            frame = session.frame()
+        self.assertIn("", frame.categories["assignee"].values)
+        self._check_parity("Jira.csv", _jira_config(), frame)
+
+    def test_frames_fold_onto_running_totals(self):
+        now = datetime(2026, 1, 1)
+        for filename, config in (("Jira.csv", _jira_config()), ("servicenow.csv", _servicenow_config())):
+            tickets = _parse_csv(str(HERE / filename), config)
+            expected = MetricsAccumulator(config)
+            expected.update(tickets)
+            chunked = MetricsAccumulator(config)
+            for start in range(0, len(tickets), 7):
+                chunked.update_frame(TicketFrame.from_tickets(tickets[start:start + 7], config))
+            self.assertEqual(_accumulated_metrics(chunked.finalize(now)), _accumulated_metrics(expected.finalize(now)))
+
+    def test_ticket_round_trip(self):
+        tickets, frame = self._check_parity("servicenow.csv", _servicenow_config())
+        self.assertEqual(len(frame), len(tickets))
+        self.assertEqual(list(frame), tickets)
+
+
+class TestNumpyEngine(unittest.TestCase):
+    """``engine="numpy"`` must reproduce the stdlib engines exactly."""
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_parity_on_sample_exports(self):
+        now = datetime(2026, 1, 1)
+        for filename in ("Jira.csv", "servicenow.csv"):
+            with IngestSession(HERE / filename) as session:
+                frame = session.frame()
+            tickets = list(frame)
+            if filename == "Jira.csv":
+                # Open tickets without any dates, and a blank assignee
+                tickets += [JiraTicket(key="X-1", status="Open"), JiraTicket(key="X-2", status="Blocked")]
+                frame = TicketFrame.from_tickets(tickets, frame.config)
+            for stale_days, config in ((14, None), (3, _jira_config()), (3, _servicenow_config())):
+                expected = compute_dashboard_data(tickets, stale_days, now, config or frame.config)
+                for source in (frame, tickets):
+                    actual = compute_dashboard_data(source, stale_days, now, config or frame.config,
+                                                    engine="numpy")
+                    self.assertEqual(actual, expected)
+                    self.assertEqual(json.dumps(dataclasses.asdict(actual)),
+                                     json.dumps(dataclasses.asdict(expected)))
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_open_ticket_figures_are_vectorised(self):
+        now = datetime(2026, 1, 1)
+        with IngestSession(HERE / "Jira.csv") as session:
+            frame = session.frame()
+        expected = compute_dashboard_data(frame, 3, now)
+        # The per-ticket age loop is the Python engine's alone
+        with mock.patch.object(MetricsAccumulator, "add_age", side_effect=AssertionError):
+            actual = compute_dashboard_data(frame, 3, now, engine="numpy")
+        self.assertEqual(json.dumps(dataclasses.asdict(actual)), json.dumps(dataclasses.asdict(expected)))
+
+    @unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+    def test_cli_engine(self):
+        with tempfile.TemporaryDirectory() as td:
+            out = os.path.join(td, "out.html")
+            self.assertEqual(main(["-o", out, "--engine", "numpy", str(HERE / "servicenow.csv")]), 0)
+            self.assertIn("SLA Compliance", Path(out).read_text())
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            compute_dashboard_data([], engine="pandas")
+
+
+class TestMetricsAccumulator(unittest.TestCase):
+    """Accumulators built separately and merged match one pass over every ticket."""
+
+    def test_merged_chunks_match_single_pass(self):
+        now = datetime(2026, 1, 1)
+        for filename, config in (("Jira.csv", _jira_config()), ("servicenow.csv", _servicenow_config())):
+            tickets = _parse_csv(str(HERE / filename), config)
+            expected = compute_dashboard_data(tickets, now=now, config=config)
+            merged = MetricsAccumulator(config)
+            for start in range(0, len(tickets), 7):
+                chunk = MetricsAccumulator(config)
+                for t in tickets[start:start + 7]:
+                    chunk.add(t)
+                merged.merge(chunk)
+            self.assertEqual(_accumulated_metrics(merged.finalize(now)), _accumulated_metrics(expected))
+
+    def test_means_merge_as_sums(self):
+        def closed(key, days):
+            t = JiraTicket(key=key, status="Done", issue_type="Bug", created=datetime(2024, 1, 1))
+            t.resolved = t.created + timedelta(days=days)
+            return t
+
+        first, second = MetricsAccumulator(), MetricsAccumulator()
+        first.add(closed("A-1", 10))
+        second.update([closed("B-1", 2), closed("B-2", 2), closed("B-3", 2)])
+        first.merge(second)
+        data = first.finalize(datetime(2024, 6, 1))
+        # The mean over all four tickets, not the mean of the two means (6.0)
+        self.assertEqual(data.avg_resolution_days, 4.0)
+        self.assertEqual(data.avg_resolution_by_type, {"Bug": 4.0})
+        self.assertEqual(data.total_tickets, 4)
+
+    def test_finalize_keeps_accumulating(self):
+        acc = MetricsAccumulator()
+        acc.add(JiraTicket(key="A-1", status="Open", created=datetime(2024, 6, 1)))
+        early = acc.finalize(datetime(2024, 6, 5), stale_days=14)
+        late = acc.finalize(datetime(2024, 7, 1), stale_days=14)
+        self.assertEqual((early.stale_tickets, late.stale_tickets), (0, 1))
+        self.assertEqual(early.oldest_open[0]["age_days"], 4.0)
+        acc.add(JiraTicket(key="A-2", status="Done"))
+        self.assertEqual(acc.finalize(datetime(2024, 7, 1)).total_tickets, 2)
+
+    def test_merge_rejects_other_source(self):
+        with self.assertRaises(ValueError):
+            MetricsAccumulator(_jira_config()).merge(MetricsAccumulator(_servicenow_config()))
+
+
+class TestPartialAggregates(unittest.TestCase):
+    """``--partial`` files carry the metrics between machines for ``merge``."""
+
+    def test_round_trip_matches_direct_metrics(self):
+        now = datetime(2026, 1, 1)
+        for filename, config in (("Jira.csv", _jira_config()), ("servicenow.csv", _servicenow_config())):
+            metrics = MetricsAccumulator(config)
+            metrics.update(_parse_csv(str(HERE / filename), config))
+            with tempfile.TemporaryDirectory() as td:
+                path = Path(td) / "part.jdp"
+                _write_partial(path, metrics, now, 14, "Title", filename)
+                partial = _read_partial(path)
+            self.assertEqual((partial.as_of, partial.stale_days, partial.source_file), (now, 14, filename))
+            merged = MetricsAccumulator(config)
+            merged.merge(partial.metrics)
+            self.assertEqual(_accumulated_metrics(merged.finalize(now)), _accumulated_metrics(metrics.finalize(now)))
+
+    def test_size_follows_groups_not_tickets(self):
+        metrics = MetricsAccumulator()
+        metrics.update(JiraTicket(key=f"A-{i}", status="Open", assignee="Alice", summary="Secret",
+                                  created=datetime(2024, 1, 1) + timedelta(hours=i))
+                       for i in range(500))
+        state = metrics.to_partial(datetime(2024, 6, 1), 14)
+        self.assertEqual(state["totals"]["stale_tickets"], 500)
+        self.assertEqual(len(state["oldest_open"]), 10)
+        self.assertEqual(state["oldest_open"][0]["key"], "A-0")
+        self.assertLessEqual(len(state["staleness_rows"]), 50)
+
+    def test_rejects_other_versions(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "part.jdp"
+            _write_partial(path, MetricsAccumulator(), datetime(2026, 1, 1), 14, "Title", "x.csv")
+            payload = json.loads(gzip.decompress(path.read_bytes()))
+            payload["version"] += 1
+            path.write_bytes(gzip.compress(json.dumps(payload).encode("utf-8")))
+            with self.assertRaises(ValueError):
+                _read_partial(path)
+            path.write_text("Key,Summary\n")
+            with self.assertRaises(ValueError):
+                _read_partial(path)
+
+    def test_merge_subcommand(self):
+        csv_path = str(HERE / "servicenow.csv")
+        with tempfile.TemporaryDirectory() as td:
+            a, b, c, out = (os.path.join(td, name) for name in ("a.jdp", "b.jdp", "c.jdp", "out.html"))
+            self.assertEqual(main([csv_path, "--partial", a]), 0)
+            self.assertEqual(main([csv_path, "--partial", b]), 0)
+            self.assertEqual(main(["merge", a, b, "-o", out]), 0)
+            html_content = Path(out).read_text()
+            self.assertIn("SLA Compliance", html_content)
+            self.assertIn("servicenow.csv + 1 more", html_content)
+            self.assertEqual(main([csv_path, "--partial", c, "--stale-days", "7"]), 0)
+            self.assertEqual(main(["merge", a, c, "-o", out]), 1)
+
+    def test_partial_folds_tickets_as_they_are_parsed(self):
+        csv_path = HERE / "Jira.csv"
+        with tempfile.TemporaryDirectory() as td:
+            path = os.path.join(td, "part.jdp")
+            with mock.patch.object(TicketFrame, "from_tickets", side_effect=AssertionError), \
+                    contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(main([str(csv_path), "--partial", path]), 0)
+            partial = _read_partial(Path(path))
+        self.assertEqual(partial.title, "IMPS Dashboard")
+        metrics = MetricsAccumulator()
+        metrics.update(_parse_csv(str(csv_path), _jira_config()))
+        self.assertEqual(_accumulated_metrics(partial.metrics.finalize(partial.as_of)),
+                         _accumulated_metrics(metrics.finalize(partial.as_of)))
+
+    def test_export_named_merge_is_not_the_subcommand(self):
+        with tempfile.TemporaryDirectory() as td:
+            (Path(td) / "merge").write_bytes((HERE / "servicenow.csv").read_bytes())
+            out = os.path.join(td, "out.html")
+            cwd = os.getcwd()
+            os.chdir(td)
+            try:
+                self.assertEqual(main(["merge", "-o", out]), 0)
+            finally:
+                os.chdir(cwd)
+            self.assertIn("SLA Compliance", Path(out).read_text())
+
+
+class TestParallelParsing(unittest.TestCase):
+    """``--workers`` must produce exactly the serial parse."""
+
+    def _write_export(self, td, stray_quote=False):
+        path = os.path.join(td, "export.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Issue key", "Summary", "Status", "Created", "Description"])
+            for i in range(200):
+                summary = f'Monitor {i} 5" screen' if stray_quote and i == 3 else f"Ticket {i}"
+                description = f'Line one\nsaid "hi", then\n\nline {i}' if i % 3 else "plain"
+                writer.writerow([f"PAR-{i}", summary, "Open" if i % 2 else "Done",
+                                 f"2024-01-{i % 28 + 1:02d} 10:00", description])
+        if stray_quote:
+            # csv.writer quotes the stray quote; write it bare like a sloppy exporter
+            text = Path(path).read_text(encoding="utf-8").replace('"Monitor 3 5"" screen"', 'Monitor 3 5" screen')
+            Path(path).write_text(text, encoding="utf-8", newline="")
+        return path
+
+    def test_boundaries_fall_between_records(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(self._write_export(td))
+            data = path.read_bytes()
+            with mock.patch.object(jira_dashboard, "_MIN_CHUNK_BYTES", 256):
+                bounds = _record_boundaries(path, 0, len(data), 8)
+            self.assertGreater(len(bounds), 3)
+            chunked = []
+            for a, b in zip(bounds, bounds[1:]):
+                chunked.extend(csv.reader(io.StringIO(data[a:b].decode("utf-8"), newline="")))
+            self.assertEqual(chunked, list(csv.reader(io.StringIO(data.decode("utf-8"), newline=""))))
+
+    def _check_matches_serial(self, stray_quote):
+        with tempfile.TemporaryDirectory() as td:
+            path = self._write_export(td, stray_quote)
+            serial = _parse_csv(path, _jira_config())
+            with mock.patch.object(jira_dashboard, "_MIN_CHUNK_BYTES", 256):
+                parallel = _parse_csv(path, _jira_config(), workers=2)
+            self.assertEqual(len(parallel), 200)
+            self.assertEqual(parallel, serial)
+
+    def test_workers_match_serial(self):
+        self._check_matches_serial(stray_quote=False)
+
+    def test_stray_quote_falls_back_to_serial(self):
+        self._check_matches_serial(stray_quote=True)
+
+
+class TestMultipleInputs(unittest.TestCase):
+    """Several exports (files or globs) merged into one dashboard."""
+
+    HEADER = ["Issue key", "Summary", "Status", "Updated"]
+
+    def _write(self, td, name, rows):
+        path = os.path.join(td, name)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.HEADER)
+            writer.writerows(rows)
+        return path
+
+    def test_dedupe_latest_updated_wins(self):
+        old = JiraTicket(key="M-1", status="Open", updated=datetime(2024, 1, 2))
+        new = JiraTicket(key="M-1", status="Done", updated=datetime(2024, 3, 1))
+        stale = JiraTicket(key="M-1", status="Open", updated=datetime(2024, 2, 1))
+        other = JiraTicket(key="M-2")
+        tickets, dropped = _dedupe_tickets([old, other, new, stale, JiraTicket(), JiraTicket()])
+        self.assertEqual([t.status for t in tickets[:2]], ["Done", ""])
+        self.assertEqual(len(tickets), 4)
+        self.assertEqual(dropped, 2)
+
+    def test_glob_inputs_natural_order(self):
+        with tempfile.TemporaryDirectory() as td:
+            for n in (10, 2, 1):
+                self._write(td, f"export-{n}.csv", [])
+            paths, missing = _expand_inputs([os.path.join(td, "export-*.csv"), "nope-*.csv"])
+            self.assertEqual([p.name for p in paths], ["export-1.csv", "export-2.csv", "export-10.csv"])
+            self.assertEqual(missing, ["nope-*.csv"])
+
+    def test_main_merges_exports(self):
+        with tempfile.TemporaryDirectory() as td:
+            self._write(td, "export-1.csv", [["M-1", "First", "Open", "2024-01-02"],
+                                             ["M-2", "Second", "Open", "2024-01-02"]])
+            self._write(td, "export-2.csv", [["M-1", "First", "Done", "2024-02-01"],
+                                             ["M-3", "Third", "Open", "2024-01-05"]])
+            out = os.path.join(td, "out.html")
+            result = main(["-o", out, "--workers", "2", os.path.join(td, "export-*.csv")])
+            self.assertEqual(result, 0)
+            html_content = Path(out).read_text()
+            self.assertIn("export-1.csv + 1 more", html_content)
+            self.assertEqual(html_content.count('"Issue key": "M-1"'), 1)
+            self.assertIn('"Status": "Done"', html_content)
+
+    def test_each_export_is_parsed_once(self):
+        with tempfile.TemporaryDirectory() as td:
+            paths = [Path(self._write(td, f"export-{n}.csv", [[f"M-{n}", "Ticket", "Open", "2024-01-02"]]))
+                     for n in (1, 2)]
+            with mock.patch.object(jira_dashboard, "IngestSession", wraps=IngestSession) as session:
+                config, tickets = _ingest_files(paths, None, 1)
+            self.assertEqual(config.name, "jira")
+            self.assertEqual([t.key for t in tickets], ["M-1", "M-2"])
+            # The source comes from the first header row, not a parse of its own
+            self.assertEqual([c.args[0] for c in session.call_args_list], paths)
+
+    def test_missing_columns_warned_per_export(self):
+        with tempfile.TemporaryDirectory() as td:
+            self._write(td, "export-1.csv", [["M-1", "First", "Open", "2024-01-02"]])
+            self._write(td, "export-2.csv", [["M-2", "Second", "Open", "2024-01-02"]])
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                self.assertEqual(main(["-o", os.path.join(td, "out.html"), "--workers", "2",
+                                       "--columns", "Issue key,Nope", os.path.join(td, "export-*.csv")]), 0)
+            for name in ("export-1.csv", "export-2.csv"):
+                self.assertIn(f"--columns not found in {name}: Nope", stderr.getvalue())
+
+    def test_mixed_sources_rejected(self):
+        with tempfile.TemporaryDirectory() as td:
+            archive = os.path.join(td, "exports.zip")
+            with zipfile.ZipFile(archive, "w") as zf:
+                zf.write(HERE / "Jira.csv", "Jira.csv")
+                zf.write(HERE / "servicenow.csv", "servicenow.csv")
+            out = os.path.join(td, "out.html")
+            stderr = io.StringIO()
+            with mock.patch("sys.stderr", stderr):
+                self.assertEqual(main(["-o", out, "--workers", "1", archive]), 1)
+            self.assertIn("ServiceNow", stderr.getvalue())
+            self.assertFalse(os.path.exists(out))
+            # An explicit --source reads them all as that format
+            self.assertEqual(main(["-o", out, "--workers", "1", "--source", "jira", archive]), 0)
+
+
+class TestCompressedInput(unittest.TestCase):
+    """Compressed exports are read by magic bytes, without a temp file."""
+
+    def test_compressed_formats_parse_like_plain(self):
+        data = (HERE / "servicenow.csv").read_bytes()
+        with IngestSession(HERE / "servicenow.csv") as session:
+            expected = list(session.tickets())
+        with tempfile.TemporaryDirectory() as td:
+            # Extensions deliberately don't match the content
+            Path(td, "a.csv").write_bytes(gzip.compress(data))
+            Path(td, "b.csv").write_bytes(bz2.compress(data))
+            Path(td, "c.dat").write_bytes(lzma.compress(data))
+            with zipfile.ZipFile(Path(td, "d.bin"), "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr("export/sn.csv", data)
+            for name in ("a.csv", "b.csv", "c.dat", "d.bin"):
+                with IngestSession(Path(td, name)) as session:
+                    self.assertEqual(session.config.name, "servicenow")
+                    self.assertEqual(list(session.tickets()), expected, name)
+
+    def test_zip_members_are_separate_inputs(self):
+        with tempfile.TemporaryDirectory() as td:
+            archive_path = os.path.join(td, "exports.zip")
+            with zipfile.ZipFile(archive_path, "w") as archive:
+                archive.writestr("export-10.csv", "Issue key,Summary,Status,Updated\n"
+                                                  "M-1,First,Done,2024-02-01\n")
+                archive.writestr("export-2.csv", "Issue key,Summary,Status,Updated\n"
+                                                 "M-1,First,Open,2024-01-02\nM-2,Second,Open,2024-01-02\n")
+                archive.writestr("README.txt", "not an export")
+            inputs, missing = _expand_inputs([archive_path])
+            self.assertEqual([str(i) for i in inputs], [f"{archive_path}:export-2.csv",
+                                                        f"{archive_path}:export-10.csv"])
+            self.assertEqual(missing, [])
+            with self.assertRaises(ValueError):
+                IngestSession(archive_path)
+
+            out = os.path.join(td, "out.html")
+            self.assertEqual(main(["-o", out, "--workers", "1", archive_path]), 0)
+            html_content = Path(out).read_text()
+            self.assertIn("export-2.csv + 1 more", html_content)
+            self.assertEqual(html_content.count('"Issue key": "M-1"'), 1)
+            self.assertIn('"Status": "Done"', html_content)
+
+
+    def test_zip_without_csv_files(self):
+        with tempfile.TemporaryDirectory() as td:
+            archive_path = os.path.join(td, "exports.zip")
+            with zipfile.ZipFile(archive_path, "w") as archive:
+                archive.writestr("README.txt", "not an export")
+            with self.assertRaisesRegex(ValueError, "archive contains no .csv files"):
+                _expand_inputs([archive_path])
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                self.assertEqual(main(["-o", os.path.join(td, "out.html"), archive_path]), 1)
+            self.assertIn(f"{archive_path}: archive contains no .csv files", stderr.getvalue())
+            self.assertNotIn("File not found", stderr.getvalue())
+
+
+class TestStreamInput(unittest.TestCase):
+    """Standard input and named pipes are read once, straight from the stream."""
+
+    def test_stdin_dash(self):
+        data = (HERE / "Jira.csv").read_bytes()
+        with IngestSession(HERE / "Jira.csv") as session:
+            expected = list(session.tickets())
+        self.assertEqual(_expand_inputs(["-", "-"]), ([_STDIN], []))
+        for payload in (data, gzip.compress(data)):
+            stdin = io.TextIOWrapper(io.BytesIO(payload))
+            with mock.patch("sys.stdin", stdin):
+                with IngestSession(_STDIN) as session:
+                    self.assertEqual(session.config.name, "jira")
+                    self.assertEqual(list(session.tickets()), expected)
+            # Closing the session leaves stdin usable
+            self.assertFalse(stdin.closed)
+            self.assertEqual(stdin.buffer.read(), b"")
+        with tempfile.TemporaryDirectory() as td:
+            out = os.path.join(td, "out.html")
+            with mock.patch("sys.stdin", io.TextIOWrapper(io.BytesIO(gzip.compress(data)))):
+                self.assertEqual(main(["-o", out, "--cache", os.path.join(td, "cache"), "-"]), 0)
+            self.assertIn("&lt;stdin&gt;", Path(out).read_text())
+            self.assertFalse(os.path.exists(os.path.join(td, "cache")))
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "named pipes need os.mkfifo")
+    def test_named_pipe_detects_source_from_one_read(self):
+        data = (HERE / "servicenow.csv").read_bytes()
+        with tempfile.TemporaryDirectory() as td:
+            fifo = Path(td, "export.csv")
+            os.mkfifo(fifo)
+            # The writer can only deliver the export once
+            writer = threading.Thread(target=fifo.write_bytes, args=(data,))
+            writer.start()
+            try:
+                config, tickets = _ingest_files([fifo, HERE / "servicenow.csv"], None, 1)
+            finally:
+                writer.join(5)
+        self.assertEqual(config.name, "servicenow")
+        self.assertEqual([t.key for t in tickets], ["INC0149495", "INC0149622"])
+
+
+class TestMappedInput(unittest.TestCase):
+    """Plain files are parsed from an mmap, leaving long cells in the file."""
+
+    def test_large_cells_decoded_on_access(self):
+        with tempfile.TemporaryDirectory() as td:
+            streamed_path = Path(td, "jira.csv.gz")
+            streamed_path.write_bytes(gzip.compress((HERE / "Jira.csv").read_bytes()))
+            with IngestSession(streamed_path) as session:
+                self.assertIsNone(session.mapped)
+                streamed = list(session.tickets())
+        with IngestSession(HERE / "Jira.csv") as session:
+            self.assertIsNotNone(session.mapped)
+            mapped = list(session.tickets())
+
+        self.assertEqual(mapped, streamed)
+        lazy = [t.raw_fields for t in mapped if type(t.raw_fields) is _MappedRawFields]
+        self.assertTrue(lazy)
+        for raw in lazy:
+            self.assertIn(None, raw._row)
+            self.assertTrue(all(cell is None or len(cell) < _LAZY_TEXT_CHARS for cell in raw._row))
+        for t, s in zip(mapped, streamed):
+            self.assertEqual(t.raw_fields.to_dict(), s.raw_fields.to_dict())
+            self.assertEqual(t.raw_fields.get("Description"), s.raw_fields.get("Description"))
+        self.assertEqual(pickle.loads(pickle.dumps(lazy[0])).to_dict(), lazy[0].to_dict())
+
+    def test_bare_cr_line_endings_are_streamed(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td, "mac.csv")
+            path.write_bytes(b"Issue key,Summary,Status\rCR-1,First,Open\rCR-2,Second,Done\r")
+            with IngestSession(path) as session:
+                self.assertIsNone(session.mapped)
+                self.assertEqual([t.key for t in session.tickets()], ["CR-1", "CR-2"])
+            # Not only on the header line
+            path.write_bytes(b"Issue key,Summary,Status\nCR-1,First,Open\rCR-2,Second,Done\n")
+            with IngestSession(path) as session:
+                self.assertIsNone(session.mapped)
+                self.assertEqual([t.key for t in session.tickets()], ["CR-1", "CR-2"])
+
+    def test_tail_rows_keep_their_cells(self):
+        long_text = "x" * _LAZY_TEXT_CHARS
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td, "export.csv")
+            path.write_bytes(f"Issue key,Description\nT-1,{long_text}\n".encode("utf-8"))
+            export = _MappedExport.open(path)
+            index = _HeaderIndex(["Issue key", "Description"])
+            rows = list(export.rows(export.start, len(export.mm), [f"T-2,{long_text}\n"]))
+            self.assertEqual([row.source for row in rows[1:]], [export, None])
+            raws = [_raw_fields(index, row) for row in rows[1:]]
+            self.assertEqual([raw.get("Description") for raw in raws], [long_text, long_text])
+            del raws, rows
+            export.close()
+
+    def test_tickets_keep_the_full_comment_text(self):
+        comment = "word " * 60
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td, "export.csv")
+            path.write_text(f'Issue key,Status,Comment\nT-1,Open,"15/Jan/24 09:30 AM;jdoe;{comment}"\n')
+            with IngestSession(path) as session:
+                t = next(session.tickets())
+                self.assertEqual(t.last_comment_text, comment.strip())
+                self.assertIn(comment, t.raw_fields["Comment"])
+                preview = compute_dashboard_data([t]).staleness_rows[0]["comment_preview"]
+                self.assertEqual(preview, comment[:_PREVIEW_CHARS] + "…")
+
+    def test_missing_and_short_cells_use_the_default(self):
+        long_text = "x" * _LAZY_TEXT_CHARS
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td, "export.csv")
+            path.write_bytes(f"Issue key,Description,Labels\nT-1,{long_text}\n".encode("utf-8"))
+            with IngestSession(path) as session:
+                raw = next(session.tickets()).raw_fields
+                self.assertIs(type(raw), _MappedRawFields)
+                self.assertIsNone(raw.get("No such column"))
+                self.assertEqual(raw.get("No such column", "-"), "-")
+                self.assertIsNone(raw.get("Labels"))
+                self.assertEqual(raw.get("Labels", "-"), "-")
+                self.assertEqual(raw.get("Description"), long_text)
+                with self.assertRaises(KeyError):
+                    raw["No such column"]
+                with self.assertRaises(KeyError):
+                    raw["Labels"]
+
+    def test_session_close_unmaps_the_export(self):
+        long_text = "x" * _LAZY_TEXT_CHARS
+        with tempfile.TemporaryDirectory() as td:
+            paths = [Path(td, f"export{i}.csv") for i in range(_MAX_OPEN_MAPS + 2)]
+            tickets = []
+            for path in paths:
+                path.write_bytes(f"Issue key,Description\n{path.stem},{long_text}\n".encode("utf-8"))
+                with IngestSession(path) as session:
+                    tickets.extend(session.tickets())
+                    export = session.mapped
+                self.assertIsNone(export.mm)
+            # Large cells map their export again, keeping only a few maps open
+            for t, path in zip(tickets, paths):
+                self.assertEqual(t.raw_fields["Description"], long_text)
+                self.assertLessEqual(len(_OPEN_MAPS), _MAX_OPEN_MAPS)
+            # A file changed since it was read is not silently re-read
+            paths[0].write_bytes(b"Issue key,Description\nchanged,\n")
+            with self.assertRaises(OSError):
+                tickets[0].raw_fields["Description"]
+            for export in list(_OPEN_MAPS):
+                export.close()
+
+
+class TestColumnProjection(unittest.TestCase):
+    """``--columns`` trims the raw rows without changing any metric."""
+
+    def test_auto_keeps_mapped_and_displayed_columns(self):
+        with IngestSession(HERE / "Jira.csv") as session:
+            full = list(session.tickets())
+        with IngestSession(HERE / "Jira.csv", columns="auto") as session:
+            mapped = {session.headers[i] for indices in session.lookup.values() for i in indices}
+            projected = list(session.tickets())
+        headers = list(full[0].raw_fields)
+        kept = list(projected[0].raw_fields)
+        self.assertEqual(kept[:_TABLE_COLUMNS], headers[:_TABLE_COLUMNS])
+        self.assertTrue(mapped <= set(kept))
+        self.assertLess(len(kept), len(headers))
+        for t, p in zip(full, projected):
+            self.assertEqual({h: t.raw_fields[h] for h in kept}, p.raw_fields.to_dict())
+            self.assertEqual(dataclasses.replace(t, raw_fields={}), dataclasses.replace(p, raw_fields={}))
+
+        now = datetime(2026, 1, 1)
+        a = compute_dashboard_data(full, now=now)
+        b = compute_dashboard_data(projected, now=now)
+        self.assertEqual(b.all_headers, kept)
+        a.all_headers, a.all_tickets_json, b.all_headers, b.all_tickets_json = [], "", [], ""
+        self.assertEqual(a, b)
+
+    def test_dashboard_without_a_frame(self):
+        with tempfile.TemporaryDirectory() as td:
+            framed, streamed = os.path.join(td, "framed.html"), os.path.join(td, "streamed.html")
+            with contextlib.redirect_stdout(io.StringIO()):
+                # The cache stores frames
+                self.assertEqual(main([str(HERE / "Jira.csv"), "--columns", "auto", "-o", framed,
+                                       "--cache", os.path.join(td, "cache")]), 0)
+                with mock.patch.object(TicketFrame, "from_tickets", side_effect=AssertionError):
+                    self.assertEqual(main([str(HERE / "Jira.csv"), "--columns", "auto", "-o", streamed]), 0)
+            generated = re.compile(r"Generated: \d{4}-\d\d-\d\d \d\d:\d\d")
+            self.assertEqual(generated.sub("", Path(streamed).read_text()),
+                             generated.sub("", Path(framed).read_text()))
+
+    def test_named_columns_and_cache_key(self):
+        with tempfile.TemporaryDirectory() as td:
+            export = Path(td) / "sn.csv"
+            export.write_bytes((HERE / "servicenow.csv").read_bytes())
+            out = os.path.join(td, "out.html")
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                self.assertEqual(main(["-o", out, "--cache", os.path.join(td, "cache"),
+                                       "--columns", "number, STATE,Nope", str(export)]), 0)
+            self.assertIn("Nope", stderr.getvalue())
+            self.assertIn('const allHeaders = ["number", "state"];', Path(out).read_text())
+            # The warm run reads the missing names from the entry
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr), \
+                    mock.patch.object(jira_dashboard, "IngestSession", side_effect=AssertionError):
+                self.assertEqual(main(["-o", out, "--cache", os.path.join(td, "cache"),
+                                       "--columns", "number, STATE,Nope", str(export)]), 0)
+            self.assertIn("--columns not found in sn.csv: Nope", stderr.getvalue())
+
+            # Each projection has its own entry, and projected entries refresh
+            cache = _ParseCache(Path(td) / "cache", ["number", " STATE", "Nope"])
+            self.assertIsNotNone(cache.load(export, "auto"))
+            self.assertIsNone(_ParseCache(Path(td) / "cache").load(export, "auto"))
+            with export.open("a", encoding="utf-8") as f:
+                f.write("\nINC9999999,,New row\n")
+            refreshed = cache.refresh(export, "auto")
+            self.assertEqual(refreshed[-1].raw_fields.to_dict(), {"number": "INC9999999"})
+
+
+class TestParseCache(unittest.TestCase):
+    """The on-disk parse cache must round-trip frames and notice changes."""
+
+    def test_round_trip_and_staleness(self):
+        with tempfile.TemporaryDirectory() as td:
+            export = Path(td) / "sn.csv"
+            export.write_bytes((HERE / "servicenow.csv").read_bytes())
+            cache = _ParseCache(Path(td) / "cache")
+            self.assertIsNone(cache.load(export, "auto"))
+
+            with IngestSession(export) as session:
+                frame = session.frame()
+            self.assertTrue(cache.store(export, "auto", frame, export.stat()))
+            loaded = cache.load(export, "auto")
+            self.assertEqual(loaded.config.name, "servicenow")
+            self.assertEqual(list(loaded), list(frame))
+            now = datetime(2026, 1, 1)
+            self.assertEqual(json.dumps(dataclasses.asdict(compute_dashboard_data(loaded, now=now))),
+                             json.dumps(dataclasses.asdict(compute_dashboard_data(frame, now=now))))
+            # Other source selections have their own entries
+            self.assertIsNone(cache.load(export, "servicenow"))
+
+            # Same bytes, new mtime: the content digest still matches
+            os.utime(export, ns=(0, 0))
+            self.assertIsNotNone(cache.load(export, "auto"))
+            # Changed content of the same size misses
+            data = export.read_bytes()
+            export.write_bytes(data.replace(b"INC", b"INX", 1))
+            self.assertIsNone(cache.load(export, "auto"))
+
+    def test_refresh_reuses_unchanged_rows(self):
+        with tempfile.TemporaryDirectory() as td:
+            export = Path(td) / "jira.csv"
+            with (HERE / "Jira.csv").open(newline="", encoding="utf-8-sig") as f:
+                rows = list(csv.reader(f))
+
+            def write(body):
+                with export.open("w", newline="", encoding="utf-8") as f:
+                    csv.writer(f).writerows([rows[0]] + body)
+
+            write(rows[1:40])
+            cache = _ParseCache(Path(td) / "cache")
+            self.assertIsNone(cache.refresh(export, "auto"))
+            with IngestSession(export) as session:
+                cache.store(export, "auto", session.frame(), export.stat())
+
+            # One row edited in place, one removed, and new rows appended
+            edited = [list(r) for r in rows[1:40]]
+            edited[5][rows[0].index("Summary")] = "Edited summary"
+            del edited[10]
+            write(edited + rows[40:60])
+            patched = cache.refresh(export, "auto")
+            self.assertEqual(patched.reused, 37)
+            with IngestSession(export) as session:
+                full = session.frame()
+            self.assertEqual(list(patched), list(full))
+            now = datetime(2026, 1, 1)
+            self.assertEqual(json.dumps(dataclasses.asdict(compute_dashboard_data(patched, now=now))),
+                             json.dumps(dataclasses.asdict(compute_dashboard_data(full, now=now))))
+            # The patched frame replaced the entry
+            self.assertEqual(list(cache.load(export, "auto")), list(full))
+
+            # A different header row needs a full parse
+            rows[0][rows[0].index("Summary")] = "Title"
+            write(edited)
+            self.assertIsNone(cache.refresh(export, "auto"))
+
+    def test_rows_projected_to_no_cells(self):
+        with tempfile.TemporaryDirectory() as td:
+            export = Path(td) / "sn.csv"
+            export.write_bytes((HERE / "servicenow.csv").read_bytes())
+            cache = _ParseCache(Path(td) / "cache", ["Nope"])
+            with IngestSession(export, columns=["Nope"]) as session:
+                frame = session.frame()
+            self.assertEqual(frame.raw_fields[0].cells(), [])
+            self.assertTrue(cache.store(export, "auto", frame, export.stat()))
+            loaded = cache.load(export, "auto")
+            self.assertEqual([raw.cells() for raw in loaded.raw_fields], [[]] * len(frame))
+            self.assertEqual(loaded.missing_columns, ["Nope"])
+
+    def test_several_inputs_warn(self):
+        with tempfile.TemporaryDirectory() as td:
+            exports = [Path(td) / "a.csv", Path(td) / "b.csv"]
+            for export in exports:
+                export.write_bytes((HERE / "servicenow.csv").read_bytes())
+            out = os.path.join(td, "out.html")
+            stderr = io.StringIO()
+            with contextlib.redirect_stderr(stderr):
+                self.assertEqual(main(["-o", out, "--workers", "1", "--cache", os.path.join(td, "cache")]
+                                      + [str(export) for export in exports]), 0)
+            self.assertIn("--cache is only used for a single input file", stderr.getvalue())
+            self.assertFalse(os.path.exists(os.path.join(td, "cache")))
+
+    def test_warm_run_skips_parsing(self):
+        with tempfile.TemporaryDirectory() as td:
+            out1, out2 = os.path.join(td, "1.html"), os.path.join(td, "2.html")
+            args = ["--cache", os.path.join(td, "cache"), str(HERE / "Jira.csv")]
+            self.assertEqual(main(["-o", out1] + args), 0)
+            with mock.patch.object(jira_dashboard, "IngestSession", side_effect=AssertionError):
+                self.assertEqual(main(["-o", out2] + args), 0)
+            strip = lambda text: re.sub(r"Generated: [^&]*", "", text)
+            self.assertEqual(strip(Path(out1).read_text()), strip(Path(out2).read_text()))
+
+
 class TestServiceNowEndToEnd(unittest.TestCase):
     """End-to-end test for ServiceNow CSV pipeline."""
 
@@ -1354,6 +2467,24 @@ class TestServiceNowEndToEnd(unittest.TestCase):
             html_content = Path(output_path).read_text()
             self.assertIn("SLA Compliance", html_content)
 
+    def test_ingest_session_single_read(self):
+        with tempfile.TemporaryDirectory() as td:
+            csv_path = os.path.join(td, "session.csv")
+            with open(csv_path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["Number", "Short description", "State",
+                                 "Opened at", "Assignment group", "Made SLA"])
+                writer.writerow(["INC0001", "Session test", "New",
+                                 "2024-01-15", "Help Desk", "true"])
+            with mock.patch.object(Path, "open", autospec=True, side_effect=Path.open) as opener:
+                with jira_dashboard.IngestSession(csv_path) as session:
+                    self.assertTrue(session.detected)
+                    self.assertEqual(session.config.name, "servicenow")
+                    tickets = list(session.tickets())
+                self.assertEqual(opener.call_count, 1)
+            self.assertEqual([t.key for t in tickets], ["INC0001"])
+            self.assertEqual(session.first_raw_row[0], "INC0001")
+
     def test_sn_auto_title(self):
         from jira_dashboard import _auto_title
         config = _servicenow_config()